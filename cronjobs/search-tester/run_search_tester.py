@@ -13,6 +13,7 @@
 # limitations under the License.
 """This module holds all of the basic data about the auto analyzer uat testing."""
 import csv
+import json
 import os
 import re
 from datetime import datetime
@@ -20,11 +21,15 @@ from typing import List
 
 from flask import Flask
 from ppr_api.exceptions import BusinessException
-from ppr_api.models import db, Registration, SearchRequest, TestSearch, TestSearchBatch, TestSearchResult
+from ppr_api.models import db, Registration, SearchRequest
+from ppr_api.models.test_search import TestSearch
+from ppr_api.models.test_search_batch import TestSearchBatch
+from ppr_api.models.test_search_result import TestSearchResult
 
 from search_tester import create_app
 from search_tester.utils.db_utils import QUERY_LEGACY_RESULTS_DATE, QUERY_LEGACY_RESULTS_DATE_TIME, QUERY_LEGACY_RESULTS_MOST_RECENT
 from search_tester.utils.helpers import TO_API_SEARCH_TYPE
+from search_tester.utils.perf_utils import get_request_json, run_search
 from search_tester.utils.logging import setup_logging
 
 
@@ -136,6 +141,40 @@ def get_batch_searches_table(app: Flask, batch_searches: dict):
     rows = results.fetchall()
     return parse_results(batch_searches, [r._asdict() for r in rows], True)
 
+def run_performance_batch(app: Flask, search_type: str, searches: dict) -> TestSearchBatch:
+    """Replay the search criteria for the search type: record run times, row counts, plans, and regressions."""
+    batch = TestSearchBatch()
+    batch.search_type = search_type
+    batch.test_date = datetime.utcnow()
+    batch.test_mode = TestSearchBatch.TestModes.PERFORMANCE.value
+    batch.baseline = app.config['PERF_BASELINE']
+    batch.sim_val_business = app.config['SIMILARITY_QUOTIENT_BUSINESS_NAME']
+    batch.sim_val_first_name = app.config['SIMILARITY_QUOTIENT_FIRST_NAME']
+    batch.sim_val_last_name = app.config['SIMILARITY_QUOTIENT_LAST_NAME']
+    batch.searches = []
+    for time in searches:
+        criteria = searches[time]['criteria']
+        request_json = get_request_json(search_type, criteria, TO_API_SEARCH_TYPE)
+        perf_result = run_search(search_type, request_json, app.config['PERF_REPEAT'], app.config['PERF_EXPLAIN'])
+        search = TestSearch()
+        search.search_criteria = str(criteria)
+        search.run_time = perf_result['run_time']
+        search.row_count = perf_result['row_count']
+        if perf_result.get('plans'):
+            search.query_plan = json.dumps(perf_result['plans'])
+        search.results = []
+        batch.searches.append(search)
+    batch.set_run_time_percentiles()
+    if not batch.baseline:
+        baseline = TestSearchBatch.find_baseline(search_type)
+        if batch.check_regression(baseline, app.config['PERF_REGRESSION_THRESHOLD']):
+            app.logger.warning(f'Search type {search_type} p95 run time {batch.run_time_p95} regressed from '
+                               f'baseline {baseline.id} p95 run time {baseline.run_time_p95}.')
+    app.logger.info(f'Search type {search_type} {len(batch.searches)} searches run time p50={batch.run_time_p50} '
+                    f'p95={batch.run_time_p95} p99={batch.run_time_p99}')
+    return batch
+
+
 if __name__ == '__main__':
     try:
         app = create_app()
@@ -165,6 +204,10 @@ if __name__ == '__main__':
                     if not batch_searches[search_type]:
                         # only do search batches for search types we got legacy data for
                         continue
+                    if app.config['PERFORMANCE']:
+                        run_performance_batch(app, search_type, batch_searches[search_type]).save()
+                        completed += 1
+                        continue
                     # init new batch
                     batch = TestSearchBatch()
                     batch.search_type = search_type
@@ -68,6 +68,17 @@ class _Config():  # pylint: disable=too-few-public-methods
     SEARCH_DATE = os.getenv('SEARCH_DATE', None)
     SEARCH_TIME = os.getenv('SEARCH_TIME', None)
 
+    # Performance mode: replay the search criteria corpus timing each search path and capturing the query plans.
+    PERFORMANCE = bool(os.getenv('PERFORMANCE', None) == 'yes')
+    # Number of times each search is run: the median run time is recorded.
+    PERF_REPEAT = int(os.getenv('PERF_REPEAT', '3'))
+    # Set to yes to record the EXPLAIN (ANALYZE, BUFFERS) plans of each search.
+    PERF_EXPLAIN = bool(os.getenv('PERF_EXPLAIN', 'yes') == 'yes')
+    # Set to yes to store this run as the baseline the following runs are compared to.
+    PERF_BASELINE = bool(os.getenv('PERF_BASELINE', None) == 'yes')
+    # Flag a regression when the batch p95 run time exceeds the baseline p95 by more than this fraction.
+    PERF_REGRESSION_THRESHOLD = float(os.getenv('PERF_REGRESSION_THRESHOLD', '0.2'))
+
     SIMILARITY_QUOTIENT_BUSINESS_NAME = os.getenv('SIMILARITY_QUOTIENT_BUSINESS_NAME', '0.8')
     SIMILARITY_QUOTIENT_FIRST_NAME = os.getenv('SIMILARITY_QUOTIENT_FIRST_NAME', '0.23')
     SIMILARITY_QUOTIENT_LAST_NAME = os.getenv('SIMILARITY_QUOTIENT_LAST_NAME', '0.29')
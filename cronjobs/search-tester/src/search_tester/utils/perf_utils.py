@@ -0,0 +1,106 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Performance mode helpers: time the search paths and capture the query plans."""
+import json
+import re
+import time
+from contextlib import contextmanager
+from typing import List
+
+from ppr_api.models import db, SearchRequest
+from ppr_api.models import search_utils
+from sqlalchemy import event
+
+
+EXPLAIN_PREFIX = 'EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) '
+# The SearchRequest method executing the search query by search type.
+SEARCH_METHODS = {
+    SearchRequest.SearchTypes.AIRCRAFT_AIRFRAME_DOT.value: 'search_by_serial_type',
+    SearchRequest.SearchTypes.BUSINESS_DEBTOR.value: 'search_by_business_name',
+    SearchRequest.SearchTypes.INDIVIDUAL_DEBTOR.value: 'search_by_individual_name',
+    SearchRequest.SearchTypes.MANUFACTURED_HOME_NUM.value: 'search_by_serial_type',
+    SearchRequest.SearchTypes.REGISTRATION_NUM.value: 'search_by_registration_number',
+    SearchRequest.SearchTypes.SERIAL_NUM.value: 'search_by_serial_type'
+}
+
+
+def get_request_json(search_type: str, criteria_value: str, to_api_type: dict) -> dict:
+    """Build the API search request from the corpus search type and criteria."""
+    criteria = {'value': criteria_value}
+    if search_type == SearchRequest.SearchTypes.INDIVIDUAL_DEBTOR.value:
+        # remove dbl spaces
+        name = re.sub(' +', ' ', criteria_value).split(' ')
+        criteria = {'debtorName': {'first': name[1] if len(name) > 1 else '', 'last': name[0]}}
+        if len(name) > 2:
+            criteria['debtorName']['middle'] = name[2]
+    elif search_type == SearchRequest.SearchTypes.BUSINESS_DEBTOR.value:
+        criteria = {'debtorName': {'business': criteria_value}}
+    return {'criteria': criteria, 'type': to_api_type[search_type]}
+
+
+@contextmanager
+def capture_statements(statements: List[tuple]):
+    """Collect the (statement, parameters) of every SELECT executed on the session engine."""
+    engine = db.session.get_bind()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+        if statement.lstrip().upper().startswith(('SELECT', 'WITH')):
+            statements.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def explain(statements: List[tuple]) -> List[dict]:
+    """Return the EXPLAIN (ANALYZE, BUFFERS) JSON plans for the captured statements."""
+    plans = []
+    connection = db.session.connection()
+    for statement, parameters in statements:
+        result = connection.exec_driver_sql(EXPLAIN_PREFIX + statement, parameters)
+        plan = result.scalar()
+        plans.append(json.loads(plan) if isinstance(plan, str) else plan)
+    return plans
+
+
+def run_search(search_type: str, request_json: dict, repeat: int, include_plan: bool) -> dict:
+    """Run the search path repeat times: return the median run time, row count, and optionally the query plans."""
+    query = SearchRequest.create_from_json(request_json, '0', 'search-tester')
+    if search_type == SearchRequest.SearchTypes.MANUFACTURED_HOME_NUM.value:
+        search_utils.format_mhr_number(query.request_json)
+    search_fn = getattr(query, SEARCH_METHODS[search_type])
+    run_times = []
+    statements = []
+    for index in range(max(repeat, 1)):
+        query.search_response = None
+        if index == 0 and include_plan:
+            with capture_statements(statements):
+                start = time.perf_counter()
+                search_fn()
+                run_times.append(time.perf_counter() - start)
+        else:
+            start = time.perf_counter()
+            search_fn()
+            run_times.append(time.perf_counter() - start)
+    run_times.sort()
+    result = {
+        'run_time': run_times[len(run_times) // 2],
+        'row_count': query.returned_results_size or 0,
+        'results': query.search_response or []
+    }
+    if include_plan and statements:
+        result['plans'] = explain(statements)
+    return result
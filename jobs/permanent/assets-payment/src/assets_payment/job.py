@@ -137,6 +137,13 @@ UPDATE mhr_registrations SET status_type = CAST(mhr_drafts.draft ->> 'status' AS
    AND mhr_registrations.registration_type IN ('MHREG', 'MHREG_CONVERSION')
    AND mhr_registrations.status_type = 'DRAFT'
 """
+MHR_SEARCH_REFRESH = """
+SELECT mhr_search_refresh(d.mhr_number)
+  FROM (SELECT DISTINCT mhr_number
+          FROM mhr_drafts
+         WHERE id IN ({draft_ids})
+           AND mhr_number IS NOT NULL) d
+"""
 MHR_UPDATE_DRAFT = """
 UPDATE mhr_drafts
    SET user_id = case when left(draft_number, 2) = 'PR' then user_id else null end,
@@ -232,6 +239,21 @@ def restore_mhr_status(db_conn: DbConnection, db_cursor: DbCursor, mhr_numbers:
         logger.error(error_message)
 
 
+def refresh_mhr_search(db_conn: DbConnection, db_cursor: DbCursor, draft_ids: str):
+    """Refresh the MHR search index records of the homes with a restored status."""
+    try:
+        if not db_conn or not db_cursor or not draft_ids:
+            return
+        sql_statement = MHR_SEARCH_REFRESH.format(draft_ids=draft_ids)
+        db_cursor.execute(sql_statement)
+        db_conn.commit()
+        logger.info(f"MHR search index refreshed for draft ID's {draft_ids}")
+    except Exception as err:
+        db_conn.rollback()
+        error_message = f"Error attempting refresh mhr search index {err}"
+        logger.error(error_message)
+
+
 def restore_mhr_draft(db_conn: DbConnection, db_cursor: DbCursor, draft_ids: str):
     """Revert MHR drafts in a payment pending state to the regular draft state."""
     try:
@@ -451,6 +473,7 @@ def cancel_mhr_expired(  # pylint: disable=too-many-locals
         status_data["mhr_numbers"] = mhr_numbers
         status_data["mhr_error_ids"] = error_draft_ids
         restore_mhr_status(db_conn, db_cursor, mhr_numbers, draft_ids)
+        refresh_mhr_search(db_conn, db_cursor, draft_ids)
         restore_mhr_draft(db_conn, db_cursor, draft_ids)
     except Exception as err:
         error_message = f"Error attempting to cancel MHR expired payments: {err}"
@@ -41,6 +41,10 @@ class Config(BaseConfig):
         GOOGLE_STORAGE_SERVICE_ACCOUNT = bytes(GOOGLE_STORAGE_SERVICE_ACCOUNT, 'utf-8')
     STORAGE_BUCKET_NAME = os.getenv('STORAGE_BUCKET_NAME')
     STORAGE_FILEPATH = os.getenv('STORAGE_FILEPATH')
+    # Optional directory for the CSV export temporary file: default system temp.
+    EXPORT_FILE_DIRECTORY = os.getenv('EXPORT_FILE_DIRECTORY') or None
+    # Log the CSV export progress every this many lines.
+    EXPORT_PROGRESS_LINES = int(os.getenv('EXPORT_PROGRESS_LINES', '100000'))
 
     APP_DB_USER = os.getenv('APP_DATABASE_USERNAME', '')
     APP_DB_PASSWORD = os.getenv('APP_DATABASE_PASSWORD', '')
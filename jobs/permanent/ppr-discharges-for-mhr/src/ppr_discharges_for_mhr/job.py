@@ -1,18 +1,19 @@
-import io
 import sys
+import tempfile
 from contextlib import suppress
 from http import HTTPStatus
-from typing import Final, Optional, Tuple
+from typing import BinaryIO, Final, Optional, Tuple
 
 import psycopg2
 import requests
 
 from .common.datetime import datetime
+from .services import csv_export as export_service
 from .services.job_tracking import JobStateEnum, JobTracker
 from .services.logging import logging
 from .services.notify import Notify
 from .services.secrets.google_secrets import GoogleSecretService
-from .services.storage import AbstractStorageService, GoogleCloudStorage, StorageDocumentTypes
+from .services.storage import AbstractStorageService, GoogleCloudStorage
 
 
 QUERY: Final ="""select r.registration_ts, r.base_reg_number, sc.mhr_number, sc.serial_number
@@ -34,26 +35,26 @@ JOB_NAME: Final = 'ppr_mhr_dissolutions'
 EMAIL_SUBJECT: Final = '[BC Registries and Online Services] CSV File GENERATED {0}'
 EMAIL_BODY: Final = '**Your csv file from PPR at the Business Registry has been generated.**\n\nTo access the file,.\n\n[[{0}]]({1})'
 
-def csv_export(db_conn: psycopg2.extensions.connection, query: str) -> Tuple[Optional[str], Optional[io.StringIO]]:
-    """Export a supplied query as CSV output and return a Tuple(error, Buffered StringIO)
+CONTENT_TYPE_CSV: Final = 'text/csv'
+
+
+def csv_export(db_conn: psycopg2.extensions.connection,
+               query: str,
+               output: BinaryIO,
+               progress_lines: int = export_service.DEFAULT_PROGRESS_LINES) -> Tuple[Optional[str], Optional[dict]]:
+    """Export a supplied query as CSV output and return a Tuple(error, export counters)
     
     Use postgres COPY command to export a SQL query as a CSV file.
-    Write the output to a IO Buffer and return that.
+    Stream the output to the binary file object, keeping memory use constant.
     """
     try:
-        db_cursor = db_conn.cursor()
-        sql_copy_str = f'COPY ({query}) TO STDOUT WITH CSV HEADER'
-        buffered_output = io.StringIO()
-        db_cursor.copy_expert(sql_copy_str, buffered_output)
-        return None, buffered_output
+        return None, export_service.csv_export(db_conn, query, output, progress_lines)
     except (psycopg2.Error, Exception) as err:
-        error_message = "Error: {err}, for query {query}".format(err=err, query=sql_copy_str)
+        error_message = "Error: {err}, for query {query}".format(err=err, query=query)
         logging.debug(error_message)
         return error_message, None
     finally:
-        # Clean up: Close the database cursor and connection
-        with suppress(Exception):
-            db_cursor.close()
+        # Clean up: Close the database connection
         with suppress(Exception):
             db_conn.close()
 
@@ -77,23 +78,26 @@ def job(config):
         query = QUERY.format(start_time=start, end_time=end)
         logging.info(f'Format query: {query}')
 
-        # Connect to the app database and do a CSV COPY of the query
-        db_conn = psycopg2.connect(dsn=config.APP_DATABASE_URI)
-        err, csv_buffer = csv_export(db_conn, query)
-        logging.info('Completed the CSV Extract')
-
         # setup the filename to store the CSV file
         filename = config.FILENAME_TEMPLATE.format(date=datetime.utcnow().strftime('%Y-%m-%d-%H-%M-%S'))
         if config.STORAGE_FILEPATH:
             filename = config.STORAGE_FILEPATH + filename
 
-        # store the CSV to google cloud storage
-        storage = GoogleCloudStorage(config)
-        storage.connect()
-        storage.save_document(bucket_name=config.STORAGE_BUCKET_NAME,
-                              filename=filename,
-                              raw_data=csv_buffer.getvalue(),
-                              doc_type=StorageDocumentTypes.TEXT.value)
+        with tempfile.TemporaryFile(dir=config.EXPORT_FILE_DIRECTORY) as csv_file:
+            # Connect to the app database and do a CSV COPY of the query into the temporary file
+            db_conn = psycopg2.connect(dsn=config.APP_DATABASE_URI)
+            err, export_stats = csv_export(db_conn, query, csv_file, config.EXPORT_PROGRESS_LINES)
+            if err:
+                raise Exception(err)
+            logging.info(f'Completed the CSV Extract: {export_stats}')
+
+            # store the CSV to google cloud storage
+            storage = GoogleCloudStorage(config)
+            storage.connect()
+            storage.save_document_file(bucket_name=config.STORAGE_BUCKET_NAME,
+                                       filename=filename,
+                                       file_obj=csv_file,
+                                       content_type=CONTENT_TYPE_CSV)
         logging.info(f'Stored the filename: {filename}')
         
         # Create hte time limited, signed URL
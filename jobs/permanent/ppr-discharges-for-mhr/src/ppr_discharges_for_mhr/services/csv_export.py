@@ -0,0 +1,88 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Streaming CSV export service.
+
+Pipes the output of a postgres COPY (query) TO STDOUT into a binary file object, typically a temporary file that is
+then uploaded to storage in chunks, so memory use stays constant regardless of the export size.
+The module only depends on the db-api cursor COPY support, so it can be copied as is into the other jobs: it works
+with both psycopg2 (copy_expert) and pg8000 (execute with a stream) connections.
+"""
+import time
+from typing import BinaryIO, Final
+
+from .logging import logging
+
+
+COPY_CSV: Final = 'COPY ({query}) TO STDOUT WITH CSV HEADER'
+DEFAULT_PROGRESS_LINES: Final = 100000
+
+
+class ProgressWriter:
+    """Binary file object wrapper that counts the bytes and lines written and periodically logs the progress."""
+
+    def __init__(self, output: BinaryIO, progress_lines: int = DEFAULT_PROGRESS_LINES):
+        """Wrap the output file object."""
+        self.output = output
+        self.progress_lines = progress_lines
+        self.byte_count: int = 0
+        self.line_count: int = 0
+        self.next_progress: int = progress_lines
+        self.start_time = time.perf_counter()
+
+    def write(self, data) -> int:
+        """Write a chunk of COPY output to the wrapped file object and update the counters."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        written = self.output.write(data)
+        self.byte_count += len(data)
+        self.line_count += data.count(b'\n')
+        if self.progress_lines and self.line_count >= self.next_progress:
+            logging.info(f'CSV export progress: {self.line_count} lines, {self.byte_count} bytes '
+                         f'in {self.elapsed():.1f}s.')
+            self.next_progress = self.line_count + self.progress_lines
+        return written
+
+    def elapsed(self) -> float:
+        """Return the number of seconds since the export started."""
+        return time.perf_counter() - self.start_time
+
+    def stats(self) -> dict:
+        """Return the export counters: the line count includes the header line and any quoted line breaks."""
+        return {
+            'lines': self.line_count,
+            'bytes': self.byte_count,
+            'seconds': round(self.elapsed(), 3)
+        }
+
+
+def csv_export(db_conn, query: str, output: BinaryIO, progress_lines: int = DEFAULT_PROGRESS_LINES) -> dict:
+    """Stream the query results as CSV with a header line into the binary output file object.
+
+    Return the export counters. The caller owns the connection and the output file object. The output is left
+    positioned at the end of the data.
+    """
+    sql_copy_str = COPY_CSV.format(query=query)
+    writer = ProgressWriter(output, progress_lines)
+    db_cursor = db_conn.cursor()
+    try:
+        if hasattr(db_cursor, 'copy_expert'):  # psycopg2
+            db_cursor.copy_expert(sql_copy_str, writer)
+        else:  # pg8000
+            db_cursor.execute(sql_copy_str, stream=writer)
+    finally:
+        db_cursor.close()
+    output.flush()
+    stats = writer.stats()
+    logging.info(f'CSV export completed: {stats}')
+    return stats
@@ -13,7 +13,7 @@
 # limitations under the License.
 """This module containes the signature of the StorageService."""
 from abc import ABC, abstractmethod
-from typing import Optional, Union
+from typing import BinaryIO, Optional, Union
 
 from ...common.enum import BaseEnum, auto
 
@@ -54,6 +54,14 @@ class AbstractStorageService(ABC):
                       doc_type: str = StorageDocumentTypes.BINARY.value) -> None:
         """Save or replace the named document in storage with the binary data as the file contents."""
 
+    @abstractmethod
+    def save_document_file(self,
+                           bucket_name: str,
+                           filename: str,
+                           file_obj: BinaryIO,
+                           content_type: str = None) -> None:
+        """Save or replace the named document in storage with the contents of an open binary file."""
+
     @abstractmethod
     def generate_download_signed_url(self,
                                      bucket_name: str,
@@ -15,7 +15,7 @@
 import base64
 import datetime
 import json
-from typing import Callable, Optional, Union
+from typing import BinaryIO, Callable, Optional, Union
 
 from google.cloud import storage
 
@@ -83,6 +83,21 @@ class GoogleCloudStorage(AbstractStorageService):
             logging.error('GoogleCloudStorage.save_document() failed: {}'.format(err))
             raise StorageServiceError('GoogleCloudStorage.save_document() failed: {}'.format(err), e=err)
 
+    def save_document_file(self,
+                           bucket_name: str,
+                           filename: str,
+                           file_obj: BinaryIO,
+                           content_type: str = None) -> None:
+        """Save or replace the named document in storage from an open binary file, uploading in chunks."""
+        try:
+            gcs = self.connect()
+            bucket = gcs.bucket(bucket_name)
+            blob = bucket.blob(filename)
+            blob.upload_from_file(file_obj, rewind=True, content_type=content_type)
+        except Exception as err:  # noqa: B902
+            logging.error('GoogleCloudStorage.save_document_file() failed: {}'.format(err))
+            raise StorageServiceError('GoogleCloudStorage.save_document_file() failed: {}'.format(err), e=err)
+
     def generate_download_signed_url(self,
                                      bucket_name: str,
                                      blob_name: str,
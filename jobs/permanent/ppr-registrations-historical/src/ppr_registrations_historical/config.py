@@ -28,6 +28,8 @@ class Config(BaseConfig):
 
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'DEBUG')
     START_DATE_OFFSET = int(os.getenv("START_DATE_OFFSET", "31"))
+    # Number of financing statement ids per committed batch in steps 1-3. Set to 0 to run each step as one update.
+    BATCH_SIZE = int(os.getenv("BATCH_SIZE", "10000"))
 
     APP_DB_USER = os.getenv("DATABASE_USERNAME", "")
     APP_DB_PASSWORD = os.getenv("DATABASE_PASSWORD", "")
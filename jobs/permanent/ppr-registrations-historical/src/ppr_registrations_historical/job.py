@@ -1,4 +1,5 @@
 import sys
+import time
 from contextlib import suppress
 from http import HTTPStatus
 from typing import Any, Final
@@ -20,7 +21,7 @@ UPDATE registrations
  WHERE financing_id IN
  (SELECT DISTINCT fs.id
     FROM registrations r, financing_statements fs
-   WHERE fs.id = r.financing_id
+   WHERE fs.id = r.financing_id{id_filter}
      AND r.account_id != '0'
      AND r.account_id NOT LIKE '%_HIS'
      AND EXISTS (SELECT r3.id
@@ -36,7 +37,7 @@ UPDATE financing_statements
  WHERE id IN
  (SELECT DISTINCT fs.id
     FROM registrations r, financing_statements fs
-   WHERE fs.id = r.financing_id
+   WHERE fs.id = r.financing_id{id_filter}
      AND r.account_id != '0'
      AND r.account_id NOT LIKE '%_HIS'   
      AND (fs.expire_date IS NOT NULL AND 
@@ -56,7 +57,7 @@ UPDATE registrations
  WHERE financing_id IN
  (SELECT DISTINCT fs.id
     FROM registrations r, financing_statements fs
-   WHERE fs.id = r.financing_id
+   WHERE fs.id = r.financing_id{id_filter}
      AND r.account_id != '0'
      AND r.account_id NOT LIKE '%_HIS'   
      AND (fs.expire_date IS NOT NULL AND 
@@ -77,6 +78,88 @@ DELETE
                     WHERE r.registration_number = uer.registration_number
                       AND r.account_id LIKE '%_HIS')
 """
+DELETE_SERIAL_SEARCH_HISTORICAL = """
+DELETE
+  FROM serial_search
+ WHERE expire_date < ((now() at time zone 'utc') - interval '30 days')
+    OR discharge_ts < ((now() at time zone 'utc') - interval '30 days')
+"""
+# The financing statements discharged or expired in the steps 1-3 date range.
+ACCOUNT_SUMMARY_HISTORICAL_IDS = """
+SELECT fs.id
+  FROM financing_statements fs
+ WHERE (EXISTS (SELECT r3.id
+                  FROM registrations r3
+                 WHERE r3.financing_id = fs.id
+                   AND r3.registration_type_cl = 'DISCHARGE'
+                   AND r3.registration_ts BETWEEN ((now() at time zone 'utc') - interval '{start_offset} days')
+                                              AND ((now() at time zone 'utc') - interval '30 days'))
+        OR (fs.expire_date IS NOT NULL AND
+            (fs.expire_date at time zone 'utc') BETWEEN ((now() at time zone 'utc') - interval '{start_offset} days')
+                                                    AND ((now() at time zone 'utc') - interval '30 days'))){id_filter}
+"""
+REFRESH_ACCOUNT_SUMMARY_HISTORICAL = """
+SELECT account_registration_summary_refresh(h.id)
+  FROM (""" + ACCOUNT_SUMMARY_HISTORICAL_IDS + """) h
+"""
+DELETE_ACCOUNT_SUMMARY_HISTORICAL = """
+DELETE
+  FROM account_registration_summary
+ WHERE account_id LIKE '%_HIS'
+   AND financing_id IN (""" + ACCOUNT_SUMMARY_HISTORICAL_IDS + """)
+"""
+ID_RANGE_FILTER = """
+     AND fs.id >= {start_id} AND fs.id < {end_id}"""
+FINANCING_ID_RANGE = "SELECT MIN(id), MAX(id) FROM financing_statements"
+# Keyset pagination: the first id of the next batch, BATCH_SIZE ids after the start of the current batch.
+NEXT_BATCH_START_ID = """
+SELECT id
+  FROM financing_statements
+ WHERE id >= %s
+ ORDER BY id
+OFFSET %s ROWS
+ FETCH FIRST 1 ROWS ONLY
+"""
+# A run in batch mode keeps its progress in one event_tracking record with a 202 status, replaced after every batch.
+# The record status changes to 200 when the run completes: a 202 record means the previous run stopped early.
+CHECKPOINT_STATUS: Final = HTTPStatus.ACCEPTED
+CHECKPOINT_MESSAGE: Final = 'step={step};financing_id={financing_id}'
+SELECT_CHECKPOINT: Final = """
+SELECT id, status, message
+  FROM event_tracking
+ WHERE key_id = %s
+   AND event_tracking_type = 'REG_HIST_JOB'
+   AND status IN (200, 202)
+ ORDER BY id DESC
+ FETCH FIRST 1 ROWS ONLY
+"""
+INSERT_CHECKPOINT: Final = """
+INSERT INTO event_tracking(id, key_id, event_ts, event_tracking_type, status, message)
+    VALUES(nextval('event_tracking_id_seq'), %s, CURRENT_TIMESTAMP at time zone 'utc', 'REG_HIST_JOB',
+                 %s, %s)
+RETURNING id
+"""
+UPDATE_CHECKPOINT: Final = """
+UPDATE event_tracking
+   SET event_ts = CURRENT_TIMESTAMP at time zone 'utc', status = %s, message = %s
+ WHERE id = %s
+"""
+BATCH_STEPS: Final = {
+    1: UPDATE_ACCOUNT_DISCHARGED,
+    2: UPDATE_FINANCING_HEX,
+    3: UPDATE_ACCOUNT_EXPIRED,
+    4: REFRESH_ACCOUNT_SUMMARY_HISTORICAL
+}
+# 1. Update account ids for registrations discharged more than 30 days.
+# 2. Update financing statements status to HEX for statements expired more than 30 days.
+# 3. Update account ids for registrations expired more than 30 days.
+# 4. Refresh the account registration summary records of the financing statements updated in steps 1-3.
+STEP_MESSAGES: Final = {
+    1: '1. Update account discharged registrations.',
+    2: '\n2. Update financing_statements.state_type=HEX for expired registrations.',
+    3: '\n3. Update account expired registrations.',
+    4: '\n4. Refresh account registration summary historical.'
+}
 INSERT_EVENT: Final = """
 INSERT INTO event_tracking(id, key_id, event_ts, event_tracking_type, status, message)
     VALUES(nextval('event_tracking_id_seq'), %s, CURRENT_TIMESTAMP at time zone 'utc', 'REG_HIST_JOB',
@@ -97,8 +180,95 @@ def track_event(db_conn: DbConnection,
         error_message = f"Error attempting event_tracking insert: {err}"
         logging.error(error_message)
 
+
+def get_checkpoint(db_cursor: DbCursor) -> dict:
+    """Get the unfinished batch run checkpoint as a dict with the id, step, and financing_id, or None."""
+    db_cursor.execute(SELECT_CHECKPOINT, (EVENT_JOB_ID,))
+    row = db_cursor.fetchone()
+    if not row or int(row[1]) != CHECKPOINT_STATUS:
+        return None
+    checkpoint = {'id': int(row[0])}
+    for item in str(row[2]).split(';'):
+        key, value = item.split('=')
+        checkpoint[key] = int(value)
+    return checkpoint
+
+
+def save_checkpoint(db_conn: DbConnection,
+                    db_cursor: DbCursor,
+                    checkpoint: dict,
+                    status: int = CHECKPOINT_STATUS):
+    """Create or replace the batch run checkpoint, committing with the batch update."""
+    message: str = CHECKPOINT_MESSAGE.format(step=checkpoint['step'], financing_id=checkpoint['financing_id'])
+    if checkpoint.get('id'):
+        db_cursor.execute(UPDATE_CHECKPOINT, (int(status), message, checkpoint['id']))
+    else:
+        db_cursor.execute(INSERT_CHECKPOINT, (EVENT_JOB_ID, int(status), message))
+        checkpoint['id'] = int(db_cursor.fetchone()[0])
+    db_conn.commit()
+
+
+def run_step(db_conn: DbConnection, db_cursor: DbCursor, config, step: int) -> str:
+    """Run one of the update steps as a single statement."""
+    sql_statement = BATCH_STEPS[step].format(start_offset=config.START_DATE_OFFSET, id_filter='')
+    logging.info(f'Starting step {step}: {sql_statement}')
+    start_time = time.perf_counter()
+    db_cursor.execute(sql_statement)
+    row_count: int = db_cursor.rowcount
+    db_conn.commit()
+    elapsed = time.perf_counter() - start_time
+    logging.info(f'Step {step} updated {row_count} rows in {elapsed:.3f}s.')
+    return f' Updated {row_count} rows in {elapsed:.1f}s.'
+
+
+def run_step_batches(db_conn: DbConnection,  # pylint: disable=too-many-locals
+                     db_cursor: DbCursor,
+                     config,
+                     step: int,
+                     checkpoint: dict) -> str:
+    """
+    Run one of the update steps in keyset ranges of config.BATCH_SIZE financing statements, committing every batch.
+
+    The checkpoint is saved with each batch commit, so a failed run resumes from the first uncommitted batch.
+    Batch timings are logged to tune the batch size against lock waits.
+    """
+    db_cursor.execute(FINANCING_ID_RANGE)
+    row = db_cursor.fetchone()
+    min_id: int = int(row[0]) if row and row[0] else 0
+    max_id: int = int(row[1]) if row and row[1] else 0
+    start_id: int = checkpoint['financing_id'] if checkpoint.get('step') == step else min_id
+    logging.info(f'Starting step {step} batches of {config.BATCH_SIZE} from financing id {start_id} to {max_id}.')
+    batch_count: int = 0
+    row_count: int = 0
+    max_elapsed: float = 0
+    step_start = time.perf_counter()
+    while start_id <= max_id:
+        db_cursor.execute(NEXT_BATCH_START_ID, (start_id, config.BATCH_SIZE))
+        row = db_cursor.fetchone()
+        end_id: int = int(row[0]) if row else max_id + 1
+        id_filter: str = ID_RANGE_FILTER.format(start_id=start_id, end_id=end_id)
+        sql_statement = BATCH_STEPS[step].format(start_offset=config.START_DATE_OFFSET, id_filter=id_filter)
+        start_time = time.perf_counter()
+        db_cursor.execute(sql_statement)
+        batch_rows: int = db_cursor.rowcount
+        checkpoint['step'] = step
+        checkpoint['financing_id'] = end_id
+        save_checkpoint(db_conn, db_cursor, checkpoint)
+        elapsed = time.perf_counter() - start_time
+        logging.info(f'Step {step} batch financing ids {start_id}-{end_id - 1} updated {batch_rows} rows '
+                     f'in {elapsed:.3f}s.')
+        batch_count += 1
+        row_count += batch_rows
+        max_elapsed = max(max_elapsed, elapsed)
+        start_id = end_id
+    elapsed = time.perf_counter() - step_start
+    logging.info(f'Step {step} completed {batch_count} batches updating {row_count} rows in {elapsed:.3f}s, '
+                 f'slowest batch {max_elapsed:.3f}s.')
+    return f' Updated {row_count} rows in {batch_count} batches in {elapsed:.1f}s, slowest {max_elapsed:.1f}s.'
+
+
 # Start job
-def job(config):
+def job(config):  # pylint: disable=too-many-statements
 
     db_conn: DbConnection | None = None
     db_cursor: DbCursor | None = None
@@ -127,33 +297,46 @@ def job(config):
             )
         db_cursor = db_conn.cursor()
 
-        # Update account ids for registrations discharged more than 30 days.
-        sql_statement = UPDATE_ACCOUNT_DISCHARGED.format(start_offset=config.START_DATE_OFFSET)
-        logging.info(f'Starting step 1: update account discharged registrations: {sql_statement}')
-        db_cursor.execute(sql_statement)
-        db_conn.commit()
+        checkpoint: dict = {}
+        if config.BATCH_SIZE > 0:
+            checkpoint = get_checkpoint(db_cursor) or {}
+            if checkpoint:
+                logging.info(f'Resuming from step {checkpoint["step"]} financing id {checkpoint["financing_id"]}.')
+        job_message = ''
+        for step, step_message in STEP_MESSAGES.items():
+            job_message += step_message
+            if config.BATCH_SIZE < 1:
+                job_message += run_step(db_conn, db_cursor, config, step)
+            elif checkpoint.get('step', 0) > step:
+                logging.info(f'Skipping step {step}: completed in the previous run.')
+                job_message += ' Completed in the previous run.'
+            else:
+                job_message += run_step_batches(db_conn, db_cursor, config, step, checkpoint)
 
-        # Update financing statements status to HEX for statements expired more than 30 days.
-        job_message += '\n2. Update financing_statements.state_type=HEX for expired registrations.'
-        sql_statement = UPDATE_FINANCING_HEX.format(start_offset=config.START_DATE_OFFSET)
-        logging.info(f'Starting step 2: update financing_statements.state_type=HEX: {sql_statement}')
-        db_cursor.execute(sql_statement)
+        # Update account ids for registrations expired more than 30 days.
+        job_message += '\n5. Delete account extra registrations historical.'
+        logging.info('Starting step 5: delete account extra registrations that are now historical:')
+        logging.info(DELETE_EXTRA_HISTORICAL)
+        db_cursor.execute(DELETE_EXTRA_HISTORICAL)
         db_conn.commit()
 
-        # Update account ids for registrations expired more than 30 days.
-        job_message += '\n3. Update account expired registrations.'
-        sql_statement = UPDATE_ACCOUNT_EXPIRED.format(start_offset=config.START_DATE_OFFSET)
-        logging.info(f'Starting step 3: update account expired registrations: {sql_statement}')
-        db_cursor.execute(sql_statement)
+        # Remove serial search index records that are no longer searchable.
+        job_message += '\n6. Delete serial search index historical.'
+        logging.info('Starting step 6: delete serial search index records that are now historical:')
+        logging.info(DELETE_SERIAL_SEARCH_HISTORICAL)
+        db_cursor.execute(DELETE_SERIAL_SEARCH_HISTORICAL)
         db_conn.commit()
 
-        # Update account ids for registrations expired more than 30 days.
-        job_message += '\n4. Delete account extra registrations historical.'
-        logging.info('Starting step 4: delete account extra registrations that are now historical:')
-        logging.info(DELETE_EXTRA_HISTORICAL)
-        db_cursor.execute(DELETE_EXTRA_HISTORICAL)
+        # Remove the refreshed account registration summary records that are now historical.
+        job_message += '\n7. Delete account registration summary historical.'
+        logging.info('Starting step 7: delete account registration summary records that are now historical:')
+        sql_statement = DELETE_ACCOUNT_SUMMARY_HISTORICAL.format(start_offset=config.START_DATE_OFFSET, id_filter='')
+        logging.info(sql_statement)
+        db_cursor.execute(sql_statement)
         db_conn.commit()
 
+        if checkpoint.get('id'):
+            save_checkpoint(db_conn, db_cursor, checkpoint, HTTPStatus.OK)
         logging.info('Run completed without error.')
         track_event(db_conn, db_cursor, HTTPStatus.OK, job_message)
     except Exception as err:
@@ -77,6 +77,10 @@ class Config(BaseConfig):
     GCP_CS_SA_SCOPES = os.getenv("GCP_CS_SA_SCOPES", "https://www.googleapis.com/auth/cloud-platform")
     # Storage of mail verification reports
     GCP_CS_BUCKET_ID_MAIL = os.getenv("GCP_CS_BUCKET_ID_MAIL", "")
+    # Maximum number of concurrent mail report downloads when building the delivery zip file.
+    DOCUMENT_FETCH_POOL_SIZE = int(os.getenv("DOCUMENT_FETCH_POOL_SIZE", "8"))
+    # Optional directory (for example an ephemeral disk mount) for the delivery zip file: default system temp.
+    ZIP_FILE_DIRECTORY = os.getenv("ZIP_FILE_DIRECTORY") or None
 
     # Document delivery configuration
     GOOGLE_STORAGE_SERVICE_ACCOUNT = os.getenv("GOOGLE_STORAGE_SERVICE_ACCOUNT", "")
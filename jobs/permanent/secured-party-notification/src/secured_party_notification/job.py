@@ -13,10 +13,12 @@
 # limitations under the License.
 """This module executes all the job steps."""
 import copy
-import io
 import json
 import sys
+import tempfile
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from datetime import datetime as _datetime
 from typing import Any
@@ -337,46 +339,76 @@ def get_mail_report_data(db_cursor: DbCursor, config: Config):
     return db_cursor.fetchall()
 
 
-def batch_reports(status_data: dict, rows) -> dict:
+def fetch_reports(rows, pool_size: int = 1):
+    """
+    Download the mail reports in document storage concurrently, yielding (row, download future) in row order.
+
+    At most 2 * pool_size downloads are in progress or waiting to be consumed at any time, so memory use is
+    bounded by a small window of reports regardless of the batch size.
+
+    Args:
+        rows: Database query rows - record set from the mail_reports tables.
+        pool_size: Maximum number of concurrent downloads.
+
+    Returns:
+        Generator of (row, future) tuples. The future is None if the row has no document storage path.
+    """
+    pool_size = max(pool_size, 1)
+    window: int = pool_size * 2
+    with ThreadPoolExecutor(max_workers=pool_size) as executor:
+        pending = deque()
+        for row in rows:
+            future = executor.submit(GoogleStorageService.get_document, str(row[5])) if row[5] else None
+            pending.append((row, future))
+            if len(pending) >= window:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+
+def batch_reports(status_data: dict, rows, config: Config = None) -> dict:
     """
     Build the document delivery ZIP file from individual reports in document storage.
     Save the zip file to doc storage along with the count file.
     Capture the status of the individual reports as a csv row. Save the csv file to doc storage
     and make available to the notfication service as a download link in status_data as csv_file_url.
+    Reports are downloaded concurrently and the zip file is written to a temporary file, then uploaded in chunks.
 
     Args:
         status_data: Dictionary to store job status information.
         rows: Database query rows - record set from the mail_reports tables.
+        config: Job configuration with the download pool size and optional zip file directory.
 
     Returns:
         Updated status_data with zip file counts zip_file_count and zip_file_error_count
     """
+    pool_size: int = config.DOCUMENT_FETCH_POOL_SIZE if config else 1
+    zip_dir: str = config.ZIP_FILE_DIRECTORY if config else None
     count: int = 0
     zip_error_count: int = 0  # Report data exists in doc storage but error adding to zip file.
     csv_data = []
-    report_data = None
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_data:
-        for row in rows:
-            try:
-                report_id = int(row[7])
-                if row[5]:
-                    storage_name = str(row[5])
-                    report_data = GoogleStorageService.get_document(storage_name)
-                    zip_data.writestr(storage_name[11:], report_data)
-                    csv_data.append(get_csv_data(row, 201))
-                    count += 1
-                else:
-                    logger.warning(f"No mail report found for id={report_id}, status={int(row[6])}")
-                    csv_data.append(get_csv_data(row, None))
-            except Exception as report_err:
-                logger.error(f"Notification report failed for mail_reports id={report_id}: {report_err}")
-                zip_error_count += 1
-                csv_data.append(get_csv_data(row, 500))
-    if count > 0:
-        GoogleStorageService.save_document(
-            status_data.get("delivery_zip_file_name"), zip_buffer.getvalue(), CONTENT_TYPE_ZIP
-        )
+    with tempfile.TemporaryFile(dir=zip_dir) as zip_file:
+        with zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED) as zip_data:
+            for row, future in fetch_reports(rows, pool_size):
+                try:
+                    report_id = int(row[7])
+                    if future:
+                        storage_name = str(row[5])
+                        zip_data.writestr(storage_name[11:], future.result())
+                        csv_data.append(get_csv_data(row, 201))
+                        count += 1
+                    else:
+                        logger.warning(f"No mail report found for id={report_id}, status={int(row[6])}")
+                        csv_data.append(get_csv_data(row, None))
+                except Exception as report_err:
+                    logger.error(f"Notification report failed for mail_reports id={report_id}: {report_err}")
+                    zip_error_count += 1
+                    csv_data.append(get_csv_data(row, 500))
+        if count > 0:
+            logger.info(f"Uploading zip file size={zip_file.tell()} bytes.")
+            GoogleStorageService.save_document_file(
+                status_data.get("delivery_zip_file_name"), zip_file, CONTENT_TYPE_ZIP
+            )
     GoogleStorageService.save_document(
         status_data.get("delivery_count_file_name"), str(count) + "\n", CONTENT_TYPE_TEXT
     )
@@ -409,7 +441,6 @@ def job(config: Config):
                as this query excludes records with an existing job id. 
 
     TO DO:
-        Use a GCP ephemeral disk to build the zip file.
         Use existing document delivery job tracking framework. Replace or in addition to status_data.
         Conditionally add BCMail+ delivery via SFTP only if sftp env vars exist (PROD only).
 
@@ -453,7 +484,7 @@ def job(config: Config):
             notify_client.send_status(status_data)
             return
         rows = get_mail_report_data(db_cursor, config)
-        status_data = batch_reports(status_data, rows)
+        status_data = batch_reports(status_data, rows, config)
         set_job_id(db_conn, db_cursor, config, status_data.get("batch_job_id"))
         logger.info("Run completed: sending email.")
         notify_client.send_status(status_data)
@@ -85,6 +85,18 @@ class GoogleStorageService:  # pylint: disable=too-few-public-methods
             logger.error(f"save_document failed for doc name={name}: {err}")
             raise StorageException(f"POST document failed for doc name={name}.") from err
 
+    @classmethod
+    def save_document_file(cls, name: str, file_obj, content_type: str):
+        """Save or replace the named document in cloud storage from an open binary file, uploading in chunks."""
+        try:
+            logger.info(f"Saving document name={name} from file.")
+            blob = GoogleStorageService.GCP_BUCKET.blob(name)
+            blob.upload_from_file(file_obj, rewind=True, content_type=content_type)
+            return blob.time_created
+        except Exception as err:  # pylint: disable=broad-except # noqa F841;
+            logger.error(f"save_document_file failed for doc name={name}: {err}")
+            raise StorageException(f"POST document failed for doc name={name}.") from err
+
     @classmethod
     def save_document_link(cls, name: str, raw_data, available_days: int = 1, content_type: str = None):
         """Save a document to a cloud storage bucket with the binary data as the file contents. Return a link."""
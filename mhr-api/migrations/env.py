@@ -31,7 +31,10 @@ from database.postgres_functions import (
     get_mhr_doc_qualified_id,
     get_mhr_doc_gov_agent_id,
     mhr_name_compressed_key,
+    mhr_search_refresh,
     mhr_serial_compressed_key,
+    mhr_summary_snapshot_drain,
+    mhr_summary_snapshot_refresh,
     get_mhr_doc_staff_id
 )
 from database.postgres_views import (
@@ -109,6 +112,9 @@ register_entities([get_draft_document_number,
                    get_mhr_doc_gov_agent_id,
                    mhr_name_compressed_key,
                    mhr_serial_compressed_key,
+                   mhr_search_refresh,
+                   mhr_summary_snapshot_refresh,
+                   mhr_summary_snapshot_drain,
                    account_draft_vw,
                    account_registration_count_vw,
                    account_registration_vw,
@@ -1,9 +1,12 @@
 #!/usr/bin/env bash
 #
 # Backfill mhr_registrations.summary_snapshot from mhr_account_reg_vw.
-# Skip registrations with duplicate notes, which cause subqueries in the view
-# to fail with:
-#   "more than one row returned by a subquery used as an expression".
+# Queue the homes with missing snapshots in mhr_summary_snapshot_queue, then
+# drain the queue in batches with the same mhr_summary_snapshot_drain function
+# the summary-snapshot batch job uses. Homes with duplicate notes, which cause
+# subqueries in the view to fail with:
+#   "more than one row returned by a subquery used as an expression"
+# are skipped by the function with a warning.
 
 set -u
 
@@ -13,44 +16,29 @@ export PGPASSWORD
 
 # Update (host, port, database, user) if needed 
 PSQL="psql -v ON_ERROR_STOP=1 -h localhost -p 5432 -d ppr -U postgres -At"
+# Number of homes updated per batch.
+BATCH_SIZE=500
 
 total=0
 iter=0
 
 trap 'unset PGPASSWORD' EXIT
 
+queued="$($PSQL -c "
+INSERT INTO mhr_summary_snapshot_queue(mhr_number, queue_ts)
+SELECT DISTINCT r.mhr_number, now() at time zone 'utc'
+  FROM mhr_registrations r
+ WHERE r.summary_snapshot IS NULL
+ON CONFLICT (mhr_number) DO NOTHING
+RETURNING mhr_number;
+" | wc -l | tr -d ' ')"
+echo "$(date '+%F %T') | queued=$queued"
+
 while true; do
   iter=$((iter+1))
   start=$(date +%s)
 
-  out="$($PSQL -c "
-WITH skipped_candidates AS (
-  SELECT registration_id
-  FROM mhr_notes
-  GROUP BY registration_id
-  HAVING COUNT(*) > 1
-),
-batch AS (
-  SELECT r.id
-  FROM mhr_registrations r
-  WHERE r.summary_snapshot IS NULL
-  AND NOT EXISTS (
-    SELECT 1 FROM skipped_candidates sc WHERE sc.registration_id = r.id
-  )
-  ORDER BY r.id DESC
-  LIMIT 2000
-),
-snaps AS (
-  SELECT b.id, to_jsonb(v) AS payload
-  FROM batch b
-  JOIN mhr_account_reg_vw v ON v.registration_id = b.id
-)
-UPDATE mhr_registrations r
-SET summary_snapshot = s.payload
-FROM snaps s
-WHERE r.id = s.id
-RETURNING r.id;
-" )"
+  out="$($PSQL -c "SELECT mhr_summary_snapshot_drain($BATCH_SIZE);" 2>&1)"
   rc=$?
 
   end=$(date +%s)
@@ -62,9 +50,11 @@ RETURNING r.id;
     break
   fi
 
-  rows=$(printf "%s" "$out" | wc -l | tr -d ' ')
+  # Skipped home warnings are printed before the count.
+  rows=$(printf "%s" "$out" | tail -n 1 | tr -d ' ')
+  printf "%s" "$out" | grep WARNING
   total=$((total + rows))
-  echo "$(date '+%F %T') | iter=$iter | updated=$rows | batch_time=${elapsed}s | total=$total"
+  echo "$(date '+%F %T') | iter=$iter | homes=$rows | batch_time=${elapsed}s | total=$total"
 
   [ "$rows" -eq 0 ] && break
 done
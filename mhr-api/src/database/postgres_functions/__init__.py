@@ -37,5 +37,8 @@ from .get_mhr_doc_manufacturer_id import get_mhr_doc_manufacturer_id
 from .get_mhr_doc_qualified_id import get_mhr_doc_qualified_id
 from .get_mhr_doc_gov_agent_id import get_mhr_doc_gov_agent_id
 from .mhr_name_compressed_key import mhr_name_compressed_key
+from .mhr_search_refresh import mhr_search_refresh
 from .mhr_serial_compressed_key import mhr_serial_compressed_key
+from .mhr_summary_snapshot_drain import mhr_summary_snapshot_drain
+from .mhr_summary_snapshot_refresh import mhr_summary_snapshot_refresh
 from .get_mhr_doc_staff_id import get_mhr_doc_staff_id
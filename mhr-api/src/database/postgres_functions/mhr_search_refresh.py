@@ -0,0 +1,58 @@
+"""Maintain db function mhr_search_refresh here."""
+from alembic_utils.pg_function import PGFunction
+
+
+mhr_search_refresh = PGFunction(
+    schema="public",
+    signature="mhr_search_refresh(p_mhr_number IN VARCHAR)",
+    definition=r"""
+    RETURNS INTEGER
+    LANGUAGE plpgsql
+    AS
+    $$
+    DECLARE
+        v_count INTEGER;
+        v_owner_count INTEGER;
+    BEGIN
+        -- Serialize concurrent refreshes of the same home so the delete sees committed rows.
+        PERFORM r.id
+           FROM mhr_registrations r
+          WHERE r.mhr_number = p_mhr_number
+            AND r.registration_type IN ('MHREG', 'MHREG_CONVERSION')
+            FOR UPDATE;
+        DELETE FROM mhr_search_serial WHERE mhr_number = p_mhr_number;
+        DELETE FROM mhr_search_owner WHERE mhr_number = p_mhr_number;
+        INSERT INTO mhr_search_serial(id, mhr_number, status_type, registration_ts, city, serial_number,
+                                      compressed_key, year_made, make, model, registration_id, owner_info,
+                                      manufacturer_name, civic_address)
+        SELECT v.section_id, v.mhr_number, v.status_type, v.registration_ts, v.city, v.serial_number,
+               v.compressed_key, v.year_made, v.make, v.model, v.id, v.owner_info,
+               v.manufacturer_name, v.civic_address
+          FROM mhr_search_serial_vw v
+         WHERE v.mhr_number = p_mhr_number;
+        GET DIAGNOSTICS v_count = ROW_COUNT;
+        INSERT INTO mhr_search_owner(id, owner_type, mhr_number, status_type, registration_ts, city, serial_number,
+                                     year_made, make, model, registration_id, business_name, owner_status_type,
+                                     compressed_name, manufacturer_name, civic_address)
+        SELECT nextval('mhr_search_owner_id_seq'), 'BUS', v.mhr_number, v.status_type, v.registration_ts, v.city,
+               v.serial_number, v.year_made, v.make, v.model, v.id, v.business_name, v.owner_status_type,
+               v.compressed_name, v.manufacturer_name, v.civic_address
+          FROM mhr_search_owner_bus_vw v
+         WHERE v.mhr_number = p_mhr_number;
+        GET DIAGNOSTICS v_owner_count = ROW_COUNT;
+        v_count := v_count + v_owner_count;
+        INSERT INTO mhr_search_owner(id, owner_type, mhr_number, status_type, registration_ts, city, serial_number,
+                                     year_made, make, model, registration_id, last_name, first_name, middle_name,
+                                     owner_status_type, compressed_name, manufacturer_name, civic_address)
+        SELECT nextval('mhr_search_owner_id_seq'), 'IND', v.mhr_number, v.status_type, v.registration_ts, v.city,
+               v.serial_number, v.year_made, v.make, v.model, v.id, v.last_name, v.first_name, v.middle_name,
+               v.owner_status_type, v.compressed_name, v.manufacturer_name, v.civic_address
+          FROM mhr_search_owner_ind_vw v
+         WHERE v.mhr_number = p_mhr_number;
+        GET DIAGNOSTICS v_owner_count = ROW_COUNT;
+        RETURN v_count + v_owner_count;
+    END
+    ; 
+    $$;
+    """
+)
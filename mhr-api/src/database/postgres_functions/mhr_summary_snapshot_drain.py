@@ -0,0 +1,33 @@
+"""Maintain db function mhr_summary_snapshot_drain here."""
+from alembic_utils.pg_function import PGFunction
+
+
+mhr_summary_snapshot_drain = PGFunction(
+    schema="public",
+    signature="mhr_summary_snapshot_drain(p_batch_size IN INTEGER)",
+    definition=r"""
+    RETURNS INTEGER
+    LANGUAGE plpgsql
+    AS
+    $$
+    DECLARE
+        v_mhr_numbers VARCHAR[];
+    BEGIN
+        -- Oldest first. Rows locked by a concurrent drain or account refresh are left for them.
+        SELECT array_agg(q.mhr_number)
+          INTO v_mhr_numbers
+          FROM (SELECT mhr_number
+                  FROM mhr_summary_snapshot_queue
+                 ORDER BY queue_ts
+                 LIMIT p_batch_size
+                   FOR UPDATE SKIP LOCKED) q;
+        IF v_mhr_numbers IS NULL THEN
+            RETURN 0;
+        END IF;
+        PERFORM mhr_summary_snapshot_refresh(v_mhr_numbers);
+        RETURN array_length(v_mhr_numbers, 1);
+    END
+    ;
+    $$;
+    """
+)
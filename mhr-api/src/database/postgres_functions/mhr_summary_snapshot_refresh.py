@@ -0,0 +1,56 @@
+"""Maintain db function mhr_summary_snapshot_refresh here."""
+from alembic_utils.pg_function import PGFunction
+
+
+mhr_summary_snapshot_refresh = PGFunction(
+    schema="public",
+    signature="mhr_summary_snapshot_refresh(p_mhr_numbers IN VARCHAR[])",
+    definition=r"""
+    RETURNS INTEGER
+    LANGUAGE plpgsql
+    AS
+    $$
+    DECLARE
+        v_count INTEGER := 0;
+        v_mhr_count INTEGER;
+        v_mhr_number VARCHAR(7);
+    BEGIN
+        IF p_mhr_numbers IS NULL OR array_length(p_mhr_numbers, 1) IS NULL THEN
+            RETURN 0;
+        END IF;
+        -- Delete first: a home queued again by a registration committed during the update stays queued.
+        DELETE FROM mhr_summary_snapshot_queue WHERE mhr_number = ANY(p_mhr_numbers);
+        BEGIN
+            UPDATE mhr_registrations r
+               SET summary_snapshot = to_jsonb(arv)
+              FROM mhr_account_reg_vw arv
+             WHERE arv.mhr_number = ANY(p_mhr_numbers)
+               AND r.id = arv.registration_id;
+            GET DIAGNOSTICS v_count = ROW_COUNT;
+        EXCEPTION WHEN OTHERS THEN
+            -- A home the view cannot summarize (duplicate notes) fails the batch: update one home at a time.
+            v_count := 0;
+            FOREACH v_mhr_number IN ARRAY p_mhr_numbers LOOP
+                BEGIN
+                    UPDATE mhr_registrations r
+                       SET summary_snapshot = to_jsonb(arv)
+                      FROM mhr_account_reg_vw arv
+                     WHERE arv.mhr_number = v_mhr_number
+                       AND r.id = arv.registration_id;
+                    GET DIAGNOSTICS v_mhr_count = ROW_COUNT;
+                    v_count := v_count + v_mhr_count;
+                EXCEPTION WHEN OTHERS THEN
+                    RAISE WARNING 'mhr_summary_snapshot_refresh skipped MHR number %: %', v_mhr_number, SQLERRM;
+                    -- Queue the home again behind the other queued homes so the update is retried.
+                    INSERT INTO mhr_summary_snapshot_queue(mhr_number, queue_ts)
+                    VALUES (v_mhr_number, now() at time zone 'utc')
+                    ON CONFLICT (mhr_number) DO NOTHING;
+                END;
+            END LOOP;
+        END;
+        RETURN v_count;
+    END
+    ;
+    $$;
+    """
+)
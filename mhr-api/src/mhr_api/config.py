@@ -85,9 +85,13 @@ class Config:  # pylint: disable=too-few-public-methods
     REPORT_API_URL = os.getenv("REPORT_API_URL", "https://gotenberg-p56lvhvsqa-nn.a.run.app")
 
     AUTH_SVC_URL = f"{AUTH_API_URL + AUTH_API_VERSION}"
+    # Seconds to cache auth api user and account organization responses: 0 turns off caching.
+    AUTH_CACHE_TTL: int = int(os.getenv("AUTH_CACHE_TTL", "60"))
     PAYMENT_SVC_URL = f"{PAY_API_URL + PAY_API_VERSION}"
     REPORT_SVC_URL = f"{REPORT_API_URL}"
     REPORT_TEMPLATE_PATH = os.getenv("REPORT_TEMPLATE_PATH", "report-templates")
+    # Set to yes in local development to reload cached report templates when the template files change.
+    REPORT_TEMPLATE_RELOAD = bool(os.getenv("REPORT_TEMPLATE_RELOAD", None) == "yes")
 
     LD_SDK_KEY = os.getenv("LD_SDK_KEY", None)
     SECRET_KEY = "a secret"
@@ -146,6 +150,14 @@ class Config:  # pylint: disable=too-few-public-methods
     ACCOUNT_REGISTRATIONS_MAX_RESULTS = os.getenv("ACCOUNT_REGISTRATIONS_MAX_RESULTS", "100")
     ACCOUNT_DRAFTS_MAX_RESULTS = os.getenv("ACCOUNT_DRAFTS_MAX_RESULTS", "1000")
     ACCOUNT_SEARCH_MAX_RESULTS = os.getenv("ACCOUNT_SEARCH_MAX_RESULTS", "1000")
+    # Set to yes to run serial number and owner name searches against the maintained search index tables.
+    SEARCH_MHR_INDEX = bool(os.getenv("SEARCH_MHR_INDEX", None) == "yes")
+    # Set to yes to queue registration summary snapshot updates for the summary-snapshot batch job instead of
+    # updating them when a registration is created.
+    SUMMARY_SNAPSHOT_QUEUE = bool(os.getenv("SUMMARY_SNAPSHOT_QUEUE", None) == "yes")
+    # The number of queued MHR numbers updated together, and the maximum number of batches per job request.
+    SUMMARY_SNAPSHOT_BATCH_SIZE: int = int(os.getenv("SUMMARY_SNAPSHOT_BATCH_SIZE", "200"))
+    SUMMARY_SNAPSHOT_MAX_BATCHES: int = int(os.getenv("SUMMARY_SNAPSHOT_MAX_BATCHES", "50"))
 
     # Search results report number of financing statements threshold for async requests.
     SEARCH_PDF_ASYNC_THRESHOLD: int = int(os.getenv("SEARCH_PDF_ASYNC_THRESHOLD", "75"))
@@ -183,6 +195,13 @@ class Config:  # pylint: disable=too-few-public-methods
     # Default 2, set to 1 to revert to original report api client
     REPORT_VERSION = os.getenv("REPORT_VERSION", "2")
     REPORT_API_AUDIENCE = os.getenv("REPORT_API_AUDIENCE", "https://gotenberg-p56lvhvsqa-nn.a.run.app")
+    # Report service client: keep-alive connections per host, retries with exponential backoff on 502, 503, 504.
+    REPORT_SVC_POOL_SIZE: int = int(os.getenv("REPORT_SVC_POOL_SIZE", "10"))
+    REPORT_SVC_RETRIES: int = int(os.getenv("REPORT_SVC_RETRIES", "3"))
+    REPORT_SVC_BACKOFF: float = float(os.getenv("REPORT_SVC_BACKOFF", "1.0"))
+    # Consecutive report service failures that open the circuit breaker, and the seconds until calls are tried again.
+    REPORT_SVC_BREAKER_FAILURES: int = int(os.getenv("REPORT_SVC_BREAKER_FAILURES", "5"))
+    REPORT_SVC_BREAKER_RESET: int = int(os.getenv("REPORT_SVC_BREAKER_RESET", "60"))
 
     NOTIFY_MAN_REG_CONFIG = os.getenv("NOTIFY_MAN_REG_CONFIG")
     NOTIFY_LOCATION_CONFIG = os.getenv("NOTIFY_LOCATION_CONFIG")
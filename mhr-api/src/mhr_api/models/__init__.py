@@ -37,8 +37,10 @@ from .mhr_registration import MhrRegistration
 from .mhr_registration_report import MhrRegistrationReport
 from .mhr_review_registration import MhrReviewRegistration
 from .mhr_review_step import MhrReviewStep
+from .mhr_search import MhrSearchOwner, MhrSearchSerial
 from .mhr_section import MhrSection
 from .mhr_service_agreement import MhrServiceAgreement
+from .mhr_summary_snapshot_queue import MhrSummarySnapshotQueue
 from .party import Party
 from .registration import Registration
 from .search_request import SearchRequest
@@ -100,9 +102,12 @@ __all__ = (
     "MhrRegistrationType",
     "MhrReviewStatusType",
     "MhrReviewStep",
+    "MhrSearchOwner",
+    "MhrSearchSerial",
     "MhrSection",
     "MhrStatusType",
     "MhrServiceAgreement",
+    "MhrSummarySnapshotQueue",
     "MhrTenancyType",
     "Party",
     "PartyType",
@@ -19,11 +19,14 @@ from __future__ import annotations
 
 from http import HTTPStatus
 
+from sqlalchemy.orm import selectinload
+
 from mhr_api.exceptions import BusinessException, DatabaseException, ResourceErrorCodes
 from mhr_api.models import utils as model_utils
 from mhr_api.utils.base import BaseEnum
 from mhr_api.utils.logging import logger
 
+from .client_code import ClientCode
 from .db import db
 from .general_collateral import (  # noqa: F401 pylint: disable=unused-import; needed by the SQLAlchemy relationship
     GeneralCollateral,
@@ -39,6 +42,9 @@ from .vehicle_collateral import (  # noqa: F401 pylint: disable=unused-import; n
     VehicleCollateral,
 )
 
+# Maximum number of financing IDs in a single bulk load IN-list query.
+BULK_LOAD_CHUNK_SIZE: int = 500
+
 
 class FinancingStatement(db.Model):  # pylint: disable=too-many-instance-attributes
     """This class maintains financing statement information."""
@@ -403,6 +409,55 @@ class FinancingStatement(db.Model):  # pylint: disable=too-many-instance-attribu
 
         return statement
 
+    @classmethod
+    def find_all_by_ids(cls, financing_ids: list) -> dict:
+        """Return financing statements keyed by financing ID with the search detail graph loaded.
+
+        The registrations, parties, and collateral are fetched in a fixed number of set based (IN-list) queries for
+        each chunk of financing IDs, so generating the json for every statement does not lazy load one relationship
+        at a time.
+        """
+        statements = {}
+        if not financing_ids:
+            return statements
+        ids = list(dict.fromkeys(financing_ids))
+        try:
+            for index in range(0, len(ids), BULK_LOAD_CHUNK_SIZE):
+                chunk = ids[index : index + BULK_LOAD_CHUNK_SIZE]
+                rows = (
+                    db.session.query(FinancingStatement)
+                    .filter(FinancingStatement.id.in_(chunk))
+                    .options(*FinancingStatement.search_detail_load_options())
+                    .all()
+                )
+                for statement in rows:
+                    statements[statement.id] = statement
+        except Exception as db_exception:  # noqa: B902; return nicer error
+            logger.error("DB find_all_by_ids exception: " + repr(db_exception))
+            raise DatabaseException(db_exception) from db_exception
+        return statements
+
+    @staticmethod
+    def search_detail_load_options() -> list:
+        """Return the eager loader options for every relationship used to build the search detail json."""
+        party_options = [
+            selectinload(Party.address),
+            selectinload(Party.client_code).selectinload(ClientCode.address),
+        ]
+        registration = selectinload(FinancingStatement.registration)
+        return [
+            registration.selectinload(Registration.reg_type),
+            registration.selectinload(Registration.court_order),
+            registration.selectinload(Registration.trust_indenture),
+            registration.selectinload(Registration.general_collateral),
+            registration.selectinload(Registration.vehicle_collateral),
+            registration.selectinload(Registration.parties).options(*party_options),
+            selectinload(FinancingStatement.parties).options(*party_options),
+            selectinload(FinancingStatement.vehicle_collateral),
+            selectinload(FinancingStatement.general_collateral),
+            selectinload(FinancingStatement.trust_indenture),
+        ]
+
     @classmethod
     def find_by_registration_number(
         cls, registration_num: str, account_id: str, staff: bool = False, create: bool = False
@@ -18,11 +18,13 @@ from http import HTTPStatus
 
 from sqlalchemy.dialects.postgresql import ENUM as PG_ENUM
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import selectinload
 
 import mhr_api.models.registration_change_utils as change_utils
 import mhr_api.models.registration_json_utils as reg_json_utils
 import mhr_api.models.registration_utils as reg_utils
 from mhr_api.exceptions import BusinessException, DatabaseException, ResourceErrorCodes
+from mhr_api.models import mhr_search
 from mhr_api.models import utils as model_utils
 from mhr_api.models.mhr_extra_registration import MhrExtraRegistration
 from mhr_api.services.authz import STAFF_ROLE
@@ -63,6 +65,8 @@ REG_TO_DOC_TYPE = {
 }
 REG_TYPE = MhrRegistrationTypes.MHREG
 CONV_TYPE = MhrRegistrationTypes.MHREG_CONVERSION
+# Maximum number of registration IDs or MHR numbers in a single bulk load IN-list query.
+BULK_LOAD_CHUNK_SIZE: int = 500
 
 
 class MhrRegistration(db.Model):  # pylint: disable=too-many-instance-attributes, too-many-public-methods
@@ -299,6 +303,11 @@ class MhrRegistration(db.Model):  # pylint: disable=too-many-instance-attributes
         db.session.add(self)
         db.session.commit()
 
+    def save_status(self):
+        """Save a change to the home status type (lock or unlock) and refresh the home search index records."""
+        self.save()
+        mhr_search.refresh_committed(self.mhr_number)
+
     def save_exemption(self, new_reg_id: int):
         """Set the state of the original MH registration to exempt."""
         self.status_type = MhrRegistrationStatusTypes.EXEMPT
@@ -352,6 +361,68 @@ class MhrRegistration(db.Model):  # pylint: disable=too-many-instance-attributes
 
         return registration
 
+    @classmethod
+    def find_all_by_ids(cls, registration_ids: list) -> dict:
+        """Return search registrations keyed by registration id with the search json graph loaded.
+
+        Bulk version of find_by_id with search set: the registrations, their change registrations, and every child
+        collection used by registration_json are fetched in a fixed number of set based (IN-list) queries for each
+        chunk of registration ids/MHR numbers instead of one registration and one relationship at a time.
+        """
+        registrations = {}
+        reg_ids = list(dict.fromkeys(reg_id for reg_id in registration_ids if reg_id))
+        if not reg_ids:
+            return registrations
+        try:
+            for index in range(0, len(reg_ids), BULK_LOAD_CHUNK_SIZE):
+                chunk = reg_ids[index : index + BULK_LOAD_CHUNK_SIZE]
+                rows = (
+                    db.session.query(MhrRegistration)
+                    .filter(MhrRegistration.id.in_(chunk))
+                    .options(*MhrRegistration.search_load_options())
+                    .all()
+                )
+                for registration in rows:
+                    registrations[registration.id] = registration
+            mhr_numbers = list(dict.fromkeys(reg.mhr_number for reg in registrations.values() if reg.mhr_number))
+            changes = {}
+            for index in range(0, len(mhr_numbers), BULK_LOAD_CHUNK_SIZE):
+                chunk = mhr_numbers[index : index + BULK_LOAD_CHUNK_SIZE]
+                rows = (
+                    db.session.query(MhrRegistration)
+                    .filter(
+                        MhrRegistration.mhr_number.in_(chunk),
+                        ~MhrRegistration.registration_type.in_([REG_TYPE, CONV_TYPE]),
+                    )
+                    .options(*MhrRegistration.search_load_options())
+                    .order_by(MhrRegistration.id)
+                    .all()
+                )
+                for registration in rows:
+                    changes.setdefault(registration.mhr_number, []).append(registration)
+        except Exception as db_exception:  # noqa: B902; return nicer error
+            logger.error("DB find_all_by_ids exception: " + str(db_exception))
+            raise DatabaseException(db_exception) from db_exception
+        for registration in registrations.values():
+            if registration.mhr_number:
+                registration.change_registrations = changes.get(registration.mhr_number, [])
+        return registrations
+
+    @staticmethod
+    def search_load_options() -> list:
+        """Return the eager loader options for every relationship used to build the search registration json."""
+        return [
+            selectinload(MhrRegistration.documents),
+            selectinload(MhrRegistration.parties).selectinload(MhrParty.address),
+            selectinload(MhrRegistration.locations).selectinload(MhrLocation.address),
+            selectinload(MhrRegistration.descriptions),
+            selectinload(MhrRegistration.sections),
+            selectinload(MhrRegistration.notes),
+            selectinload(MhrRegistration.owner_groups)
+            .selectinload(MhrOwnerGroup.owners)
+            .selectinload(MhrParty.address),
+        ]
+
     @classmethod
     def find_summary_by_mhr_number(cls, account_id: str, mhr_number: str, staff: bool = False):
         """Return the MHR registration summary information matching the MH registration number."""
@@ -0,0 +1,129 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This module holds the manufactured home serial number and owner name search index tables.
+
+The rows are copies of the mhr_search_serial_vw, mhr_search_owner_bus_vw, and mhr_search_owner_ind_vw rows for a
+manufactured home, replaced when a registration for the home is committed. Serial number, wildcard serial number,
+and owner name prefix searches are then a single indexed lookup without the view joins.
+"""
+from sqlalchemy.sql import text
+
+from mhr_api.utils.logging import logger
+
+from .db import db
+
+REFRESH_STATEMENT = "SELECT mhr_search_refresh(:mhr_number)"  # noqa: Q000
+OWNER_TYPE_BUS = "BUS"
+OWNER_TYPE_IND = "IND"
+
+
+class MhrSearchSerial(db.Model):  # pylint: disable=too-many-instance-attributes
+    """This class maintains the serial number search index records: one per active home section."""
+
+    __tablename__ = "mhr_search_serial"
+
+    # Same as the mhr_sections id.
+    id = db.mapped_column("id", db.Integer, primary_key=True)
+    mhr_number = db.mapped_column("mhr_number", db.String(7), nullable=False, index=True)
+    status_type = db.mapped_column("status_type", db.String(20), nullable=False)
+    registration_ts = db.mapped_column("registration_ts", db.DateTime, nullable=False)
+    city = db.mapped_column("city", db.String(40), nullable=True)
+    serial_number = db.mapped_column("serial_number", db.String(20), nullable=False)
+    compressed_key = db.mapped_column("compressed_key", db.String(6), nullable=False, index=True)
+    year_made = db.mapped_column("year_made", db.Integer, nullable=True)
+    make = db.mapped_column("make", db.String(60), nullable=True)
+    model = db.mapped_column("model", db.String(60), nullable=True)
+    registration_id = db.mapped_column("registration_id", db.Integer, nullable=False)
+    owner_info = db.mapped_column("owner_info", db.Text, nullable=True)
+    manufacturer_name = db.mapped_column("manufacturer_name", db.String(310), nullable=True)
+    civic_address = db.mapped_column("civic_address", db.Text, nullable=True)
+
+    @classmethod
+    def find_by_mhr_number(cls, mhr_number: str):
+        """Return the serial number search index records for a manufactured home."""
+        if not mhr_number:
+            return []
+        return (
+            db.session.query(MhrSearchSerial)
+            .filter(MhrSearchSerial.mhr_number == mhr_number)
+            .order_by(MhrSearchSerial.id)
+            .all()
+        )
+
+
+class MhrSearchOwner(db.Model):  # pylint: disable=too-many-instance-attributes
+    """This class maintains the owner name search index records: one per owner business or individual name."""
+
+    __tablename__ = "mhr_search_owner"
+
+    id = db.mapped_column("id", db.Integer, db.Sequence("mhr_search_owner_id_seq"), primary_key=True)
+    # BUS (business name) or IND (individual name).
+    owner_type = db.mapped_column("owner_type", db.String(3), nullable=False)
+    mhr_number = db.mapped_column("mhr_number", db.String(7), nullable=False, index=True)
+    status_type = db.mapped_column("status_type", db.String(20), nullable=False)
+    registration_ts = db.mapped_column("registration_ts", db.DateTime, nullable=False)
+    city = db.mapped_column("city", db.String(40), nullable=True)
+    serial_number = db.mapped_column("serial_number", db.String(20), nullable=True)
+    year_made = db.mapped_column("year_made", db.Integer, nullable=True)
+    make = db.mapped_column("make", db.String(60), nullable=True)
+    model = db.mapped_column("model", db.String(60), nullable=True)
+    registration_id = db.mapped_column("registration_id", db.Integer, nullable=False)
+    business_name = db.mapped_column("business_name", db.String(150), nullable=True)
+    last_name = db.mapped_column("last_name", db.String(50), nullable=True)
+    first_name = db.mapped_column("first_name", db.String(50), nullable=True)
+    middle_name = db.mapped_column("middle_name", db.String(50), nullable=True)
+    owner_status_type = db.mapped_column("owner_status_type", db.String(20), nullable=False)
+    compressed_name = db.mapped_column("compressed_name", db.String(30), nullable=False)
+    manufacturer_name = db.mapped_column("manufacturer_name", db.String(310), nullable=True)
+    civic_address = db.mapped_column("civic_address", db.Text, nullable=True)
+
+    @classmethod
+    def find_by_mhr_number(cls, mhr_number: str):
+        """Return the owner name search index records for a manufactured home."""
+        if not mhr_number:
+            return []
+        return (
+            db.session.query(MhrSearchOwner)
+            .filter(MhrSearchOwner.mhr_number == mhr_number)
+            .order_by(MhrSearchOwner.id)
+            .all()
+        )
+
+
+def refresh(mhr_number: str) -> int:
+    """Replace the search index records for a manufactured home within the current transaction.
+
+    Call after the registration changes are flushed and before the commit.
+    """
+    if not mhr_number:
+        return 0
+    db.session.flush()
+    result = db.session.execute(text(REFRESH_STATEMENT), {"mhr_number": mhr_number})
+    count = result.scalar()
+    logger.debug(f"MHR search index refreshed {count} records for MHR number {mhr_number}.")
+    return count
+
+
+def refresh_committed(mhr_number: str):
+    """Replace the search index records for a manufactured home after a change to the home has been committed.
+
+    The index records are updated in their own transaction. A failure is logged and not raised: it must not fail or
+    undo (refund) the committed change.
+    """
+    try:
+        refresh(mhr_number)
+        db.session.commit()
+    except Exception as db_exception:  # noqa: B902; log and continue
+        db.session.rollback()
+        logger.error(f"MHR search index refresh failed for MHR number {mhr_number}: {db_exception}")
@@ -0,0 +1,110 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This module holds the queue of manufactured homes with out of date registration summary snapshots.
+
+A home is queued when a registration is committed and SUMMARY_SNAPSHOT_QUEUE is configured. Queuing a home that is
+already queued does nothing, so a burst of registrations for one home results in one update of its snapshots. The
+summary-snapshot batch job drains the queue with the mhr_summary_snapshot_drain database function, oldest first. A
+home the update fails for is queued again behind the other queued homes, so it is retried by a later batch.
+Before an account registrations list is read the queued homes of the account are updated, so the submitting account
+sees its own changes. A home a concurrent drain is updating is skipped and shows its new snapshot when the drain batch
+commits. Other snapshot readers, such as adding a home to an account by MHR or document number, see the previous
+snapshot until the home is drained.
+"""
+from sqlalchemy.sql import text
+
+from mhr_api.utils.logging import logger
+
+from .db import db
+
+QUEUE_STATEMENT = """
+INSERT INTO mhr_summary_snapshot_queue(mhr_number, queue_ts)
+VALUES (:mhr_number, now() at time zone 'utc')
+ON CONFLICT (mhr_number) DO NOTHING
+"""
+DRAIN_STATEMENT = "SELECT mhr_summary_snapshot_drain(:batch_size)"  # noqa: Q000
+# Claim the queued homes of the account: homes locked by a concurrent drain or account refresh are left for them.
+REFRESH_ACCOUNT_STATEMENT = """
+SELECT mhr_summary_snapshot_refresh(array_agg(q.mhr_number))
+  FROM (SELECT q2.mhr_number
+          FROM mhr_summary_snapshot_queue q2
+         WHERE EXISTS (SELECT r.id
+                         FROM mhr_registrations r
+                        WHERE r.mhr_number = q2.mhr_number
+                          AND r.account_id = :account_id)
+            OR EXISTS (SELECT er.id
+                         FROM mhr_extra_registrations er
+                        WHERE er.mhr_number = q2.mhr_number
+                          AND er.account_id = :account_id)
+           FOR UPDATE SKIP LOCKED) q
+"""
+
+
+class MhrSummarySnapshotQueue(db.Model):
+    """This class maintains the queue of manufactured homes waiting for a registration summary snapshot update."""
+
+    __tablename__ = "mhr_summary_snapshot_queue"
+
+    mhr_number = db.mapped_column("mhr_number", db.String(7), primary_key=True)
+    queue_ts = db.mapped_column("queue_ts", db.DateTime, nullable=False, index=True)
+
+    @classmethod
+    def find_by_mhr_number(cls, mhr_number: str):
+        """Return the queue record for a manufactured home."""
+        if not mhr_number:
+            return None
+        return (
+            db.session.query(MhrSummarySnapshotQueue)
+            .filter(MhrSummarySnapshotQueue.mhr_number == mhr_number)
+            .one_or_none()
+        )
+
+    @staticmethod
+    def queue(mhr_number: str):
+        """Queue a summary snapshot update for a manufactured home within the current transaction."""
+        if not mhr_number:
+            return
+        db.session.execute(text(QUEUE_STATEMENT), {"mhr_number": mhr_number})
+        logger.debug(f"Queued the registration summary snapshot update for MHR number {mhr_number}.")
+
+    @staticmethod
+    def drain(batch_size: int, max_batches: int) -> int:
+        """Update the summary snapshots of the queued homes oldest first, committing each batch.
+
+        Return the number of homes updated.
+        """
+        total: int = 0
+        for _ in range(max_batches):
+            count = db.session.execute(text(DRAIN_STATEMENT), {"batch_size": batch_size}).scalar()
+            db.session.commit()
+            if not count:
+                break
+            total += count
+            logger.debug(f"Summary snapshot queue batch updated {count} homes.")
+        logger.info(f"Summary snapshot queue updated {total} homes.")
+        return total
+
+    @staticmethod
+    def refresh_account(account_id: str) -> int:
+        """Update the summary snapshots of the queued homes with registrations listed for the account.
+
+        Return the number of registrations updated.
+        """
+        if not account_id:
+            return 0
+        count = db.session.execute(text(REFRESH_ACCOUNT_STATEMENT), {"account_id": account_id}).scalar()
+        if count:
+            db.session.commit()
+            logger.debug(f"Updated {count} queued summary snapshots for account {account_id}.")
+        return count or 0
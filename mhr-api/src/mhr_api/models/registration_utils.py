@@ -14,11 +14,14 @@
 # pylint: disable=too-few-public-methods,too-many-lines
 
 """This module holds methods to support registration model updates - mostly account registration summary."""
+from flask import current_app
 from sqlalchemy.sql import text
 
 from mhr_api.exceptions import DatabaseException
+from mhr_api.models import mhr_search
 from mhr_api.models import utils as model_utils
 from mhr_api.models.db import db
+from mhr_api.models.mhr_summary_snapshot_queue import MhrSummarySnapshotQueue
 from mhr_api.models.queries import (
     ACCOUNT_SORT_ASCENDING,
     ACCOUNT_SORT_DESCENDING,
@@ -879,16 +882,20 @@ def find_summary_by_doc_reg_number(account_id: str, doc_reg_number: str, staff:
 
 
 def update_summary_snapshot_by_mhr_number(mhr_number: str):
-    """Return the MHR registration summary snapshot matching the mhr number."""
+    """Update or queue the update of the MHR registration summary snapshots matching the mhr number."""
     try:
-        query = text(UPDATE_QUERY_SUMMARY_SNAPSHOT_BY_MHR_NUMBER)
-        result = db.session.execute(query, {"query_value1": mhr_number})
-        if result:
-            logger.debug(f"Updated mhr registration summary snapshot for mhr_number {mhr_number}.")
+        if current_app.config.get("SUMMARY_SNAPSHOT_QUEUE"):
+            MhrSummarySnapshotQueue.queue(mhr_number)
+        else:
+            query = text(UPDATE_QUERY_SUMMARY_SNAPSHOT_BY_MHR_NUMBER)
+            result = db.session.execute(query, {"query_value1": mhr_number})
+            if result:
+                logger.debug(f"Updated mhr registration summary snapshot for mhr_number {mhr_number}.")
         db.session.commit()
     except Exception as db_exception:  # noqa: B902; return nicer error
         logger.error("update_summary_snapshot_by_mhr_number exception: " + str(db_exception))
         raise DatabaseException(db_exception) from db_exception
+    mhr_search.refresh_committed(mhr_number)
 
 
 def update_summary_snapshot_by_reg_id(registration_id: int):
@@ -908,6 +915,8 @@ def find_all_by_account_id(params: AccountRegistrationParams):
     """Return a summary list of recent MHR registrations belonging to an account."""
     registrations = []
     try:
+        if current_app.config.get("SUMMARY_SNAPSHOT_QUEUE"):
+            MhrSummarySnapshotQueue.refresh_account(params.account_id)
         query = text(build_account_query(params))
         # logger.info(query)
         if params.has_filter() and params.filter_reg_start_date and params.filter_reg_end_date:
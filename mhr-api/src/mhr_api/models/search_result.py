@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 
+import copy
 import json
 from http import HTTPStatus
 
@@ -150,55 +151,60 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
     def build_details(self, staff: bool = False):
         """Generate the search selection details."""
         new_results = []
-        for select in self.search_select:
-            if "selected" not in select or select["selected"]:
-                mhr_num = select["mhrNumber"]
-                found = False
-                if new_results:  # Check for duplicates.
-                    for match in new_results:
-                        if match["mhrNumber"] == mhr_num:
-                            found = True
-                if not found:  # No duplicates.
-                    # Load registration details here.
-                    mh_id = select.get("mhId", None)
-                    logger.debug(f"find_by_id for mhr num {mhr_num} start id={mh_id}")
+        added_mhr_nums = set()
+        lien_results = {}
+        selected = [select for select in self.search_select if "selected" not in select or select["selected"]]
+        # Load all the selected registration details in a fixed number of queries instead of one home at a time.
+        registrations = MhrRegistration.find_all_by_ids([select.get("mhId") for select in selected])
+        logger.debug(f"Bulk loaded {len(registrations)} registrations for {len(selected)} selected.")
+        for select in selected:
+            mhr_num = select["mhrNumber"]
+            if mhr_num not in added_mhr_nums:  # No duplicates.
+                added_mhr_nums.add(mhr_num)
+                mh_id = select.get("mhId", None)
+                record = registrations.get(mh_id)
+                if not record:  # Not bulk loaded: look up individually.
                     record = MhrRegistration.find_by_id(mh_id, False, True)
-                    logger.debug(f"find_by_id for mhr num {mhr_num} end")
-                    record.staff = staff
-                    result = record.registration_json
-                    if select.get("includeLienInfo", False):
-                        logger.info(f"Searching PPR for MHR num {mhr_num}.")
-                        ppr_registrations = SearchResult.search_ppr_by_mhr_number(mhr_num)
-                        result["pprRegistrations"] = ppr_registrations
-                    new_results.append(result)
+                record.staff = staff
+                result = record.registration_json
+                if select.get("includeLienInfo", False):
+                    lien_results[mhr_num] = result
+                new_results.append(result)
+        if lien_results:
+            # Search PPR for all the selected homes at once.
+            logger.info(f"Searching PPR for {len(lien_results)} MHR numbers.")
+            ppr_registrations = SearchResult.search_ppr_by_mhr_numbers(list(lien_results.keys()))
+            for mhr_num, result in lien_results.items():
+                result["pprRegistrations"] = ppr_registrations.get(mhr_num, [])
         return new_results
 
-    def set_search_selection(self, update_select):  # pylint: disable=too-many-branches
+    def set_search_selection(self, update_select):
         """Sort the selection for the report TOC."""
         original_results = self.search.search_response
         reg_list = [s["mhrNumber"] for s in update_select]
         # Remove duplicates
         reg_list = list(dict.fromkeys(reg_list))
         # Update lien info flag
+        lien_info = {}
+        for match in update_select:
+            if match.get("includeLienInfo", False):
+                lien_info[match["mhrNumber"]] = match.get("includeLienInfo")
+        # Index the original matches by MHR number in the original order.
+        originals_by_mhr_num = {}
         for result in original_results:
-            for match in update_select:
-                if result["mhrNumber"] == match["mhrNumber"]:
-                    if match.get("includeLienInfo", False):
-                        result["includeLienInfo"] = match.get("includeLienInfo")
+            if result["mhrNumber"] in lien_info:
+                result["includeLienInfo"] = lien_info[result["mhrNumber"]]
+            originals_by_mhr_num.setdefault(result["mhrNumber"], []).append(result)
 
         final_selection = []
         for reg_num in reg_list:
             # logger.info(f'reg_num={reg_num}')
-            result = None
-            for original in original_results:
-                if original["mhrNumber"] == reg_num:
-                    if not result:
-                        result = original
-                        result["extraMatches"] = []
-                    else:  # Combine matches
-                        result["extraMatches"].append(original)
-            if result:
-                if not result.get("extraMatches"):
+            originals = originals_by_mhr_num.get(reg_num)
+            if originals:
+                result = originals[0]
+                if len(originals) > 1:  # Combine matches
+                    result["extraMatches"] = originals[1:]
+                elif "extraMatches" in result:
                     del result["extraMatches"]
                 final_selection.append(result)
 
@@ -404,31 +410,48 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
     def search_ppr_by_mhr_number(mhr_number):
         """Execute a PPR MHR Number search query."""
         logger.info(f"Search_ppr_by_mhr_number search value={mhr_number}.")
+        return SearchResult.search_ppr_by_mhr_numbers([mhr_number]).get(mhr_number, [])
+
+    @staticmethod
+    def search_ppr_by_mhr_numbers(mhr_numbers: list) -> dict:
+        """Execute a PPR MHR Number search query for a list of MHR numbers.
+
+        Returns the PPR registrations json keyed by MHR number. The matching financing statements are found in one
+        query and bulk loaded, and the json for a financing statement that matches more than one home is generated
+        once and copied.
+        """
         rows = None
         try:
-            query = text(search_utils.PPR_MHR_NUMBER_QUERY)
-            result = db.session.execute(query, {"query_value": mhr_number})
+            query = text(search_utils.PPR_MHR_NUMBERS_QUERY)
+            result = db.session.execute(query, {"query_values": json.dumps(mhr_numbers)})
             rows = result.fetchall()
         except Exception as db_exception:  # noqa: B902; return nicer error
-            logger.error("Search_ppr_by_mhr_number query exception: " + str(db_exception))
+            logger.error("Search_ppr_by_mhr_numbers query exception: " + str(db_exception))
             raise DatabaseException(db_exception) from db_exception
 
-        results_json = []
-        if rows is None:
-            return results_json
+        results = {}
+        if not rows:
+            return results
         try:
+            statements = FinancingStatement.find_all_by_ids([int(row[1]) for row in rows])
+            statements_json = {}
             for row in rows:
-                financing_id: int = int(row[0])
-                logger.info(f"Found financing id={financing_id}.")
-                financing: FinancingStatement = FinancingStatement.find_by_id(financing_id)
-                financing.mark_update_json = True  # Added for PDF, indicate if party or collateral was added.
-                # Set to true to include change history.
-                financing.include_changes_json = True
-                financing_json = {"matchType": "EXACT", "financingStatement": financing.json}
-                results_json.append(financing_json)
+                mhr_number: str = str(row[0])
+                financing_id: int = int(row[1])
+                logger.info(f"Found financing id={financing_id} for MHR num {mhr_number}.")
+                if financing_id in statements_json:
+                    financing_json = copy.deepcopy(statements_json[financing_id])
+                else:
+                    financing: FinancingStatement = statements[financing_id]
+                    financing.mark_update_json = True  # Added for PDF, indicate if party or collateral was added.
+                    # Set to true to include change history.
+                    financing.include_changes_json = True
+                    financing_json = {"matchType": "EXACT", "financingStatement": financing.json}
+                    statements_json[financing_id] = financing_json
+                results.setdefault(mhr_number, []).append(financing_json)
         except Exception as db_exception:  # noqa: B902; return nicer error
-            logger.error("Search_ppr_by_mhr_number build results error: " + str(db_exception))
+            logger.error("Search_ppr_by_mhr_numbers build results error: " + str(db_exception))
             raise DatabaseException(db_exception) from db_exception
 
-        logger.info("Search_ppr_by_mhr_number results length=" + str(len(results_json)))
-        return results_json
+        logger.info(f"Search_ppr_by_mhr_numbers matching MHR numbers={len(results)}.")
+        return results
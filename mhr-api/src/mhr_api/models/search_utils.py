@@ -21,6 +21,7 @@ Search constants and helper functions.
 # Disable E131: allow query strings to be more human readable.
 import re
 
+from flask import current_app
 from sqlalchemy.sql import text
 
 from mhr_api.exceptions import DatabaseException
@@ -112,9 +113,11 @@ ORDER BY sc.search_ts DESC
 FETCH FIRST {str(ACCOUNT_SEARCH_HISTORY_MAX_SIZE)} ROWS ONLY
 """
 
-PPR_MHR_NUMBER_QUERY = """
-SELECT DISTINCT fs.id
-  FROM registrations r, financing_statements fs, serial_collateral sc 
+# PPR liens on manufactured homes: query_values is a json array of MHR numbers.
+PPR_MHR_NUMBERS_QUERY = """
+SELECT DISTINCT q.mhr_number, fs.id
+  FROM json_array_elements_text(CAST(:query_values AS json)) AS q(mhr_number),
+       registrations r, financing_statements fs, serial_collateral sc
  WHERE r.financing_id = fs.id
    AND r.registration_type_cl IN ('PPSALIEN', 'MISCLIEN', 'CROWNLIEN')
    AND r.base_reg_number IS NULL
@@ -127,8 +130,8 @@ SELECT DISTINCT fs.id
    AND sc.financing_id = fs.id
    AND sc.registration_id_end IS NULL
    AND sc.serial_type = 'MH'
-   AND sc.mhr_number = (SELECT searchkey_mhr(:query_value))
-ORDER BY fs.id ASC
+   AND sc.mhr_number = searchkey_mhr(q.mhr_number)
+ORDER BY q.mhr_number, fs.id ASC
 """
 SEARCH_MHR_NUMBER_QUERY = """
 SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, id, owner_info,
@@ -188,6 +191,50 @@ SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made,
  WHERE compressed_name LIKE mhr_name_compressed_key(:query_value) || '%'
  ORDER BY last_name ASC, first_name ASC, middle_name ASC, owner_status_type ASC, status_type ASC, mhr_number DESC
 """
+# Search queries using the mhr_search_serial and mhr_search_owner index tables maintained on registration commits.
+SEARCH_SERIAL_INDEX_QUERY_BASE = """
+SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, registration_id AS id,
+       owner_info, manufacturer_name, civic_address, id AS section_id
+  FROM mhr_search_serial
+ WHERE compressed_key = mhr_serial_compressed_key(:query_value)
+"""
+SEARCH_SERIAL_WILD_INDEX_QUERY_BASE = """
+WITH exact AS (
+    SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model,
+           registration_id AS id, owner_info, manufacturer_name, civic_address, id AS section_id
+    FROM mhr_search_serial
+    WHERE compressed_key = mhr_serial_compressed_key(:query_value)
+),
+combined AS (
+    SELECT *
+    FROM exact
+UNION ALL
+    SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model,
+           registration_id AS id, owner_info, manufacturer_name, civic_address, id AS section_id
+    FROM mhr_search_serial
+    WHERE serial_number LIKE '%' || :query_like || '%'
+    AND NOT EXISTS (SELECT 1 FROM exact)
+)
+SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, id, owner_info,
+       manufacturer_name, civic_address
+FROM combined
+"""
+SEARCH_OWNER_BUS_INDEX_QUERY = """
+SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, registration_id,
+       business_name, owner_status_type, manufacturer_name, civic_address
+  FROM mhr_search_owner
+ WHERE owner_type = 'BUS'
+   AND compressed_name LIKE mhr_name_compressed_key(:query_value) || '%'
+ ORDER BY business_name ASC, owner_status_type ASC, status_type ASC, mhr_number DESC
+ """
+SEARCH_OWNER_IND_INDEX_QUERY = """
+SELECT mhr_number, status_type, registration_ts, city, serial_number, year_made, make, model, registration_id,
+       owner_status_type, last_name, first_name, middle_name, manufacturer_name, civic_address
+  FROM mhr_search_owner
+ WHERE owner_type = 'IND'
+   AND compressed_name LIKE mhr_name_compressed_key(:query_value) || '%'
+ ORDER BY last_name ASC, first_name ASC, middle_name ASC, owner_status_type ASC, status_type ASC, mhr_number DESC
+"""
 
 
 def format_mhr_number(request_json):
@@ -197,6 +244,11 @@ def format_mhr_number(request_json):
     request_json["criteria"]["value"] = mhr_num
 
 
+def escape_like(value: str) -> str:
+    """Escape the LIKE pattern special characters so the value is matched literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 def search_by_mhr_number(request_json):
     """Execute a search by mhr number query."""
     mhr_num: str = request_json["criteria"]["value"]
@@ -216,16 +268,23 @@ def search_by_serial_number(request_json):
     serial_num = serial_num.strip().upper()
     logger.info(f"search_by_serial_number search value={serial_num}.")
     try:
-        query_text: str = (
-            SEARCH_SERIAL_QUERY_BASE if not request_json.get("wildcardSearch") else SEARCH_SERIAL_WILD_QUERY_BASE
-        )
+        if current_app.config.get("SEARCH_MHR_INDEX"):
+            query_text: str = (
+                SEARCH_SERIAL_INDEX_QUERY_BASE
+                if not request_json.get("wildcardSearch")
+                else SEARCH_SERIAL_WILD_INDEX_QUERY_BASE
+            )
+        else:
+            query_text: str = (
+                SEARCH_SERIAL_QUERY_BASE if not request_json.get("wildcardSearch") else SEARCH_SERIAL_WILD_QUERY_BASE
+            )
         if request_json.get("prioritizeExactMatch"):
             query_text += SEARCH_SERIAL_PRIORITIZE_EXACT_MATCH_ORDER
         else:
             query_text += SEARCH_SERIAL_DEAULT_ORDER
         # logger.info(query_text)
         query = text(query_text)
-        result = db.session.execute(query, {"query_value": serial_num})
+        result = db.session.execute(query, {"query_value": serial_num, "query_like": escape_like(serial_num)})
         return result
     except Exception as db_exception:  # noqa: B902; return nicer error
         logger.error("Search_by_serial_number exception: " + str(db_exception))
@@ -237,7 +296,9 @@ def search_by_owner_business(request_json):
     bus_name: str = request_json["criteria"]["value"]
     logger.info(f"search_by_owner_business search value={bus_name}.")
     try:
-        query = text(SEARCH_OWNER_BUS_QUERY)
+        query = text(
+            SEARCH_OWNER_BUS_INDEX_QUERY if current_app.config.get("SEARCH_MHR_INDEX") else SEARCH_OWNER_BUS_QUERY
+        )
         result = db.session.execute(query, {"query_value": bus_name.strip()})
         return result
     except Exception as db_exception:  # noqa: B902; return nicer error
@@ -255,7 +316,9 @@ def search_by_owner_individual(request_json):
         name += " " + owner_name.get("middle").upper()
     logger.info(f"search_by_owner_individual search value={name}.")
     try:
-        query = text(SEARCH_OWNER_IND_QUERY)
+        query = text(
+            SEARCH_OWNER_IND_INDEX_QUERY if current_app.config.get("SEARCH_MHR_INDEX") else SEARCH_OWNER_IND_QUERY
+        )
         result = db.session.execute(query, {"query_value": name.strip()})
         return result
     except Exception as db_exception:  # noqa: B902; return nicer error
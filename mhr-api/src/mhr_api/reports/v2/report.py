@@ -11,12 +11,12 @@
 """Produces a PDF output based on templates and JSON messages."""
 # pylint: disable=too-many-lines
 import copy
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 from pathlib import Path
 
 import markupsafe
 import pycountry
-import requests
 from flask import current_app, jsonify
 
 from mhr_api.exceptions import ResourceErrorCodes
@@ -25,6 +25,7 @@ from mhr_api.models import utils as model_utils
 from mhr_api.models.type_tables import MhrDocumentTypes, MhrRegistrationTypes, MhrTenancyTypes
 from mhr_api.reports import ppr_report_utils
 from mhr_api.reports.v2 import report_utils
+from mhr_api.reports.v2.report_client import ReportClient
 from mhr_api.reports.v2.report_utils import ReportTypes
 from mhr_api.services.gcp_auth.auth_service import GoogleAuthService
 from mhr_api.utils.logging import logger
@@ -71,20 +72,21 @@ class Report:  # pylint: disable=too-few-public-methods
         # Generate the cover page for specific non-staff reports
         if add_cover:
             logger.debug("Generate cover letter for specific non-staff report")
-            cover_content, cover_status, cover_headers = self.get_registration_cover_pdf()
-            if cover_status != HTTPStatus.OK:
-                return cover_content, cover_status, cover_headers
+            cover_request = self._get_cover_request()
 
         logger.debug("Account {0} report type {1} setting up report data.".format(self._account_id, self._report_key))
         data = self._setup_report_data()
         url = current_app.config.get("REPORT_SVC_URL") + SINGLE_URI
+        meta_data = report_utils.get_report_meta_data(self._report_key)
+        files = report_utils.get_report_files(data, self._report_key)
+        # Render the cover letter and registration reports concurrently and merge them.
+        if add_cover:
+            return self._get_merged_cover_pdf(cover_request, (self._report_key, meta_data, files))
         logger.debug(
             "Account {0} report type {1} calling report-api {2}.".format(self._account_id, self._report_key, url)
         )
-        meta_data = report_utils.get_report_meta_data(self._report_key)
-        files = report_utils.get_report_files(data, self._report_key)
         headers = Report.get_headers()
-        response = requests.post(url=url, headers=headers, data=meta_data, files=files, timeout=1800.0)
+        response = ReportClient.post(url, headers, meta_data, files, 1800.0)
         logger.debug(
             "Account {0} report type {1} response status: {2}.".format(
                 self._account_id, self._report_key, response.status_code
@@ -96,14 +98,6 @@ class Report:  # pylint: disable=too-few-public-methods
                 "Account {0} response status: {1} error: {2}.".format(self._account_id, response.status_code, content)
             )
             return jsonify(message=content), response.status_code, None
-
-        # Merge the cover letter and registration reports if applicable.
-        if add_cover:
-            files = []
-            files.append(cover_content)
-            files.append(response.content)
-            return Report.batch_merge(files)
-
         return response.content, response.status_code, {"Content-Type": "application/pdf"}
 
     def get_search_pdf(self):
@@ -119,7 +113,7 @@ class Report:  # pylint: disable=too-few-public-methods
         meta_data = report_utils.get_report_meta_data(self._report_key)
         files = report_utils.get_report_files(data, self._report_key)
         headers = Report.get_headers()
-        response_reg = requests.post(url=url, headers=headers, data=meta_data, files=files, timeout=1800.0)
+        response_reg = ReportClient.post(url, headers, meta_data, files, 1800.0)
         logger.debug(
             "Account {0} report type {1} response status: {2}.".format(
                 self._account_id, self._report_key, response_reg.status_code
@@ -142,7 +136,7 @@ class Report:  # pylint: disable=too-few-public-methods
         )
         files = report_utils.get_report_files(data_final, self._report_key)
         logger.info("Search report regenerating with TOC page numbers set.")
-        response = requests.post(url=url, headers=headers, data=meta_data, files=files, timeout=1800.0)
+        response = ReportClient.post(url, headers, meta_data, files, 1800.0)
         logger.info("Search report regeneration with TOC page numbers completed.")
         if response.status_code != HTTPStatus.OK:
             content = ResourceErrorCodes.REPORT_ERR + ": " + response.content.decode("ascii")
@@ -155,34 +149,61 @@ class Report:  # pylint: disable=too-few-public-methods
     def get_registration_cover_pdf(self):
         """Render a registration cover letter report."""
         logger.debug(f"Account {self._account_id} setting up reg cover report data.")
+        response_cover = self._post_concurrent([self._get_cover_request()])[0]
+        if response_cover.status_code != HTTPStatus.OK:
+            return self._report_error(response_cover)
+        return response_cover.content, response_cover.status_code, {"Content-Type": "application/pdf"}
+
+    def _get_cover_request(self) -> tuple:
+        """Set up the registration cover letter report request, leaving the report type and data unchanged."""
         original_report_key = self._report_key
         original_report_data = copy.deepcopy(self._report_data)
         try:
             self._report_key = ReportTypes.MHR_REGISTRATION_COVER
             data = self._setup_report_data()
-            url = current_app.config.get("REPORT_SVC_URL") + SINGLE_URI
             meta_data = report_utils.get_report_meta_data(self._report_key)
             files = report_utils.get_report_files(data, self._report_key, False)
-            headers = Report.get_headers()
-            response_cover = requests.post(url=url, headers=headers, data=meta_data, files=files, timeout=1800.0)
-            logger.debug(
-                "Account {0} report type {1} response status: {2}.".format(
-                    self._account_id, self._report_key, response_cover.status_code
-                )
-            )
-            if response_cover.status_code != HTTPStatus.OK:
-                content = ResourceErrorCodes.REPORT_ERR + ": " + response_cover.content.decode("ascii")
-                logger.error(
-                    "Account {0} response status: {1} error: {2}.".format(
-                        self._account_id, response_cover.status_code, content
-                    )
-                )
-                return jsonify(message=content), response_cover.status_code, None
-            return response_cover.content, response_cover.status_code, {"Content-Type": "application/pdf"}
+            return self._report_key, meta_data, files
         finally:
             self._report_key = original_report_key
             self._report_data = original_report_data
 
+    def _get_merged_cover_pdf(self, cover_request: tuple, report_request: tuple):
+        """Render the cover letter and the report concurrently, then merge them in memory."""
+        response_cover, response_reg = self._post_concurrent([cover_request, report_request])
+        for response in (response_cover, response_reg):
+            if response.status_code != HTTPStatus.OK:
+                return self._report_error(response)
+        report_files = {"cover.pdf": response_cover.content, "pdf1.pdf": response_reg.content}
+        return report_utils.merge_pdfs(report_files), HTTPStatus.OK, {"Content-Type": "application/pdf"}
+
+    def _post_concurrent(self, report_requests: list) -> list:
+        """Post (report type, meta data, files) report service requests concurrently, returning responses in order."""
+        url = current_app.config.get("REPORT_SVC_URL") + SINGLE_URI
+        headers = Report.get_headers()
+        app = current_app._get_current_object()  # pylint: disable=protected-access; thread needs the app context
+
+        def post_request(report_request: tuple):
+            report_key, meta_data, files = report_request
+            logger.debug(f"Account {self._account_id} report type {report_key} calling report-api {url}.")
+            with app.app_context():
+                response = ReportClient.post(url, headers, meta_data, files, 1800.0)
+            logger.debug(
+                f"Account {self._account_id} report type {report_key} response status: {response.status_code}."
+            )
+            return response
+
+        if len(report_requests) == 1:
+            return [post_request(report_requests[0])]
+        with ThreadPoolExecutor(max_workers=len(report_requests)) as executor:
+            return list(executor.map(post_request, report_requests))
+
+    def _report_error(self, response):
+        """Log and return the report service error response."""
+        content = ResourceErrorCodes.REPORT_ERR + ": " + response.content.decode("ascii")
+        logger.error(f"Account {self._account_id} response status: {response.status_code} error: {content}.")
+        return jsonify(message=content), response.status_code, None
+
     def get_registration_staff_pdf(self):
         """Render a staff MH registration report with cover letter."""
         logger.debug(f"Account {self._account_id} setting up staff reg report data.")
@@ -195,29 +216,14 @@ class Report:  # pylint: disable=too-few-public-methods
             if self._report_data["note"].get("cancelledDocumentDescription"):
                 desc = report_utils.format_description(self._report_data["note"].get("cancelledDocumentDescription"))
                 self._report_data["note"]["cancelledDocumentDescription"] = desc
-        # 1: Generate the cover page report.
+        # 1: Set up the cover page report.
         self._report_key = ReportTypes.MHR_REGISTRATION_COVER
         data = self._setup_report_data()
-        url = current_app.config.get("REPORT_SVC_URL") + SINGLE_URI
         meta_data = report_utils.get_report_meta_data(self._report_key)
         files = report_utils.get_report_files(data, self._report_key, False)
-        headers = Report.get_headers()
-        response_cover = requests.post(url=url, headers=headers, data=meta_data, files=files, timeout=1800.0)
-        logger.debug(
-            "Account {0} report type {1} response status: {2}.".format(
-                self._account_id, self._report_key, response_cover.status_code
-            )
-        )
-        if response_cover.status_code != HTTPStatus.OK:
-            content = ResourceErrorCodes.REPORT_ERR + ": " + response_cover.content.decode("ascii")
-            logger.error(
-                "Account {0} response status: {1} error: {2}.".format(
-                    self._account_id, response_cover.status_code, content
-                )
-            )
-            return jsonify(message=content), response_cover.status_code, None
+        cover_request = (self._report_key, meta_data, files)
 
-        # 2: Generate the registration pdf.
+        # 2: Set up the registration report.
         self._report_key = ReportTypes.MHR_REGISTRATION
         if self._report_data.get("registrationType", "") in (
             MhrRegistrationTypes.TRANS,
@@ -252,30 +258,10 @@ class Report:  # pylint: disable=too-few-public-methods
                 self._report_key = ReportTypes.MHR_NOTE
         self._report_data["createDateTime"] = create_ts
         data = self._setup_report_data()
-        logger.debug(
-            "Account {0} report type {1} calling report-api {2}.".format(self._account_id, self._report_key, url)
-        )
         meta_data = report_utils.get_report_meta_data(self._report_key)
         files = report_utils.get_report_files(data, self._report_key, False)
-        response_reg = requests.post(url=url, headers=headers, data=meta_data, files=files, timeout=1800.0)
-        logger.debug(
-            "Account {0} report type {1} response status: {2}.".format(
-                self._account_id, self._report_key, response_reg.status_code
-            )
-        )
-        if response_reg.status_code != HTTPStatus.OK:
-            content = ResourceErrorCodes.REPORT_ERR + ": " + response_reg.content.decode("ascii")
-            logger.error(
-                "Account {0} response status: {1} error: {2}.".format(
-                    self._account_id, response_reg.status_code, content
-                )
-            )
-            return jsonify(message=content), response_reg.status_code, None
-        # 3: Merge cover letter and registration reports.
-        files = []
-        files.append(response_cover.content)
-        files.append(response_reg.content)
-        return Report.batch_merge(files)
+        # 3: Render the cover letter and registration reports concurrently and merge them.
+        return self._get_merged_cover_pdf(cover_request, (self._report_key, meta_data, files))
 
     @staticmethod
     def get_headers() -> dict:
@@ -300,7 +286,7 @@ class Report:  # pylint: disable=too-few-public-methods
             files[filename] = pdf
         headers = Report.get_headers()
         url = current_app.config.get("REPORT_SVC_URL") + MERGE_URI
-        response = requests.post(url=url, headers=headers, files=files, timeout=1800.0)
+        response = ReportClient.post(url, headers, None, files, 1800.0)
         logger.debug("Batch merge reports response status: {0}.".format(response.status_code))
         if response.status_code != HTTPStatus.OK:
             content = ResourceErrorCodes.REPORT_ERR + ": " + response.content.decode("ascii")
@@ -354,17 +340,41 @@ class Report:  # pylint: disable=too-few-public-methods
         return report_id
 
     def _get_template(self):
-        """Load from the local file system the template matching the report type."""
+        """Get the expanded template matching the report type from the template cache, loading it on first use."""
+        file_name = self._get_template_filename()
+        template_code = report_utils.TemplateCache.get_template(file_name)
+        if template_code is None:
+            template_code = Report._load_template(file_name)
+        return template_code
+
+    @staticmethod
+    def _load_template(file_name: str) -> str:
+        """Load from the local file system the template, substitute the template parts, and cache the result."""
         try:
             template_path = current_app.config.get("REPORT_TEMPLATE_PATH")
-            template_code = Path(f"{template_path}/{self._get_template_filename()}").read_text(encoding="UTF-8")
+            template_code = Path(f"{template_path}/{file_name}").read_text(encoding="UTF-8")
             # substitute template parts
-            template_code = self._substitute_template_parts(template_code)
+            template_code = Report._substitute_template_parts(template_code)
         except Exception as err:  # noqa: B902; just logging
             logger.error(err)
             raise err
+        report_utils.TemplateCache.add_template(file_name, template_code)
         return template_code
 
+    @staticmethod
+    def load_templates():
+        """Warm the template cache at app start with every report type template found on the file system."""
+        template_path = current_app.config.get("REPORT_TEMPLATE_PATH")
+        file_names = {"{}.html".format(report["fileName"]) for report in ReportMeta.reports.values()}
+        for file_name in sorted(file_names):
+            if not Path(f"{template_path}/{file_name}").exists():
+                continue
+            try:
+                Report._load_template(file_name)
+            except Exception:  # noqa: B902; loaded on first use instead, already logged
+                continue
+        logger.info(f"Report template cache loaded {len(report_utils.TemplateCache.TEMPLATES)} templates.")
+
     @staticmethod
     def _substitute_template_parts(template_code):
         """Substitute template parts in main template.
@@ -428,17 +438,23 @@ class Report:  # pylint: disable=too-few-public-methods
             "search-result-ppr/generalCollateral",
         ]
 
+        # Each template part file is read at most once per template.
+        part_code: dict = {}
+
+        def read_part(template_part: str) -> str:
+            if template_part not in part_code:
+                path = Path(f"{template_path}/template-parts/{template_part}.html")
+                part_code[template_part] = path.read_text(encoding="UTF-8")
+            return part_code[template_part]
+
         # substitute template parts - marked up by [[filename]]
         for template_part in template_parts:
             if template_code.find("[[{}.html]]".format(template_part)) >= 0:
-                template_part_code = Path(f"{template_path}/template-parts/{template_part}.html").read_text(
-                    encoding="UTF-8"
-                )
+                template_part_code = read_part(template_part)
                 for template_part_nested in template_parts:
                     template_reference = "[[{}.html]]".format(template_part_nested)
                     if template_part_code.find(template_reference) >= 0:
-                        path = Path(f"{template_path}/template-parts/{template_part_nested}.html")
-                        template_nested_code = path.read_text(encoding="UTF-8")
+                        template_nested_code = read_part(template_part_nested)
                         template_part_code = template_part_code.replace(template_reference, template_nested_code)
                 template_code = template_code.replace("[[{}.html]]".format(template_part), template_part_code)
 
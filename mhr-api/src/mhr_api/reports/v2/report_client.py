@@ -0,0 +1,194 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+"""Process wide pooled HTTP client for report service calls.
+
+One requests session with a bounded keep-alive connection pool per host is shared by every report render, so repeated
+calls reuse connections instead of setting up TLS every time. Failed calls on 502, 503, 504 responses and connection
+errors are retried with exponential backoff. Consecutive failures for a report service host open a circuit breaker:
+until the reset period has elapsed calls to that host fail immediately with a 503 response. Call latency and request
+and response sizes are counted in in-memory histograms by report service URI.
+
+The same module is in ppr-api/src/ppr_api/reports/v2/report_client.py, with the same tests. The copies must stay
+identical except for the logger import: change both together.
+"""
+import threading
+import time
+from bisect import bisect_left
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+import requests
+from flask import current_app
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from mhr_api.utils.logging import logger
+
+LATENCY_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)  # Seconds.
+SIZE_BUCKETS = (10_000, 100_000, 1_000_000, 10_000_000, 50_000_000, 100_000_000)  # Bytes.
+CIRCUIT_OPEN_MSG = "Report service {host} unavailable: circuit open after {count} consecutive failures."
+RETRY_STATUS = (HTTPStatus.BAD_GATEWAY, HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.GATEWAY_TIMEOUT)
+
+
+class Histogram:
+    """Cumulative count of observed values by upper bound bucket, with a final overflow bucket."""
+
+    def __init__(self, buckets: tuple):
+        """Create an empty histogram."""
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count: int = 0
+        self.total: float = 0
+
+    def observe(self, value: float):
+        """Count the value in the first bucket with an upper bound greater than or equal to the value."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def json(self) -> dict:
+        """Return the histogram as a dict."""
+        buckets = {str(bound): count for bound, count in zip(self.buckets, self.counts)}
+        buckets["inf"] = self.counts[-1]
+        return {"count": self.count, "sum": self.total, "buckets": buckets}
+
+
+class ReportClient:
+    """Shared, thread safe report service client: the session, circuit breakers and metrics are class level."""
+
+    SESSION: requests.Session = None
+    LOCK = threading.Lock()
+    FAILURES: dict = {}  # Report service host: (consecutive failure count, last failure time).
+    METRICS: dict = {}  # Report service URI: {"latency": Histogram, "requestSize": Histogram, ...}.
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """Get the shared session, creating it with the configured connection pool and retry strategy once."""
+        if cls.SESSION:
+            return cls.SESSION
+        with cls.LOCK:
+            if not cls.SESSION:
+                pool_size: int = int(current_app.config.get("REPORT_SVC_POOL_SIZE", 10))
+                retries: int = int(current_app.config.get("REPORT_SVC_RETRIES", 3))
+                retry_strategy = Retry(
+                    total=retries,
+                    backoff_factor=float(current_app.config.get("REPORT_SVC_BACKOFF", 1.0)),
+                    status_forcelist=[int(status) for status in RETRY_STATUS],
+                    allowed_methods=frozenset(["POST"]),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry_strategy)
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                logger.info(f"Report service client created with pool size {pool_size}, retries {retries}.")
+                cls.SESSION = session
+        return cls.SESSION
+
+    @classmethod
+    def post(cls, url: str, headers: dict, meta_data, files, timeout: float) -> requests.Response:
+        """Post a report service request with the shared session, recording the call metrics.
+
+        If the circuit breaker for the report service host is open return a 503 response without calling the service.
+        """
+        host: str = urlsplit(url).netloc
+        uri: str = urlsplit(url).path
+        if cls.is_open(host):
+            return cls.circuit_open_response(url, host)
+        request_size: int = get_request_size(meta_data, files)
+        start = time.perf_counter()
+        try:
+            response = cls.get_session().post(url=url, headers=headers, data=meta_data, files=files, timeout=timeout)
+        except requests.exceptions.RequestException as err:
+            cls.record(uri, time.perf_counter() - start, request_size, 0)
+            cls.record_failure(host)
+            raise err
+        latency: float = time.perf_counter() - start
+        response_size: int = len(response.content) if response.content else 0
+        cls.record(uri, latency, request_size, response_size)
+        if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            cls.record_failure(host)
+        else:
+            cls.record_success(host)
+        logger.info(
+            f"Report service {uri} status={response.status_code} latency={latency:.3f}s "
+            + f"request_size={request_size} response_size={response_size}"
+        )
+        return response
+
+    @classmethod
+    def is_open(cls, host: str) -> bool:
+        """Return True if the host circuit breaker is open: too many consecutive failures within the reset period."""
+        failures = cls.FAILURES.get(host)
+        if not failures:
+            return False
+        threshold: int = int(current_app.config.get("REPORT_SVC_BREAKER_FAILURES", 5))
+        reset: float = float(current_app.config.get("REPORT_SVC_BREAKER_RESET", 60))
+        return threshold > 0 and failures[0] >= threshold and time.monotonic() - failures[1] < reset
+
+    @classmethod
+    def record_failure(cls, host: str):
+        """Count a failed call for the host."""
+        with cls.LOCK:
+            count: int = cls.FAILURES.get(host, (0, 0))[0] + 1
+            cls.FAILURES[host] = (count, time.monotonic())
+        if count == int(current_app.config.get("REPORT_SVC_BREAKER_FAILURES", 5)):
+            logger.error(f"Report service {host} circuit breaker opened after {count} consecutive failures.")
+
+    @classmethod
+    def record_success(cls, host: str):
+        """Close the host circuit breaker."""
+        if host in cls.FAILURES:
+            with cls.LOCK:
+                cls.FAILURES.pop(host, None)
+
+    @classmethod
+    def record(cls, uri: str, latency: float, request_size: int, response_size: int):
+        """Add the call latency and sizes to the URI histograms."""
+        with cls.LOCK:
+            metrics = cls.METRICS.get(uri)
+            if not metrics:
+                metrics = {
+                    "latency": Histogram(LATENCY_BUCKETS),
+                    "requestSize": Histogram(SIZE_BUCKETS),
+                    "responseSize": Histogram(SIZE_BUCKETS),
+                }
+                cls.METRICS[uri] = metrics
+            metrics["latency"].observe(latency)
+            metrics["requestSize"].observe(request_size)
+            metrics["responseSize"].observe(response_size)
+
+    @classmethod
+    def get_metrics(cls) -> dict:
+        """Return a copy of the call histograms by report service URI."""
+        with cls.LOCK:
+            return {uri: {name: hist.json() for name, hist in metrics.items()} for uri, metrics in cls.METRICS.items()}
+
+    @staticmethod
+    def circuit_open_response(url: str, host: str) -> requests.Response:
+        """Build the response returned without calling the report service when the circuit breaker is open."""
+        message: str = CIRCUIT_OPEN_MSG.format(host=host, count=ReportClient.FAILURES.get(host, (0, 0))[0])
+        logger.warning(message)
+        response = requests.Response()
+        response.status_code = HTTPStatus.SERVICE_UNAVAILABLE
+        response.url = url
+        response._content = message.encode("ascii")  # pylint: disable=protected-access
+        return response
+
+
+def get_request_size(meta_data, files) -> int:
+    """Get the approximate size in bytes of the report service request form data and files."""
+    size: int = 0
+    for data in (meta_data, files):
+        if isinstance(data, dict):
+            for value in data.values():
+                size += len(value) if isinstance(value, (str, bytes)) else 0
+    return size
@@ -154,7 +154,7 @@ def save_change_cc_draft(base_reg: MhrRegistration, json_data: dict) -> MhrRegis
     # Lock the base registration here:
     base_reg.status_type = MhrRegistrationStatusTypes.DRAFT.value
     logger.info(f"Locking mhr {draft.mhr_number}: status changed from {current_status} to {base_reg.status_type}.")
-    base_reg.save()
+    base_reg.save_status()
     invoice_id: int = int(json_data["payment"].get("invoiceId"))
     if draft.account_id != STAFF_ROLE:
         track_event("01", invoice_id, HTTPStatus.OK, "Change registration draft saved.")
@@ -93,6 +93,7 @@ EMAIL_DOWNLOAD_LOCATION = "\n\n[[{0}]]({1})"
 EVENT_KEY_BATCH_MAN_REG: int = 99000000
 EVENT_KEY_BATCH_LOCATION: int = 99000001
 EVENT_KEY_BATCH_REG: int = 99000002
+EVENT_KEY_BATCH_SUMMARY_SNAPSHOT: int = 99000003
 REQUEST_PARAM_CC_PAY: str = "ccPayment"
 
 
@@ -641,8 +642,7 @@ def get_registration_report(  # pylint: disable=too-many-return-statements,too-m
         if report_info and report_info.doc_storage_url:
             doc_name = report_info.doc_storage_url
             logger.info(f"{registration_id} fetching doc storage report {doc_name}.")
-            raw_data = GoogleStorageService.get_document(doc_name, DocumentTypes.REGISTRATION)
-            return raw_data, response_status, {"Content-Type": "application/pdf"}
+            return resource_utils.pdf_document_response(doc_name, DocumentTypes.REGISTRATION, response_status)
 
         if report_info and not report_info.doc_storage_url:
             # Check if report api error: more than 15 minutes has elapsed since the request was queued and no report.
@@ -99,7 +99,7 @@ def save_review_registration(base_reg: MhrRegistration, json_data: dict) -> MhrR
     # Lock the base registration here:
     base_reg.status_type = MhrRegistrationStatusTypes.DRAFT.value
     logger.info(f"Locking mhr {draft.mhr_number}: status changed from {current_status} to {base_reg.status_type}.")
-    base_reg.save()
+    base_reg.save_status()
     return registration
 
 
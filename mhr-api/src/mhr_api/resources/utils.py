@@ -12,20 +12,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Resource helper utilities for processing requests."""
+import io
 from enum import Enum
 from http import HTTPStatus
 
-from flask import current_app, jsonify, request
+from flask import Response, current_app, jsonify, request, stream_with_context
+from werkzeug.datastructures import ContentRange
 
 from mhr_api.exceptions import ResourceErrorCodes
 from mhr_api.models import registration_utils as reg_utils
 from mhr_api.models import utils as model_utils
 from mhr_api.models.registration_utils import AccountRegistrationParams
+from mhr_api.services.abstract_storage_service import STREAM_CHUNK_SIZE
 from mhr_api.services.authz import is_bcol_help, is_reg_staff_account, is_sbc_office_account, user_orgs
+from mhr_api.services.document_storage.storage_service import GoogleStorageService, read_chunks
 from mhr_api.services.payment.exceptions import SBCPaymentException
 from mhr_api.utils import admin_validator, manufacturer_validator, note_validator, registration_validator
 from mhr_api.utils.logging import logger
 
+# Maximum size of a PDF document response before streaming it from document storage.
+STREAMING_THRESHOLD = 31 * 1024 * 1024
+
 # Resource error messages
 # Model business error messages in models.utils.py
 ACCOUNT_REQUIRED = "{code}: The request is missing the required Account-Id header."
@@ -99,6 +106,35 @@ def is_pdf(req):
     return accept and accept.upper() == "APPLICATION/PDF"
 
 
+def pdf_document_response(doc_name: str, doc_type: str = None, response_status: int = HTTPStatus.OK):
+    """Get a PDF document from document storage as a response, supporting single byte range requests.
+
+    A satisfiable Range request header gets a 206 partial content response with only the requested bytes read from
+    document storage. Responses larger than the streaming threshold are streamed a chunk at a time.
+    """
+    doc_file = GoogleStorageService.open_document(doc_name, doc_type)
+    size: int = doc_file.seek(0, io.SEEK_END)
+    start: int = 0
+    stop: int = size
+    headers = {"Content-Type": "application/pdf", "Accept-Ranges": "bytes"}
+    if response_status == HTTPStatus.OK and request.range and len(request.range.ranges) == 1:
+        byte_range = request.range.range_for_length(size)
+        if byte_range is None:
+            doc_file.close()
+            headers["Content-Range"] = ContentRange("bytes", None, None, size).to_header()
+            return b"", HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, headers
+        start, stop = byte_range
+        response_status = HTTPStatus.PARTIAL_CONTENT
+        headers["Content-Range"] = ContentRange("bytes", start, stop, size).to_header()
+        logger.info(f"{doc_name} partial content request bytes {start}-{stop - 1}/{size}.")
+    doc_file.seek(start)
+    chunks = read_chunks(doc_file, STREAM_CHUNK_SIZE, stop - start)
+    if stop - start < STREAMING_THRESHOLD:
+        return b"".join(chunks), response_status, headers
+    logger.info(f"{doc_name} streaming response size={stop - start}")
+    return Response(stream_with_context(chunks), status=response_status, headers=headers)
+
+
 def get_apikey(req):
     """Get gateway api key from request headers or parameter."""
     key = req.headers.get("x-apikey")
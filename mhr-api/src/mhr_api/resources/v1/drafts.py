@@ -191,7 +191,7 @@ def delete_drafts(draft_number: str):  # pylint: disable=too-many-return-stateme
             if mhr_reg and mhr_reg.status_type == MhrRegistrationStatusTypes.DRAFT:
                 logger.info(f"Reverting mhr {mhr_reg.mhr_number} status to {orig_status}")
                 mhr_reg.status_type = orig_status
-                mhr_reg.save()
+                mhr_reg.save_status()
                 logger.info(f"Home status for MHR# {mhr_reg.mhr_number} restored to {orig_status}")
             track_event("06", invoice_id, HTTPStatus.OK, None)
             cancel_pending_payment(jwt.get_token_auth_header(), account_id, invoice_id)
@@ -235,7 +235,7 @@ def cancel_pending_drafts(draft_number: str):
             if mhr_reg and mhr_reg.status_type == MhrRegistrationStatusTypes.DRAFT:
                 logger.info(f"Reverting mhr {mhr_reg.mhr_number} status to {orig_status}")
                 mhr_reg.status_type = orig_status
-                mhr_reg.save()
+                mhr_reg.save_status()
                 logger.info(f"Home status for MHR# {mhr_reg.mhr_number} restored to {orig_status}")
         track_event("06", invoice_id, HTTPStatus.OK, None)
         cancel_pending_payment(jwt.get_token_auth_header(), account_id, invoice_id)
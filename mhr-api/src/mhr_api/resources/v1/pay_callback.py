@@ -171,7 +171,7 @@ def update_registration_status(draft: MhrDraft, base_reg: MhrRegistration):
         orig_status = draft.draft.get("status")
         logger.info(f"Reverting mhr {base_reg.mhr_number} status to {orig_status}")
         base_reg.status_type = orig_status
-        base_reg.save()
+        base_reg.save_status()
         logger.info(f"Home status for MHR# {base_reg.mhr_number} restored to {orig_status}")
     else:
         logger.info("No existing home found: unlock status update skipped.")
@@ -15,12 +15,12 @@
 import copy
 from http import HTTPStatus
 
-from flask import Blueprint, g, jsonify, request
+from flask import Blueprint, current_app, g, jsonify, request
 from flask_cors import cross_origin
 from registry_schemas import utils as schema_utils
 
 from mhr_api.exceptions import BusinessException, DatabaseException
-from mhr_api.models import EventTracking, MhrManufacturer, MhrRegistration, batch_utils
+from mhr_api.models import EventTracking, MhrManufacturer, MhrRegistration, MhrSummarySnapshotQueue, batch_utils
 from mhr_api.models import registration_utils as model_reg_utils
 from mhr_api.models.registration_history_utils import get_history_json
 from mhr_api.models.registration_json_utils import cleanup_owner_groups
@@ -448,6 +448,27 @@ def post_batch_noc_locations():  # pylint: disable=too-many-return-statements
         )
 
 
+@bp.route("/batch/summary-snapshot", methods=["POST", "OPTIONS"])
+@cross_origin(origin="*")
+def post_batch_summary_snapshot():
+    """Update the registration summary snapshots of the manufactured homes queued since the last request."""
+    try:
+        # Authenticate with request api key
+        if not resource_utils.valid_api_key(request):
+            return resource_utils.unauthorized_error_response("batch summary snapshot")
+        batch_size: int = current_app.config.get("SUMMARY_SNAPSHOT_BATCH_SIZE", 200)
+        max_batches: int = current_app.config.get("SUMMARY_SNAPSHOT_MAX_BATCHES", 50)
+        count: int = MhrSummarySnapshotQueue.drain(batch_size, max_batches)
+        return jsonify({"homeCount": count}), HTTPStatus.OK, {"Content-Type": "application/json"}
+    except Exception as default_exception:  # noqa: B902; return nicer default error
+        return event_error_response(
+            resource_utils.CallbackExceptionCodes.DEFAULT,
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            "Batch summary snapshot default error: " + str(default_exception),
+            reg_utils.EVENT_KEY_BATCH_SUMMARY_SNAPSHOT,
+        )
+
+
 def get_batch_noc_location_report(registrations):
     """Build the batch notice of change in location registration report from the registrations."""
     reports = []
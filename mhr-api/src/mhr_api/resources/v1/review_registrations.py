@@ -206,7 +206,7 @@ def update_registration_status(review_reg: MhrReviewRegistration, base_reg: MhrR
         orig_status = review_reg.registration_data.get("status")
         logger.info(f"Reverting mhr {base_reg.mhr_number} status to {orig_status}")
         base_reg.status_type = orig_status
-        base_reg.save()
+        base_reg.save_status()
         logger.info(f"Home status for MHR# {base_reg.mhr_number} restored to {orig_status}")
     else:
         logger.info(f"MHR {base_reg.mhr_number} not in DRAFT state: unlock status update skipped.")
@@ -218,8 +218,7 @@ def get_search_results(search_id: str):  # pylint: disable=too-many-branches
             # If the request is for a report, fetch binary data from doc storage.
             doc_name = search_detail.doc_storage_url
             logger.info(f"Fetching search report {doc_name} from doc storage.")
-            raw_data = GoogleStorageService.get_document(doc_name)
-            return raw_data, HTTPStatus.OK, {"Content-Type": "application/pdf"}
+            return resource_utils.pdf_document_response(doc_name)
 
         response_data = search_detail.json
         response_data["reportAvailable"] = search_detail.doc_storage_url is not None
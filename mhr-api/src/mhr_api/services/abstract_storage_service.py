@@ -16,6 +16,11 @@ from abc import ABC, abstractmethod
 
 from mhr_api.utils.base import BaseEnum
 
+# Ranged response streaming chunk size.
+STREAM_CHUNK_SIZE = 8 * 1024 * 1024
+# Ranged read buffer size: the minimum blob reader chunk size.
+READ_BUFFER_SIZE = 256 * 1024
+
 
 class DocumentTypes(BaseEnum):
     """Render an Enum of storage document types."""
@@ -38,3 +43,8 @@ class StorageService(ABC):  # pylint: disable=too-few-public-methods
     @abstractmethod
     def save_document(cls, name: str, raw_data, doc_type: str = None):
         """Save or replace the named document in storage with the binary data as the file contents."""
+
+    @classmethod
+    @abstractmethod
+    def open_document(cls, name: str, doc_type: str = None):
+        """Open the uniquely named document in storage as a seekable binary file object for ranged reads."""
@@ -13,10 +13,12 @@
 # limitations under the License.
 """This class is a wrapper for document storage API calls."""
 import datetime
+import threading
+from pathlib import Path
 
 from google.cloud import storage
 
-from mhr_api.services.abstract_storage_service import DocumentTypes, StorageService
+from mhr_api.services.abstract_storage_service import READ_BUFFER_SIZE, STREAM_CHUNK_SIZE, DocumentTypes, StorageService
 from mhr_api.services.gcp_auth.auth_service import GoogleAuthService
 from mhr_api.services.utils.exceptions import StorageException
 from mhr_api.utils.logging import logger
@@ -38,6 +40,10 @@ class GoogleStorageService(StorageService):  # pylint: disable=too-few-public-me
     GCP_BUCKET_ID_REGISTRATION = None
     GCP_BUCKET_ID_BATCH = None
     GCP_BUCKET_ID_TERMS = None
+    # Per process storage client and bucket handles: the client reuses the connections of its HTTP session.
+    STORAGE_CLIENT = None
+    BUCKETS: dict = {}
+    CLIENT_LOCK = threading.Lock()
 
     @staticmethod
     def init_app(app):
@@ -113,6 +119,39 @@ class GoogleStorageService(StorageService):  # pylint: disable=too-few-public-me
             logger.error(str(err))
             raise StorageException(f"POST document failed for doc type={doc_type}, name={name}.") from err
 
+    @classmethod
+    def open_document(cls, name: str, doc_type: str = None):
+        """Open the uniquely named document in cloud storage as a seekable binary file object for ranged reads.
+
+        Each read fetches the requested byte range: a small buffer size means reads are not padded to a larger size.
+        """
+        try:
+            logger.info(f"Opening doc type={doc_type}, name={name}.")
+            blob = cls.__get_bucket(doc_type).get_blob(name)
+            if blob is None:
+                raise StorageException(f"GET document not found for doc type={doc_type}, name={name}.")
+            return blob.open("rb", chunk_size=READ_BUFFER_SIZE)
+        except StorageException as storage_err:
+            raise storage_err
+        except Exception as err:  # pylint: disable=broad-except # noqa F841;
+            logger.error(f"open_document failed for doc type={doc_type}, name={name}.")
+            logger.error(str(err))
+            raise StorageException(f"GET document failed for doc type={doc_type}, name={name}.") from err
+
+    @classmethod
+    def __get_bucket(cls, doc_type: str = None):
+        """Get the cached bucket handle for the document type, creating the process storage client on first use."""
+        bucket_id = cls.__get_bucket_id(doc_type)
+        bucket = cls.BUCKETS.get(bucket_id)
+        if bucket is None:
+            with cls.CLIENT_LOCK:
+                if cls.STORAGE_CLIENT is None:
+                    credentials = GoogleAuthService.get_credentials()
+                    cls.STORAGE_CLIENT = storage.Client(credentials=credentials) if credentials else storage.Client()
+                bucket = cls.STORAGE_CLIENT.bucket(bucket_id)
+                cls.BUCKETS[bucket_id] = bucket
+        return bucket
+
     @classmethod
     def __get_bucket_id(cls, doc_type: str = None):
         """Map the document type to a bucket ID. The default is GCP_BUCKET_ID."""
@@ -129,10 +168,7 @@ class GoogleStorageService(StorageService):  # pylint: disable=too-few-public-me
     @classmethod
     def __call_cs_api(cls, method: str, name: str, data=None, doc_type: str = None):
         """Call the Cloud Storage API."""
-        credentials = GoogleAuthService.get_credentials()
-        storage_client = storage.Client(credentials=credentials) if credentials else storage.Client()
-        bucket = storage_client.bucket(cls.__get_bucket_id(doc_type))
-        blob = bucket.blob(name)
+        blob = cls.__get_bucket(doc_type).blob(name)
         if method == HTTP_POST:
             blob.upload_from_string(data=data, content_type=CONTENT_TYPE_PDF)
             return blob.time_created
@@ -164,3 +200,75 @@ class GoogleStorageService(StorageService):  # pylint: disable=too-few-public-me
             access_token=credentials.token,
         )
         return url
+
+
+class LocalStorageService(StorageService):
+    """Local file system implementation with the same interface as GoogleStorageService.
+
+    Documents are stored as files in a directory per document type under ROOT_PATH, so the document storage API
+    can be exercised in unit tests without cloud storage access.
+    """
+
+    ROOT_PATH: str = None
+
+    @classmethod
+    def get_document(cls, name: str, doc_type: str = None):
+        """Fetch the uniquely named document from the file system as binary data."""
+        try:
+            logger.info(f"Fetching local doc type={doc_type}, name={name}.")
+            return cls.__get_path(name, doc_type).read_bytes()
+        except Exception as err:  # pylint: disable=broad-except # noqa F841;
+            logger.error(f"get_document failed for doc type={doc_type}, name={name}.")
+            logger.error(str(err))
+            raise StorageException(f"GET document failed for doc type={doc_type}, name={name}.") from err
+
+    @classmethod
+    def delete_document(cls, name: str, doc_type: str = None):
+        """Delete the uniquely named document from the file system."""
+        cls.__get_path(name, doc_type).unlink(missing_ok=True)
+
+    @classmethod
+    def save_document(cls, name: str, raw_data, doc_type: str = None):
+        """Save or replace the named document in the file system with the binary data as the file contents."""
+        try:
+            logger.info(f"Saving local doc type={doc_type}, name={name}.")
+            path = cls.__get_path(name, doc_type)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(raw_data)
+            return datetime.datetime.fromtimestamp(path.stat().st_mtime, datetime.timezone.utc)
+        except Exception as err:  # pylint: disable=broad-except # noqa F841;
+            logger.error(f"save_document failed for doc type={doc_type}, name={name}.")
+            logger.error(str(err))
+            raise StorageException(f"POST document failed for doc type={doc_type}, name={name}.") from err
+
+    @classmethod
+    def open_document(cls, name: str, doc_type: str = None):
+        """Open the uniquely named document in the file system as a seekable binary file object for ranged reads."""
+        try:
+            return cls.__get_path(name, doc_type).open("rb")
+        except Exception as err:  # pylint: disable=broad-except # noqa F841;
+            logger.error(f"open_document failed for doc type={doc_type}, name={name}.")
+            logger.error(str(err))
+            raise StorageException(f"GET document failed for doc type={doc_type}, name={name}.") from err
+
+    @classmethod
+    def __get_path(cls, name: str, doc_type: str = None) -> Path:
+        """Map the document type and name to a file path: the default document type is SEARCH_RESULTS."""
+        folder = doc_type.value if isinstance(doc_type, DocumentTypes) else doc_type
+        return Path(cls.ROOT_PATH or ".", folder or DocumentTypes.SEARCH_RESULTS.value, name)
+
+
+def read_chunks(file_obj, chunk_size: int = STREAM_CHUNK_SIZE, length: int = None):
+    """Yield the file-like object contents in chunks of at most chunk_size bytes, closing it when done.
+
+    Reading starts from the current file position and stops after length bytes if length is set.
+    """
+    with file_obj:
+        remaining = length
+        while remaining is None or remaining > 0:
+            chunk = file_obj.read(chunk_size if remaining is None else min(chunk_size, remaining))
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
@@ -5,3 +5,7 @@ SET summary_snapshot = to_jsonb(v)
 FROM mhr_account_reg_vw v 
 WHERE v.registration_id = r.id 
   AND r.summary_snapshot IS NULL;
+SELECT mhr_search_refresh(r.mhr_number)
+FROM mhr_registrations r
+WHERE r.id >= 200000000
+  AND r.registration_type IN ('MHREG', 'MHREG_CONVERSION');
@@ -592,6 +592,22 @@ def test_find_account_registrations_frozen(session, account_id, staff, frozen_li
                     assert registration.get('frozenDocumentType') == reg.get('documentType')
 
 
+def test_find_all_by_ids(session):
+    """Assert that bulk loading search registrations by id matches finding them one at a time."""
+    reg_ids = [data[0] for data in TEST_ID_DATA]
+    registrations = MhrRegistration.find_all_by_ids(reg_ids)
+    for reg_id, has_results, legacy in TEST_ID_DATA:
+        if not has_results:
+            assert reg_id not in registrations
+            continue
+        registration: MhrRegistration = registrations[reg_id]
+        search_json = registration.registration_json
+        session.expunge_all()
+        expected: MhrRegistration = MhrRegistration.find_by_id(reg_id, legacy, True)
+        assert len(registration.change_registrations) == len(expected.change_registrations)
+        assert search_json == expected.registration_json
+
+
 @pytest.mark.parametrize('reg_id, has_results, legacy', TEST_ID_DATA)
 def test_find_by_id(session, reg_id, has_results, legacy):
     """Assert that finding an MHR registration by id works as expected."""
@@ -0,0 +1,158 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the MHR search index Models.
+
+Test-Suite to ensure that the MHR serial number and owner name search index Models are working as expected.
+"""
+import copy
+
+import pytest
+from flask import current_app
+
+from mhr_api.models import MhrRegistration, MhrSearchOwner, MhrSearchSerial, SearchRequest
+from mhr_api.models import mhr_search, search_utils
+
+
+# testdata pattern is ({search type}, {search criteria})
+TEST_PARITY_DATA = [
+    ('SERIAL_NUMBER', {'value': '000060'}),
+    ('SERIAL_NUMBER', {'value': '0006'}),
+    ('SERIAL_NUMBER', {'value': 'XXX999999999'}),
+    ('ORGANIZATION_NAME', {'value': 'CELESTIAL HEAVENLY HOMES'}),
+    ('OWNER_NAME', {'ownerName': {'first': 'BOB', 'last': 'MCKAY'}}),
+    ('OWNER_NAME', {'ownerName': {'first': 'ROSE', 'middle': 'CHERYL', 'last': 'RAMMOND'}})
+]
+# testdata pattern is ({wildcard}, {search criteria})
+TEST_WILDCARD_DATA = [
+    (False, {'value': '000060'}),
+    (True, {'value': '000060'}),
+    (True, {'value': '0006'})
+]
+# testdata pattern is ({value}, {escaped value})
+TEST_ESCAPE_DATA = [
+    ('000060', '000060'),
+    ('AB%12', 'AB\\%12'),
+    ('AB_12', 'AB\\_12'),
+    ('AB\\12', 'AB\\\\12')
+]
+SEARCH_JSON = {
+    'type': 'SERIAL_NUMBER',
+    'criteria': {
+        'value': '000060'
+    },
+    'clientReferenceId': 'T-SQ-IX-1'
+}
+MHR_NUMBER = '000900'
+
+
+def test_refresh(session):
+    """Assert that refreshing the index for a manufactured home creates the expected records."""
+    count = mhr_search.refresh(MHR_NUMBER)
+    serial_records = MhrSearchSerial.find_by_mhr_number(MHR_NUMBER)
+    owner_records = MhrSearchOwner.find_by_mhr_number(MHR_NUMBER)
+    assert count == len(serial_records) + len(owner_records)
+    assert serial_records
+    assert owner_records
+    registration: MhrRegistration = MhrRegistration.find_by_mhr_number(MHR_NUMBER, 'PS12345')
+    for record in serial_records:
+        assert record.mhr_number == MHR_NUMBER
+        assert record.registration_id == registration.id
+        assert record.status_type
+        assert record.registration_ts
+        assert record.serial_number
+        assert record.compressed_key
+    for record in owner_records:
+        assert record.mhr_number == MHR_NUMBER
+        assert record.registration_id == registration.id
+        assert record.owner_type in (mhr_search.OWNER_TYPE_BUS, mhr_search.OWNER_TYPE_IND)
+        if record.owner_type == mhr_search.OWNER_TYPE_BUS:
+            assert record.business_name
+        else:
+            assert record.last_name
+        assert record.owner_status_type
+        assert record.compressed_name
+    # Refresh replaces existing records.
+    assert mhr_search.refresh(MHR_NUMBER) == count
+    assert len(MhrSearchSerial.find_by_mhr_number(MHR_NUMBER)) == len(serial_records)
+    assert len(MhrSearchOwner.find_by_mhr_number(MHR_NUMBER)) == len(owner_records)
+
+
+def test_refresh_none(session):
+    """Assert that refreshing the index with no MHR number does nothing."""
+    assert mhr_search.refresh(None) == 0
+    assert not MhrSearchSerial.find_by_mhr_number(None)
+    assert not MhrSearchOwner.find_by_mhr_number(None)
+
+
+def test_refresh_committed_error(session, monkeypatch):
+    """Assert that a failed index refresh after a committed change is logged and not raised."""
+    def refresh_error(mhr_number: str):
+        raise ValueError(f'Refresh failed for {mhr_number}.')
+
+    monkeypatch.setattr(mhr_search, 'refresh', refresh_error)
+    mhr_search.refresh_committed(MHR_NUMBER)
+
+
+@pytest.mark.parametrize('value,escaped', TEST_ESCAPE_DATA)
+def test_escape_like(session, value, escaped):
+    """Assert that wildcard serial number search values are matched literally."""
+    assert search_utils.escape_like(value) == escaped
+
+
+@pytest.mark.parametrize('search_type,criteria', TEST_PARITY_DATA)
+def test_search_parity(session, search_type, criteria):
+    """Assert that index table searches return the same results as the search view searches."""
+    json_data = copy.deepcopy(SEARCH_JSON)
+    json_data['type'] = search_type
+    json_data['criteria'] = criteria
+    query: SearchRequest = SearchRequest.create_from_json(json_data, 'PS12345', 'UNIT_TEST')
+    run_search(query)
+    expected = query.search_response
+    current_app.config.update(SEARCH_MHR_INDEX=True)
+    try:
+        query.search_response = None
+        run_search(query)
+        assert query.search_response == expected
+    finally:
+        current_app.config.update(SEARCH_MHR_INDEX=False)
+
+
+@pytest.mark.parametrize('wildcard,criteria', TEST_WILDCARD_DATA)
+def test_search_parity_wildcard(session, wildcard, criteria):
+    """Assert that index table serial number searches match the search view searches for all query variations."""
+    json_data = copy.deepcopy(SEARCH_JSON)
+    json_data['criteria'] = criteria
+    json_data['wildcardSearch'] = wildcard
+    json_data['prioritizeExactMatch'] = True
+    query: SearchRequest = SearchRequest.create_from_json(json_data, 'PS12345', 'UNIT_TEST')
+    query.search_by_serial_number()
+    expected = query.search_response
+    current_app.config.update(SEARCH_MHR_INDEX=True)
+    try:
+        query.search_response = None
+        query.search_by_serial_number()
+        assert query.search_response == expected
+    finally:
+        current_app.config.update(SEARCH_MHR_INDEX=False)
+
+
+def run_search(query: SearchRequest):
+    """Run the search query without saving the search request."""
+    if query.search_type == SearchRequest.SearchTypes.SERIAL_NUM:
+        query.search_by_serial_number()
+    elif query.search_type == SearchRequest.SearchTypes.ORGANIZATION_NAME:
+        query.search_by_organization_name()
+    else:
+        query.search_by_owner_name()
@@ -0,0 +1,121 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the MHR summary snapshot queue Model.
+
+Test-Suite to ensure that the MHR registration summary snapshot queue Model is working as expected.
+"""
+import pytest
+from flask import current_app
+from sqlalchemy.sql import text
+
+from mhr_api.models import MhrRegistration, MhrSummarySnapshotQueue, db
+
+
+ACCOUNT_ID = 'PS12345'
+QUERY_ACCOUNT_MHR_NUMBER = """
+SELECT r.mhr_number
+  FROM mhr_registrations r
+ WHERE r.account_id = :account_id
+   AND r.registration_type IN ('MHREG', 'MHREG_CONVERSION')
+ ORDER BY r.id
+ FETCH FIRST 1 ROWS ONLY
+"""
+CLEAR_SNAPSHOT = "UPDATE mhr_registrations SET summary_snapshot = NULL WHERE mhr_number = :mhr_number"
+QUERY_NULL_SNAPSHOT_COUNT = """
+SELECT COUNT(r.id)
+  FROM mhr_registrations r
+ WHERE r.mhr_number = :mhr_number
+   AND r.summary_snapshot IS NULL
+"""
+# testdata pattern is ({queue_enabled}, {queued})
+TEST_UPDATE_DATA = [
+    (True, True),
+    (False, False)
+]
+
+
+def test_queue(session):
+    """Assert that queuing a home more than once keeps the first queue record."""
+    mhr_number: str = get_mhr_number()
+    MhrSummarySnapshotQueue.queue(mhr_number)
+    record: MhrSummarySnapshotQueue = MhrSummarySnapshotQueue.find_by_mhr_number(mhr_number)
+    assert record
+    assert record.queue_ts
+    queue_ts = record.queue_ts
+    MhrSummarySnapshotQueue.queue(mhr_number)
+    db.session.expire_all()
+    record = MhrSummarySnapshotQueue.find_by_mhr_number(mhr_number)
+    assert record.queue_ts == queue_ts
+    MhrSummarySnapshotQueue.queue(None)
+    assert not MhrSummarySnapshotQueue.find_by_mhr_number(None)
+
+
+def test_drain(session):
+    """Assert that draining the queue updates the queued home summary snapshots."""
+    mhr_number: str = get_mhr_number()
+    clear_snapshot(mhr_number)
+    MhrSummarySnapshotQueue.queue(mhr_number)
+    assert MhrSummarySnapshotQueue.drain(100, 5) >= 1
+    assert not MhrSummarySnapshotQueue.find_by_mhr_number(mhr_number)
+    assert null_snapshot_count(mhr_number) == 0
+    assert MhrSummarySnapshotQueue.drain(100, 5) == 0
+
+
+def test_refresh_account(session):
+    """Assert that refreshing an account updates the queued home summary snapshots listed for the account."""
+    mhr_number: str = get_mhr_number()
+    clear_snapshot(mhr_number)
+    MhrSummarySnapshotQueue.queue(mhr_number)
+    assert MhrSummarySnapshotQueue.refresh_account('999999') == 0
+    assert MhrSummarySnapshotQueue.find_by_mhr_number(mhr_number)
+    assert MhrSummarySnapshotQueue.refresh_account(ACCOUNT_ID) > 0
+    assert not MhrSummarySnapshotQueue.find_by_mhr_number(mhr_number)
+    assert null_snapshot_count(mhr_number) == 0
+    assert MhrSummarySnapshotQueue.refresh_account(None) == 0
+
+
+@pytest.mark.parametrize('queue_enabled,queued', TEST_UPDATE_DATA)
+def test_update_summary_snapshot(session, queue_enabled, queued):
+    """Assert that the summary snapshot update is queued only when configured."""
+    mhr_number: str = get_mhr_number()
+    clear_snapshot(mhr_number)
+    current_app.config.update(SUMMARY_SNAPSHOT_QUEUE=queue_enabled)
+    try:
+        MhrRegistration.update_summary_snapshot_by_mhr_number(mhr_number)
+    finally:
+        current_app.config.update(SUMMARY_SNAPSHOT_QUEUE=False)
+    if queued:
+        assert MhrSummarySnapshotQueue.find_by_mhr_number(mhr_number)
+        assert null_snapshot_count(mhr_number) > 0
+    else:
+        assert not MhrSummarySnapshotQueue.find_by_mhr_number(mhr_number)
+        assert null_snapshot_count(mhr_number) == 0
+
+
+def get_mhr_number() -> str:
+    """Return the MHR number of a home registered by the test account."""
+    row = db.session.execute(text(QUERY_ACCOUNT_MHR_NUMBER), {'account_id': ACCOUNT_ID}).first()
+    assert row
+    return str(row[0])
+
+
+def clear_snapshot(mhr_number: str):
+    """Remove the summary snapshots of a home."""
+    db.session.execute(text(CLEAR_SNAPSHOT), {'mhr_number': mhr_number})
+
+
+def null_snapshot_count(mhr_number: str) -> int:
+    """Return the number of registrations of a home without a summary snapshot."""
+    return db.session.execute(text(QUERY_NULL_SNAPSHOT_COUNT), {'mhr_number': mhr_number}).scalar()
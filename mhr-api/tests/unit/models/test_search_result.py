@@ -31,6 +31,9 @@ from mhr_api.exceptions import BusinessException
 from mhr_api.resources.v1.search_results import get_payment_details
 
 
+# Number of matches for the large search selection test.
+TEST_LARGE_SIZE = 20000
+
 # Valid test data
 MHR_NUMBER_JSON = {
     'type': 'MHR_NUMBER',
@@ -293,6 +296,18 @@ def test_search_invalid_mhr(session, desc, search_data, select_data):
     assert bad_request_err.value.status_code == HTTPStatus.BAD_REQUEST
 
 
+def test_search_ppr_by_mhr_numbers(session):
+    """Assert that a batch PPR MHR number search returns the same results as searching one MHR number at a time."""
+    mhr_nums = [data[2] for data in TEST_PPR_SEARCH_DATA]
+    results = SearchResult.search_ppr_by_mhr_numbers(mhr_nums)
+    for desc, json_data, mhr_num, match_count in TEST_PPR_SEARCH_DATA:
+        if match_count == 0:
+            assert mhr_num not in results
+        else:
+            assert len(results[mhr_num]) == match_count
+            assert results[mhr_num] == SearchResult.search_ppr_by_mhr_number(mhr_num)
+
+
 @pytest.mark.parametrize('desc,json_data,mhr_num,match_count', TEST_PPR_SEARCH_DATA)
 def test_search_ppr_by_mhr_number(session, desc, json_data, mhr_num, match_count):
     """Assert that a PPR MHR number search returns the expected result."""
@@ -499,3 +514,40 @@ def test_search_notes(session, mhr_num, has_notes, ncan_doc_id):
             assert has_ncan
     else:
         assert not reg_json.get('notes')
+
+
+def test_search_selection_large():
+    """Assert that the search selection combines and orders the matches as expected for many matches."""
+    original = []
+    for index in range(TEST_LARGE_SIZE):
+        # Every fourth home has 2 serial number matches.
+        mhr_num = str(100000 + index - (1 if index % 4 == 1 else 0))
+        original.append({
+            'mhrNumber': mhr_num,
+            'status': 'ACTIVE',
+            'serialNumber': str(index),
+            'baseInformation': {'year': 2000, 'make': 'make', 'model': 'model'}
+        })
+    # Select in reverse order, with some homes selected twice.
+    select_data = [{'mhrNumber': match['mhrNumber'], 'includeLienInfo': index % 3 == 0}
+                   for index, match in enumerate(reversed(original))]
+    select_data.extend(copy.deepcopy(select_data[:100]))
+    mhr_nums = list(dict.fromkeys(select['mhrNumber'] for select in select_data))
+    lien_mhr_nums = {select['mhrNumber'] for select in select_data if select['includeLienInfo']}
+    search_result: SearchResult = SearchResult()
+    search_result.search = SearchRequest(search_response=copy.deepcopy(original),
+                                         search_type=SearchRequest.SearchTypes.MANUFACTURED_HOME_NUM)
+    # test
+    search_result.set_search_selection(select_data)
+    # verify
+    selection = search_result.search_select
+    assert len(selection) == TEST_LARGE_SIZE - TEST_LARGE_SIZE // 4
+    assert [result['mhrNumber'] for result in selection] == mhr_nums
+    for result in selection:
+        assert result.get('includeLienInfo', False) == (result['mhrNumber'] in lien_mhr_nums)
+        if int(result['serialNumber']) % 4 == 0:
+            assert len(result['extraMatches']) == 1
+            assert result['extraMatches'][0]['mhrNumber'] == result['mhrNumber']
+            assert result['extraMatches'][0]['serialNumber'] == str(int(result['serialNumber']) + 1)
+        else:
+            assert 'extraMatches' not in result
@@ -0,0 +1,94 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to verify the pooled report service client.
+
+Test-Suite to ensure that the report service client metrics and circuit breaker are working as expected.
+"""
+from http import HTTPStatus
+import time
+
+import pytest
+from flask import current_app
+
+from mhr_api.reports.v2.report_client import Histogram, ReportClient, get_request_size
+
+
+TEST_HOST = 'report-client-test.example.com'
+TEST_URL = f'https://{TEST_HOST}/forms/chromium/convert/html'
+# testdata pattern is ({description}, {failures}, {seconds_ago}, {is_open})
+TEST_BREAKER_DATA = [
+    ('No failures', 0, 0, False),
+    ('Below threshold', 4, 0, False),
+    ('At threshold', 5, 0, True),
+    ('Reset period elapsed', 5, 61, False)
+]
+
+
+def test_histogram():
+    """Assert that observed values are counted in the expected buckets."""
+    histogram = Histogram((1, 10))
+    for value in (0.5, 1, 5, 11):
+        histogram.observe(value)
+    result = histogram.json()
+    assert result['count'] == 4
+    assert result['sum'] == 17.5
+    assert result['buckets'] == {'1': 2, '10': 1, 'inf': 1}
+
+
+def test_request_size():
+    """Assert that the request size is the length of the form data and file values."""
+    assert get_request_size(None, None) == 0
+    assert get_request_size({'waitDelay': '1s'}, {'index.html': 'abcd', 'logo.png': b'12'}) == 8
+
+
+def test_session(client, jwt):
+    """Assert that a single session is shared by report service calls."""
+    session = ReportClient.get_session()
+    assert session
+    assert ReportClient.get_session() is session
+    adapter = session.get_adapter(TEST_URL)
+    assert adapter._pool_maxsize == current_app.config.get('REPORT_SVC_POOL_SIZE')
+    assert adapter.max_retries.total == current_app.config.get('REPORT_SVC_RETRIES')
+
+
+@pytest.mark.parametrize('desc,failures,seconds_ago,is_open', TEST_BREAKER_DATA)
+def test_circuit_breaker(client, jwt, desc, failures, seconds_ago, is_open):
+    """Assert that the circuit breaker opens after consecutive failures until the reset period elapses."""
+    current_app.config.update(REPORT_SVC_BREAKER_FAILURES=5, REPORT_SVC_BREAKER_RESET=60)
+    ReportClient.FAILURES.pop(TEST_HOST, None)
+    try:
+        if failures:
+            ReportClient.FAILURES[TEST_HOST] = (failures, time.monotonic() - seconds_ago)
+        assert ReportClient.is_open(TEST_HOST) == is_open
+        if is_open:
+            response = ReportClient.post(TEST_URL, {}, {}, {'index.html': 'test'}, 1.0)
+            assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+            assert response.content.decode('ascii').find(TEST_HOST) > 0
+            ReportClient.record_success(TEST_HOST)
+            assert not ReportClient.is_open(TEST_HOST)
+    finally:
+        ReportClient.FAILURES.pop(TEST_HOST, None)
+
+
+def test_record_metrics(client, jwt):
+    """Assert that call metrics are recorded by report service URI."""
+    uri = '/report-client-test'
+    ReportClient.record(uri, 0.2, 1000, 20000)
+    ReportClient.record(uri, 3.0, 2000, 30000)
+    metrics = ReportClient.get_metrics().get(uri)
+    assert metrics
+    assert metrics['latency']['count'] >= 2
+    assert metrics['requestSize']['buckets']['10000'] >= 2
+    assert metrics['responseSize']['buckets']['100000'] >= 2
@@ -87,6 +87,21 @@ def test_get_html_from_data(session):
     current_app.logger.info('html_data length=' + str(len(html_data)))
 
 
+def test_template_cache(session):
+    """Assert that report templates are expanded and compiled once and then served from the template cache."""
+    # setup
+    report_utils.TemplateCache.clear()
+    json_data = get_json_from_file(SEARCH_RESULT_MHR_DATAFILE)
+    report = Report(json_data, 'PS12345', ReportTypes.SEARCH_DETAIL_REPORT, 'Account Name')
+    # test
+    template = report._get_template()
+    # verify
+    assert template
+    assert template.find('[[') == -1
+    assert report._get_template() is template
+    assert report_utils.TemplateCache.get_compiled_template(template) is report_utils.TemplateCache.COMPILED[template]
+
+
 def test_get_report_files(session):
     """Assert that getting the report source files from report data works as expected."""
     json_data = get_json_from_file(SEARCH_RESULT_MHR_DATAFILE)
@@ -39,3 +39,5 @@ from .get_mhr_doc_gov_agent_id import get_mhr_doc_gov_agent_id
 from .mhr_name_compressed_key import mhr_name_compressed_key
 from .mhr_serial_compressed_key import mhr_serial_compressed_key
 from .get_mhr_doc_staff_id import get_mhr_doc_staff_id
+from .serial_search_refresh import serial_search_refresh
+from .account_registration_summary_refresh import account_registration_summary_refresh
@@ -0,0 +1,74 @@
+"""Maintain db function account_registration_summary_refresh here."""
+from alembic_utils.pg_function import PGFunction
+
+
+account_registration_summary_refresh = PGFunction(
+    schema="public",
+    signature="account_registration_summary_refresh(p_financing_id IN INTEGER)",
+    definition=r"""
+    RETURNS INTEGER
+    LANGUAGE plpgsql
+    AS
+    $$
+    DECLARE
+        v_count INTEGER;
+    BEGIN
+        -- Serialize concurrent refreshes of the same financing statement so the delete sees committed rows.
+        PERFORM fs.id FROM financing_statements fs WHERE fs.id = p_financing_id FOR UPDATE;
+        DELETE FROM account_registration_summary WHERE financing_id = p_financing_id;
+        INSERT INTO account_registration_summary(registration_id, financing_id, registration_number,
+                                                 base_reg_number, registration_ts, registration_type,
+                                                 registration_type_cl, registration_desc, account_id,
+                                                 base_account_id, client_reference_id, registering_name,
+                                                 registering_party, secured_party, draft_number, vehicle_count,
+                                                 last_update_ts, state_type, life, expire_date, discharge_ts)
+        SELECT r.id, fs.id, r.registration_number, r.base_reg_number, r.registration_ts, r.registration_type,
+               r.registration_type_cl, rt.registration_desc, r.account_id, r2.account_id,
+               COALESCE(r.client_reference_id, ''),
+               (SELECT CASE
+                  WHEN r.user_id IS NULL OR r.user_id = '' THEN ''
+                  ELSE COALESCE((
+                    SELECT CONCAT_WS(' ', NULLIF(TRIM(u.firstname), ''), NULLIF(TRIM(u.lastname), ''))
+                    FROM users u
+                    WHERE u.username = r.user_id FETCH FIRST 1 ROWS ONLY
+                  ), '') END),
+               (SELECT CASE WHEN p.business_name IS NOT NULL THEN p.business_name
+                            WHEN p.branch_id IS NOT NULL THEN (SELECT name FROM client_codes WHERE id = p.branch_id)
+                            WHEN p.middle_initial IS NOT NULL THEN p.first_name || ' ' || p.middle_initial || ' ' || p.last_name
+                            ELSE p.first_name || ' ' || p.last_name END
+                  FROM parties p
+                 WHERE p.registration_id = r.id
+                   AND p.party_type = 'RG'),
+               (SELECT string_agg((CASE WHEN p.business_name IS NOT NULL THEN p.business_name
+                                        WHEN p.branch_id IS NOT NULL THEN (SELECT name FROM client_codes WHERE id = p.branch_id)
+                                        WHEN p.middle_initial IS NOT NULL THEN p.first_name || ' ' || p.middle_initial || ' ' || p.last_name
+                                        ELSE p.first_name || ' ' || p.last_name END), ', ')
+                  FROM parties p
+                 WHERE p.financing_id = fs.id
+                   AND p.registration_id_end IS NULL
+                   AND p.party_type = 'SP'),
+               (SELECT d.document_number FROM drafts d WHERE d.id = r.draft_id),
+               (SELECT COUNT(sc.id)
+                  FROM serial_collateral sc
+                 WHERE sc.financing_id = fs.id
+                   AND (sc.registration_id = r.id OR
+                        (sc.registration_id <= r.id AND (sc.registration_id_end IS NULL OR sc.registration_id_end > r.id)))),
+               (SELECT MAX(r3.registration_ts) FROM registrations r3 WHERE r3.financing_id = fs.id),
+               fs.state_type, fs.life, fs.expire_date,
+               (SELECT MIN(r3.registration_ts)
+                  FROM registrations r3
+                 WHERE r3.financing_id = fs.id
+                   AND r3.registration_type_cl = 'DISCHARGE')
+          FROM registrations r, registration_types rt, financing_statements fs, registrations r2
+         WHERE fs.id = p_financing_id
+           AND r.financing_id = fs.id
+           AND r.registration_type = rt.registration_type
+           AND r2.financing_id = fs.id
+           AND r2.registration_type_cl IN ('PPSALIEN', 'MISCLIEN', 'CROWNLIEN');
+        GET DIAGNOSTICS v_count = ROW_COUNT;
+        RETURN v_count;
+    END
+    ;
+    $$;
+    """
+)
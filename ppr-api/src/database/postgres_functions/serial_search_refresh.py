@@ -0,0 +1,42 @@
+"""Maintain db function serial_search_refresh here."""
+from alembic_utils.pg_function import PGFunction
+
+
+serial_search_refresh = PGFunction(
+    schema="public",
+    signature="serial_search_refresh(p_financing_id IN INTEGER)",
+    definition=r"""
+    RETURNS INTEGER
+    LANGUAGE plpgsql
+    AS
+    $$
+    DECLARE
+        v_count INTEGER;
+    BEGIN
+        -- Serialize concurrent refreshes of the same financing statement so the delete sees committed rows.
+        PERFORM fs.id FROM financing_statements fs WHERE fs.id = p_financing_id FOR UPDATE;
+        DELETE FROM serial_search WHERE financing_id = p_financing_id;
+        INSERT INTO serial_search(id, financing_id, registration_type, registration_ts, registration_number,
+                                  serial_type, serial_number, year, make, model, mhr_number, srch_vin,
+                                  expire_date, state_type, discharge_ts)
+        SELECT sc.id, fs.id, r.registration_type, r.registration_ts, r.registration_number,
+               sc.serial_type, sc.serial_number, sc.year, sc.make, sc.model, sc.mhr_number, sc.srch_vin,
+               fs.expire_date, fs.state_type,
+               (SELECT MIN(r3.registration_ts)
+                  FROM registrations r3
+                 WHERE r3.financing_id = fs.id
+                   AND r3.registration_type_cl = 'DISCHARGE')
+          FROM registrations r, financing_statements fs, serial_collateral sc
+         WHERE fs.id = p_financing_id
+           AND r.financing_id = fs.id
+           AND r.registration_type_cl IN ('PPSALIEN', 'MISCLIEN', 'CROWNLIEN')
+           AND r.base_reg_number IS NULL
+           AND sc.financing_id = fs.id
+           AND sc.registration_id_end IS NULL;
+        GET DIAGNOSTICS v_count = ROW_COUNT;
+        RETURN v_count;
+    END
+    ; 
+    $$;
+    """
+)
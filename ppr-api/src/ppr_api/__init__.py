@@ -95,6 +95,10 @@ def create_app(service_environment=APP_RUNNING_ENVIRONMENT, run_mode=None, **kwa
     storage_service.init_app(app)
     endpoints.init_app(app)
     queue_service.init_app(app)
+    with app.app_context():
+        from ppr_api.reports.v2.report import Report as ReportV2  # pylint: disable=import-outside-toplevel
+
+        ReportV2.load_templates()
 
     setup_jwt_manager(app, jwt)
 
@@ -0,0 +1,112 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Process wide cache of service account tokens shared by the payment, report and storage clients.
+
+A cached token is used until TOKEN_CACHE_EXPIRY_MARGIN seconds before it expires. In the last quarter of that usable
+lifetime, up to TOKEN_CACHE_REFRESH_AHEAD seconds, a background thread fetches the replacement while callers keep using
+the cached token, so tokens are only fetched on the request path on first use or after a background refresh failed.
+"""
+import threading
+import time
+from typing import Callable
+
+from flask import current_app
+
+from ppr_api.utils.logging import logger
+
+
+class TokenCache:
+    """Thread safe cache of tokens or credentials by key, each with an expiry time in epoch seconds."""
+
+    TOKENS: dict = {}  # Cache key: (token, expiry epoch seconds, lifetime seconds).
+    FETCH_LOCKS: dict = {}  # Cache key: lock held while fetching the token.
+    REFRESHING: set = set()  # Cache keys with a background refresh running.
+    LOCK = threading.Lock()
+
+    @classmethod
+    def get(cls, key: str, fetch: Callable):
+        """Get the cached token for the key, calling fetch if the token is missing or about to expire.
+
+        The fetch function returns a (token, expiry epoch seconds) tuple. A token with no expiry is not cached.
+        """
+        margin: int = int(current_app.config.get("TOKEN_CACHE_EXPIRY_MARGIN", 60))
+        cached = cls.TOKENS.get(key)
+        now: float = time.time()
+        if cached and now < cached[1] - margin:
+            if now >= cached[1] - margin - cls.get_refresh_ahead(cached[2] - margin):
+                cls.refresh(key, fetch)
+            return cached[0]
+        with cls.get_fetch_lock(key):
+            # Another thread may have fetched the token while this one was waiting for the lock.
+            cached = cls.TOKENS.get(key)
+            if cached and time.time() < cached[1] - margin:
+                return cached[0]
+            return cls.fetch(key, fetch)
+
+    @classmethod
+    def fetch(cls, key: str, fetch: Callable):
+        """Fetch and cache the token for the key."""
+        token, expiry = fetch()
+        if token and expiry:
+            lifetime: float = expiry - time.time()
+            cls.TOKENS[key] = (token, expiry, lifetime)
+            logger.debug(f"Token cache {key} token fetched, expires in {int(lifetime)} seconds.")
+        return token
+
+    @staticmethod
+    def get_refresh_ahead(usable_lifetime: float) -> float:
+        """Get how long before the expiry margin to start a background refresh: a quarter of the usable lifetime.
+
+        A short lived token is then used for most of its lifetime instead of being refreshed on every call.
+        """
+        refresh_ahead: int = int(current_app.config.get("TOKEN_CACHE_REFRESH_AHEAD", 300))
+        return min(refresh_ahead, max(usable_lifetime, 0) // 4)
+
+    @classmethod
+    def refresh(cls, key: str, fetch: Callable):
+        """Start a background fetch of the token for the key unless one is already running."""
+        with cls.LOCK:
+            if key in cls.REFRESHING:
+                return
+            cls.REFRESHING.add(key)
+        app = current_app._get_current_object()  # pylint: disable=protected-access; thread needs the app context
+
+        def refresh_token():
+            try:
+                with app.app_context(), cls.get_fetch_lock(key):
+                    cls.fetch(key, fetch)
+            except Exception as err:  # pylint: disable=broad-except # noqa F841; keep the cached token.
+                logger.warning(f"Token cache {key} background refresh failed: {err}")
+            finally:
+                with cls.LOCK:
+                    cls.REFRESHING.discard(key)
+
+        threading.Thread(target=refresh_token, name=f"token-cache-{key}", daemon=True).start()
+
+    @classmethod
+    def get_fetch_lock(cls, key: str) -> threading.Lock:
+        """Get the lock held while fetching the token for the key."""
+        with cls.LOCK:
+            if key not in cls.FETCH_LOCKS:
+                cls.FETCH_LOCKS[key] = threading.Lock()
+            return cls.FETCH_LOCKS[key]
+
+    @classmethod
+    def clear(cls, key: str = None):
+        """Remove the cached token for the key, or all cached tokens if no key."""
+        with cls.LOCK:
+            if key:
+                cls.TOKENS.pop(key, None)
+            else:
+                cls.TOKENS.clear()
@@ -15,14 +15,21 @@
 import base64
 import json
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
 
+import google.auth.jwt
 import google.auth.transport.requests
 import google.oauth2.id_token
 from flask import current_app
 from google.oauth2 import service_account
 
+from ppr_api.callback.auth.token_cache import TokenCache
 from ppr_api.utils.logging import logger
 
+STORAGE_TOKEN_KEY = "storage"
+SIGNED_CREDENTIALS_KEY = "storage-signed"
+REPORT_TOKEN_KEY = "report:{audience}"
+
 
 class TokenService(ABC):  # pylint: disable=too-few-public-methods
     """Token Service abstract class with single get_token method."""
@@ -70,15 +77,16 @@ class GoogleStorageTokenService(TokenService):  # pylint: disable=too-few-public
         """Generate an OAuth access token with cloud storage access."""
         if not cls.gcp_auth_key or not cls.service_account_info:
             return None
+        return TokenCache.get(STORAGE_TOKEN_KEY, cls.fetch_token)
 
-        if cls.credentials is None:
-            cls.credentials = service_account.Credentials.from_service_account_info(
-                cls.service_account_info, scopes=cls.gcp_sa_scopes
-            )
+    @classmethod
+    def fetch_token(cls) -> tuple:
+        """Refresh the credentials, returning the access token and its expiry time."""
+        credentials = cls.get_credentials()
         request = google.auth.transport.requests.Request()
-        cls.credentials.refresh(request)
+        credentials.refresh(request)
         logger.info("Call successful: obtained token.")
-        return cls.credentials.token
+        return credentials.token, get_expiry_timestamp(credentials.expiry)
 
     @classmethod
     def get_credentials(cls):
@@ -101,20 +109,37 @@ class GoogleStorageTokenService(TokenService):  # pylint: disable=too-few-public
             logger.info(f"Getting report service token for {rs_url}")
         if not audience:
             return None
+        return TokenCache.get(REPORT_TOKEN_KEY.format(audience=audience), lambda: cls.fetch_id_token(audience))
+
+    @staticmethod
+    def fetch_id_token(audience: str) -> tuple:
+        """Fetch an ID token for the audience, returning the token and its expiry time."""
         auth_req = google.auth.transport.requests.Request()
         token = google.oauth2.id_token.fetch_id_token(auth_req, audience)
         logger.debug("Call successful: obtained token.")
-        return token
+        claims = google.auth.jwt.decode(token, verify=False)
+        return token, claims.get("exp")
 
     @classmethod
     def get_cs_signed_credentials(cls):
         """Extra steps for ADC cloud storage signed url - requires cert to sign."""
         if cls.gcp_auth_key and cls.service_account_info:
             return cls.get_credentials()
+        return TokenCache.get(SIGNED_CREDENTIALS_KEY, cls.fetch_default_credentials)
 
+    @staticmethod
+    def fetch_default_credentials() -> tuple:
+        """Load and refresh the default credentials, returning the credentials and the access token expiry time."""
         # Load default credentials
         credentials, project = google.auth.default()  # pylint: disable=unused-variable; gcp api response
         # Refresh credentials to ensure an access token is available
         auth_request = google.auth.transport.requests.Request()
         credentials.refresh(auth_request)
-        return credentials
+        return credentials, get_expiry_timestamp(credentials.expiry)
+
+
+def get_expiry_timestamp(expiry: datetime) -> float:
+    """Convert a google auth credentials expiry time (naive UTC) to epoch seconds."""
+    if not expiry:
+        return None
+    return expiry.replace(tzinfo=timezone.utc).timestamp()
@@ -90,9 +90,13 @@ class Config:  # pylint: disable=too-few-public-methods
     REPORT_SVC_LARGE_URL = os.getenv("REPORT_API_LARGE_URL", "")
 
     AUTH_SVC_URL = f"{AUTH_API_URL + AUTH_API_VERSION}"
+    # Seconds to cache auth api user and account organization responses: 0 turns off caching.
+    AUTH_CACHE_TTL: int = int(os.getenv("AUTH_CACHE_TTL", "60"))
     PAYMENT_SVC_URL = f"{PAY_API_URL + PAY_API_VERSION}"
     REPORT_SVC_URL = f"{REPORT_API_URL}"
     REPORT_TEMPLATE_PATH = os.getenv("REPORT_TEMPLATE_PATH", "report-templates")
+    # Set to yes in local development to reload cached report templates when the template files change.
+    REPORT_TEMPLATE_RELOAD = bool(os.getenv("REPORT_TEMPLATE_RELOAD", None) == "yes")
 
     LD_SDK_KEY = os.getenv("LD_SDK_KEY", None)
     SECRET_KEY = "a secret"
@@ -168,6 +172,16 @@ class Config:  # pylint: disable=too-few-public-methods
     SIMILARITY_QUOTIENT_FIRST_NAME: float = float(os.getenv("SIMILARITY_QUOTIENT_FIRST_NAME", "0.4"))
     SIMILARITY_QUOTIENT_LAST_NAME: float = float(os.getenv("SIMILARITY_QUOTIENT_LAST_NAME", "0.29"))
     SIMILARITY_QUOTIENT_DEFAULT: float = float(os.getenv("SIMILARITY_QUOTIENT_DEFAULT", "0.5"))
+    # Set to yes to run serial, MHR number, and aircraft DOT searches against the serial_search index table.
+    SEARCH_SERIAL_INDEX = bool(os.getenv("SEARCH_SERIAL_INDEX", None) == "yes")
+    # Set to yes to store new search result details (search step 2) as gzip compressed json.
+    SEARCH_RESULTS_COMPRESS = bool(os.getenv("SEARCH_RESULTS_COMPRESS", None) == "yes")
+    # Set to yes to read the account registrations lists from the account_registration_summary table. UI list
+    # requests can then page with the afterRegistrationNumber request parameter instead of pageNumber.
+    ACCOUNT_REGISTRATIONS_SUMMARY = bool(os.getenv("ACCOUNT_REGISTRATIONS_SUMMARY", None) == "yes")
+    # Set to yes to generate new debtor search keys with the database functions (one query per flush) instead of the
+    # equivalent python functions in models/search_key_utils.py.
+    DEBTOR_SEARCH_KEY_STRICT = bool(os.getenv("DEBTOR_SEARCH_KEY_STRICT", None) == "yes")
 
     # Search results report number of financing statements threshold for async requests.
     SEARCH_PDF_ASYNC_THRESHOLD: int = int(os.getenv("SEARCH_PDF_ASYNC_THRESHOLD", "75"))
@@ -181,6 +195,11 @@ class Config:  # pylint: disable=too-few-public-methods
     # Google APIs and cloud storage
     GOOGLE_DEFAULT_SA = os.getenv("GOOGLE_DEFAULT_SA")
     GCP_CS_SA_SCOPES = os.getenv("GCP_CS_SA_SCOPES", "https://www.googleapis.com/auth/cloud-platform")
+    # Cached service account tokens are used until this many seconds before they expire.
+    TOKEN_CACHE_EXPIRY_MARGIN: int = int(os.getenv("TOKEN_CACHE_EXPIRY_MARGIN", "60"))
+    # Cached service account tokens are refreshed in the background up to this many seconds before the expiry margin,
+    # and at most a quarter of the token lifetime.
+    TOKEN_CACHE_REFRESH_AHEAD: int = int(os.getenv("TOKEN_CACHE_REFRESH_AHEAD", "300"))
     # Storage of search reports
     GCP_CS_BUCKET_ID = os.getenv("GCP_CS_BUCKET_ID", "ppr_search_results_dev")
     # Storage of verification mail reports
@@ -208,8 +227,17 @@ class Config:  # pylint: disable=too-few-public-methods
     # Default 2, set to 1 to revert to original report api client
     REPORT_VERSION = os.getenv("REPORT_VERSION", "2")
     REPORT_API_AUDIENCE = os.getenv("REPORT_API_AUDIENCE", "https://gotenberg-p56lvhvsqa-nn.a.run.app")
+    # Report service client: keep-alive connections per host, retries with exponential backoff on 502, 503, 504.
+    REPORT_SVC_POOL_SIZE: int = int(os.getenv("REPORT_SVC_POOL_SIZE", "10"))
+    REPORT_SVC_RETRIES: int = int(os.getenv("REPORT_SVC_RETRIES", "3"))
+    REPORT_SVC_BACKOFF: float = float(os.getenv("REPORT_SVC_BACKOFF", "1.0"))
+    # Consecutive report service failures that open the circuit breaker, and the seconds until calls are tried again.
+    REPORT_SVC_BREAKER_FAILURES: int = int(os.getenv("REPORT_SVC_BREAKER_FAILURES", "5"))
+    REPORT_SVC_BREAKER_RESET: int = int(os.getenv("REPORT_SVC_BREAKER_RESET", "60"))
     # Number of registrations threshold for search report light format.
     REPORT_SEARCH_LIGHT: int = int(os.getenv("REPORT_SEARCH_LIGHT", "700"))
+    # Maximum number of concurrent report service calls when rendering large search sub-reports.
+    REPORT_SEARCH_POOL_SIZE: int = int(os.getenv("REPORT_SEARCH_POOL_SIZE", "4"))
 
     DEPLOYMENT_ENV = os.getenv("DEPLOYMENT_ENV", "development")
     if not GOOGLE_DEFAULT_SA and DEPLOYMENT_ENV in ("unitTesting", "testing"):
@@ -14,6 +14,7 @@
 
 """This exports all of the models and schemas used by the application."""
 from .account_bcol_id import AccountBcolId
+from .account_registration_summary import AccountRegistrationSummary
 from .address import Address
 from .client_code import ClientCode
 from .client_code_historical import ClientCodeHistorical
@@ -35,6 +36,7 @@ from .search_request import SearchRequest
 from .search_result import SearchResult
 from .securities_act_notice import SecuritiesActNotice
 from .securities_act_order import SecuritiesActOrder
+from .serial_search import SerialSearch
 from .trust_indenture import TrustIndenture
 from .type_tables import (
     ClientCodeType,
@@ -58,6 +60,7 @@ from .verification_report import VerificationReport
 __all__ = (
     "db",
     "AccountBcolId",
+    "AccountRegistrationSummary",
     "Address",
     "ClientCode",
     "ClientCodeHistorical",
@@ -83,6 +86,7 @@ __all__ = (
     "SearchResult",
     "SearchType",
     "StateType",
+    "SerialSearch",
     "SerialType",
     "SecuritiesActNotice",
     "SecuritiesActOrder",
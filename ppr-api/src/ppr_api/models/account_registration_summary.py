@@ -0,0 +1,101 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This module holds the account registration summary table.
+
+One row per registration of a financing statement, replaced for the whole financing statement when a registration
+is committed. The party names, draft number, vehicle count, last update timestamp, and financing statement state and
+expiry are copied from the source tables so the account registrations list reads one indexed table page by page
+instead of re-deriving every row of the account_registration_vw view. Values that depend on the current time (status,
+expiry days, list eligibility) and values that change outside of a registration commit (report pending count, locked
+status, extra registrations) are still evaluated when the list is queried.
+"""
+from sqlalchemy.sql import text
+
+from ppr_api.utils.logging import logger
+
+from .db import db
+
+REFRESH_STATEMENT = "SELECT account_registration_summary_refresh(:financing_id)"  # noqa: Q000
+REFRESH_REG_NUM_STATEMENT = """
+SELECT account_registration_summary_refresh(r.financing_id)
+  FROM registrations r
+ WHERE r.registration_number = :registration_num
+"""
+
+
+class AccountRegistrationSummary(db.Model):  # pylint: disable=too-many-instance-attributes
+    """This class maintains the account registration summary records."""
+
+    __tablename__ = "account_registration_summary"
+
+    # Same as the registrations id.
+    id = db.mapped_column("registration_id", db.Integer, primary_key=True)
+    financing_id = db.mapped_column("financing_id", db.Integer, nullable=False, index=True)
+    registration_num = db.mapped_column("registration_number", db.String(10), nullable=False, unique=True)
+    base_registration_num = db.mapped_column("base_reg_number", db.String(10), nullable=True)
+    registration_ts = db.mapped_column("registration_ts", db.DateTime, nullable=False)
+    registration_type = db.mapped_column("registration_type", db.String(2), nullable=False)
+    registration_type_cl = db.mapped_column("registration_type_cl", db.String(10), nullable=False)
+    registration_desc = db.mapped_column("registration_desc", db.String(100), nullable=False)
+    # The registration account ID and the base registration account ID.
+    account_id = db.mapped_column("account_id", db.String(20), nullable=True)
+    base_account_id = db.mapped_column("base_account_id", db.String(20), nullable=True)
+    # Empty strings instead of null so the columns can be used as keyset pagination sort keys.
+    client_reference_id = db.mapped_column("client_reference_id", db.String(50), nullable=False)
+    registering_name = db.mapped_column("registering_name", db.Text, nullable=False)
+    registering_party = db.mapped_column("registering_party", db.Text, nullable=True)
+    secured_party = db.mapped_column("secured_party", db.Text, nullable=True)
+    draft_number = db.mapped_column("draft_number", db.String(10), nullable=True)
+    vehicle_count = db.mapped_column("vehicle_count", db.Integer, nullable=False)
+    last_update_ts = db.mapped_column("last_update_ts", db.DateTime, nullable=False)
+    # Financing statement information used to derive the status, expiry days, and list eligibility.
+    state_type = db.mapped_column("state_type", db.String(3), nullable=False)
+    life = db.mapped_column("life", db.Integer, nullable=True)
+    expire_date = db.mapped_column("expire_date", db.DateTime, nullable=True)
+    discharge_ts = db.mapped_column("discharge_ts", db.DateTime, nullable=True)
+
+    @classmethod
+    def find_by_financing_id(cls, financing_id: int):
+        """Return the summary records for a financing statement ordered by registration id."""
+        if not financing_id:
+            return []
+        return (
+            db.session.query(AccountRegistrationSummary)
+            .filter(AccountRegistrationSummary.financing_id == financing_id)
+            .order_by(AccountRegistrationSummary.id)
+            .all()
+        )
+
+    @staticmethod
+    def refresh(financing_id: int) -> int:
+        """Replace the summary records for a financing statement within the current transaction.
+
+        Call after the registration changes are flushed and before the commit.
+        """
+        if not financing_id:
+            return 0
+        result = db.session.execute(text(REFRESH_STATEMENT), {"financing_id": financing_id})
+        count = result.scalar()
+        logger.debug(f"Account registration summary refreshed {count} records for financing id {financing_id}.")
+        return count
+
+    @staticmethod
+    def refresh_by_reg_num(registration_num: str) -> int:
+        """Replace the summary records for the financing statement a registration number belongs to."""
+        if not registration_num:
+            return 0
+        result = db.session.execute(text(REFRESH_REG_NUM_STATEMENT), {"registration_num": registration_num})
+        count = result.scalar()
+        logger.debug(f"Account registration summary refreshed {count} records for registration {registration_num}.")
+        return count or 0
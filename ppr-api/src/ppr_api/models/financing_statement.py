@@ -20,6 +20,8 @@ from __future__ import annotations
 from http import HTTPStatus
 
 from flask import current_app
+from sqlalchemy import or_
+from sqlalchemy.orm import selectinload
 from sqlalchemy.sql import text
 
 from ppr_api.exceptions import BusinessException, DatabaseException, ResourceErrorCodes
@@ -28,6 +30,8 @@ from ppr_api.models.type_tables import RegistrationType, RegistrationTypes
 from ppr_api.utils.base import BaseEnum
 from ppr_api.utils.logging import logger
 
+from .account_registration_summary import AccountRegistrationSummary
+from .client_code import ClientCode
 from .db import db
 from .general_collateral import (  # noqa: F401 pylint: disable=unused-import; needed by the SQLAlchemy relationship
     GeneralCollateral,
@@ -40,6 +44,7 @@ from .registration import (  # noqa: F401 pylint: disable=unused-import; needed
 from .securities_act_notice import (  # noqa: F401 pylint: disable=unused-import; needed by the SQLAlchemy relationship
     SecuritiesActNotice,
 )
+from .serial_search import SerialSearch
 from .trust_indenture import (  # noqa: F401 pylint: disable=unused-import; needed by the SQLAlchemy relationship
     TrustIndenture,
 )
@@ -50,6 +55,9 @@ from .vehicle_collateral import (  # noqa: F401 pylint: disable=unused-import; n
     VehicleCollateral,
 )
 
+# Maximum number of base registration numbers in a single bulk load IN-list query.
+BULK_LOAD_CHUNK_SIZE: int = 500
+
 
 class FinancingStatement(db.Model):  # pylint: disable=too-many-instance-attributes
     """This class maintains financing statement information."""
@@ -477,6 +485,9 @@ class FinancingStatement(db.Model):  # pylint: disable=too-many-instance-attribu
     def save(self):
         """Save the object to the database immediately."""
         db.session.add(self)
+        db.session.flush()
+        SerialSearch.refresh(self.id)
+        AccountRegistrationSummary.refresh(self.id)
         db.session.commit()
 
         # Now save draft
@@ -581,6 +592,115 @@ class FinancingStatement(db.Model):  # pylint: disable=too-many-instance-attribu
             )
         return statement
 
+    @classmethod
+    def find_all_by_registration_numbers(cls, registration_nums: list, search_reg_id: int = 0, session=None) -> dict:
+        """Return financing statements keyed by base registration number with the search detail graph loaded.
+
+        Staff view: no account id/historical checks. The registrations, parties, collateral, and other child
+        collections are fetched in a fixed number of set based (IN-list) queries for each chunk of registration
+        numbers, so generating the json for every statement does not lazy load one relationship at a time.
+        Registration numbers that do not match a base registration are not included in the result.
+        If search_reg_id is set the statement child collections are a snapshot as of that registration id: load
+        the snapshot in a separate session so the request session statements are not replaced with the snapshot.
+        """
+        statements = {}
+        if not registration_nums:
+            return statements
+        reg_nums = list(dict.fromkeys(registration_nums))
+        session = session or db.session
+        try:
+            for index in range(0, len(reg_nums), BULK_LOAD_CHUNK_SIZE):
+                chunk = reg_nums[index : index + BULK_LOAD_CHUNK_SIZE]
+                query = (
+                    session.query(Registration.registration_num, FinancingStatement)
+                    .filter(
+                        FinancingStatement.id == Registration.financing_id,
+                        Registration.registration_num.in_(chunk),
+                        Registration.registration_type_cl.in_(["PPSALIEN", "MISCLIEN", "CROWNLIEN"]),
+                    )
+                    .options(*FinancingStatement.search_detail_load_options(search_reg_id))
+                )
+                rows = query.all()
+                for row in rows:
+                    statements[row[0]] = row[1]
+        except Exception as db_exception:  # noqa: B902; return nicer error
+            logger.error("DB find_all_by_registration_numbers exception: " + repr(db_exception))
+            raise DatabaseException(db_exception) from db_exception
+        return statements
+
+    @staticmethod
+    def search_detail_load_options(search_reg_id: int = 0) -> list:
+        """Return the eager loader options for every relationship used to build the search detail json.
+
+        If search_reg_id is set the financing statement collections are restricted in SQL to the rows in effect as
+        of that registration id: registrations up to the id and records added by then and not ended by then.
+        General collateral keeps ended records up to the id, as the history json shows deleted descriptions.
+        """
+        party_options = [
+            selectinload(Party.address),
+            selectinload(Party.client_code).selectinload(ClientCode.address),
+        ]
+        if search_reg_id:
+            registration = selectinload(FinancingStatement.registration.and_(Registration.id <= search_reg_id))
+            parties = FinancingStatement.parties.and_(
+                Party.registration_id <= search_reg_id,
+                or_(Party.registration_id_end.is_(None), Party.registration_id_end > search_reg_id),
+            )
+            vehicle_collateral = FinancingStatement.vehicle_collateral.and_(
+                VehicleCollateral.registration_id <= search_reg_id,
+                or_(
+                    VehicleCollateral.registration_id_end.is_(None),
+                    VehicleCollateral.registration_id_end > search_reg_id,
+                ),
+            )
+            trust_indenture = FinancingStatement.trust_indenture.and_(
+                TrustIndenture.registration_id <= search_reg_id,
+                or_(TrustIndenture.registration_id_end.is_(None), TrustIndenture.registration_id_end > search_reg_id),
+            )
+            general_collateral = FinancingStatement.general_collateral.and_(
+                GeneralCollateral.registration_id <= search_reg_id
+            )
+            general_collateral_legacy = FinancingStatement.general_collateral_legacy.and_(
+                GeneralCollateralLegacy.registration_id <= search_reg_id
+            )
+            return [
+                registration.selectinload(Registration.reg_type),
+                registration.selectinload(Registration.court_order),
+                registration.selectinload(Registration.trust_indenture),
+                registration.selectinload(Registration.general_collateral),
+                registration.selectinload(Registration.general_collateral_legacy),
+                registration.selectinload(Registration.vehicle_collateral),
+                registration.selectinload(Registration.parties).options(*party_options),
+                registration.selectinload(Registration.securities_act_notices).selectinload(
+                    SecuritiesActNotice.securities_act_orders
+                ),
+                selectinload(parties).options(*party_options),
+                selectinload(vehicle_collateral),
+                selectinload(general_collateral),
+                selectinload(general_collateral_legacy),
+                selectinload(trust_indenture),
+                selectinload(FinancingStatement.previous_statement),
+            ]
+        registration = selectinload(FinancingStatement.registration)
+        return [
+            registration.selectinload(Registration.reg_type),
+            registration.selectinload(Registration.court_order),
+            registration.selectinload(Registration.trust_indenture),
+            registration.selectinload(Registration.general_collateral),
+            registration.selectinload(Registration.general_collateral_legacy),
+            registration.selectinload(Registration.vehicle_collateral),
+            registration.selectinload(Registration.parties).options(*party_options),
+            registration.selectinload(Registration.securities_act_notices).selectinload(
+                SecuritiesActNotice.securities_act_orders
+            ),
+            selectinload(FinancingStatement.parties).options(*party_options),
+            selectinload(FinancingStatement.vehicle_collateral),
+            selectinload(FinancingStatement.general_collateral),
+            selectinload(FinancingStatement.general_collateral_legacy),
+            selectinload(FinancingStatement.trust_indenture),
+            selectinload(FinancingStatement.previous_statement),
+        ]
+
     @classmethod
     def find_by_financing_id(cls, financing_id: int = None):
         """Return a financing statement by financing statement ID."""
@@ -14,7 +14,7 @@
 """This module holds data for parties and client parties (debtors, registering parties, secured parties)."""
 from __future__ import annotations
 
-from sqlalchemy import event, text
+from sqlalchemy import event
 
 from ppr_api.models import utils as model_utils
 from ppr_api.utils.base import BaseEnum
@@ -22,20 +22,7 @@ from ppr_api.utils.base import BaseEnum
 from .address import Address  # noqa: F401 pylint: disable=unused-import
 from .client_code import ClientCode  # noqa: F401 pylint: disable=unused-import
 from .db import db
-
-BUSINESS_UPDATE_QUERY = """
-    SELECT (select searchkey_business_name(:actual_name)) AS search_key,
-           (select business_name_strip_designation(:actual_name)) AS bus_name_base
-"""
-INDIVIDUAL_UPDATE_QUERY = """
-    SELECT (select searchkey_individual(:last_name, :first_name)) AS first_search_key,
-           (select searchkey_last_name(:last_name)) AS last_search_key,
-           (select individual_split_1(:first_name)) AS first_split1,
-           (select individual_split_2(:first_name)) AS first_split2,
-           (select individual_split_1(:last_name)) AS last_split1,
-           (select individual_split_2(:last_name)) AS last_split2,
-           (select individual_split_3(:last_name)) AS last_split3
-"""
+from .search_key_utils import set_debtor_search_keys
 
 
 class Party(db.Model):  # pylint: disable=too-many-instance-attributes
@@ -317,28 +304,9 @@ class Party(db.Model):  # pylint: disable=too-many-instance-attributes
         return False
 
 
-@event.listens_for(Party, "before_insert")
-def party_before_insert_listener(mapper, connection, target):  # pylint: disable=unused-argument; don't use mapper
-    """Conditionally set debtor search key values."""
-    if target.party_type == target.PartyTypes.DEBTOR_COMPANY.value:
-        stmt = text(BUSINESS_UPDATE_QUERY)
-        stmt = stmt.bindparams(actual_name=target.business_name)
-        result = connection.execute(stmt)
-        row = result.first()
-        target.business_search_key = str(row[0])
-        target.bus_name_base = str(row[1])
-        target.bus_name_key_char1 = target.business_search_key[0:1]
-
-    elif target.party_type == target.PartyTypes.DEBTOR_INDIVIDUAL.value:
-        stmt = text(INDIVIDUAL_UPDATE_QUERY)
-        stmt = stmt.bindparams(last_name=target.last_name, first_name=target.first_name)
-        result = connection.execute(stmt)
-        row = result.first()
-        target.first_name_key = str(row[0])
-        target.last_name_key = str(row[1])
-        target.first_name_split1 = str(row[2])
-        target.first_name_split2 = str(row[3])
-        target.last_name_split1 = str(row[4])
-        target.last_name_split2 = str(row[5])
-        target.last_name_split3 = str(row[6])
-        target.first_name_key_char1 = target.first_name_key[0:1]
+@event.listens_for(db.session, "before_flush")
+def party_before_flush_listener(session, flush_context, instances):  # pylint: disable=unused-argument
+    """Set the debtor search key values of all the new parties in the flush together."""
+    parties = [obj for obj in session.new if isinstance(obj, Party)]
+    if parties:
+        set_debtor_search_keys(session, parties)
@@ -28,12 +28,14 @@ from ppr_api.services.authz import is_staff_account
 from ppr_api.utils.base import BaseEnum
 from ppr_api.utils.logging import logger
 
+from .account_registration_summary import AccountRegistrationSummary
 from .court_order import CourtOrder
 from .db import db
 from .draft import Draft
 from .general_collateral import GeneralCollateral
 from .party import Party
 from .securities_act_notice import SecuritiesActNotice
+from .serial_search import SerialSearch
 from .trust_indenture import TrustIndenture
 from .type_tables import RegistrationType
 from .user_extra_registration import UserExtraRegistration
@@ -306,6 +308,9 @@ class Registration(db.Model):  # pylint: disable=too-many-instance-attributes, t
     def save(self):
         """Render a registration to the local cache."""
         db.session.add(self)
+        db.session.flush()
+        SerialSearch.refresh(self.financing_id)
+        AccountRegistrationSummary.refresh(self.financing_id)
         db.session.commit()
 
         # Now save draft
@@ -430,13 +435,15 @@ class Registration(db.Model):  # pylint: disable=too-many-instance-attributes, t
 
         registrations_json = []
         try:
+            if params.from_ui and registration_utils.account_summary_filter(params):
+                return Registration.find_all_by_account_summary(params)
             if params.from_ui:
                 return Registration.find_all_by_account_id_filter(params)
             if registration_utils.api_account_reg_filter(params):
                 return Registration.find_all_by_account_id_api_filter(params)
 
             results = db.session.execute(
-                text(registration_utils.QUERY_ACCOUNT_REGISTRATIONS),
+                text(registration_utils.get_account_registrations_query()),
                 {"query_account": params.account_id, "max_results_size": model_utils.MAX_ACCOUNT_REGISTRATIONS_DEFAULT},
             )
             rows = results.fetchall()
@@ -508,6 +515,32 @@ class Registration(db.Model):  # pylint: disable=too-many-instance-attributes, t
             results_json = registration_utils.update_account_reg_results(params, rows, results_json)
         return results_json
 
+    @classmethod
+    def find_all_by_account_summary(cls, params: AccountRegistrationParams):
+        """Return a page of the account registrations summary list from the account registration summary table.
+
+        Pages after the first use the last base registration number of the previous page (params.after_reg_num) as
+        the starting point, so every page is an index range scan of at most one page of rows.
+        """
+        results_json = []
+        result = db.session.execute(
+            text(registration_utils.QUERY_ACCOUNT_SUMMARY_TOTAL), {"query_account": params.account_id}
+        )
+        count: int = int(result.first()[0])
+        query = registration_utils.build_account_summary_query(params)
+        query_params = registration_utils.build_account_summary_query_params(params)
+        results = db.session.execute(text(query), query_params)
+        rows = results.fetchall()
+        results_json = registration_utils.build_account_base_reg_results(params, rows)
+        if results_json:
+            results_json[0]["totalRegistrationCount"] = count
+            # Get change registrations.
+            query = registration_utils.build_account_summary_change_query(results_json)
+            results = db.session.execute(text(query), query_params)
+            rows = results.fetchall()
+            results_json = registration_utils.update_account_reg_results(params, rows, results_json)
+        return results_json
+
     @classmethod
     def find_all_by_account_id_api_filter(cls, params: AccountRegistrationParams):
         """Return a summary list of registrations belonging to an api account applying filters."""
@@ -15,12 +15,14 @@
 # pylint: disable=too-few-public-methods
 
 """This module holds methods to support registration model updates - mostly account registration summary."""
+from flask import current_app
 from sqlalchemy.sql import text
 
 from ppr_api.models import utils as model_utils
 from ppr_api.services.authz import is_all_staff_account, is_staff_account
 from ppr_api.utils.logging import logger
 
+from .account_registration_summary import AccountRegistrationSummary
 from .db import db
 from .securities_act_notice import SecuritiesActNotice
 from .type_tables import RegistrationType, RegistrationTypes
@@ -296,6 +298,155 @@ UPDATE registrations
                         WHERE r.financing_id = fs.id
                           AND r.registration_number = :query_reg_num)
 """
+# Account registrations list queries using the account_registration_summary table maintained on registration commits.
+# The base registration ids for a page are selected separately for registrations created by the account and for
+# registrations added to the account, so each branch is an index range scan bounded by the page size.
+QUERY_ACCOUNT_SUMMARY_ELIGIBLE = """
+    AND (ars.expire_date IS NULL OR
+         (ars.expire_date at time zone 'utc') > ((now() at time zone 'utc') - interval '30 days'))
+    AND (ars.discharge_ts IS NULL OR ars.discharge_ts >= ((now() at time zone 'utc') - interval '30 days'))
+"""
+QUERY_ACCOUNT_SUMMARY_BASE_IDS = (
+    """
+(SELECT ars.registration_id
+   FROM account_registration_summary ars
+  WHERE ars.account_id = :query_account
+    AND ars.registration_type_cl IN ('CROWNLIEN', 'MISCLIEN', 'PPSALIEN')
+"""
+    + QUERY_ACCOUNT_SUMMARY_ELIGIBLE
+    + """
+    AND NOT EXISTS (SELECT uer.id
+                      FROM user_extra_registrations uer, account_registration_summary ars2
+                     WHERE ars2.financing_id = ars.financing_id
+                       AND uer.registration_number = ars2.registration_number
+                       AND uer.removed_ind = 'Y')
+    KEYSET_CLAUSE ORDER_LIMIT_CLAUSE)
+UNION
+(SELECT ars.registration_id
+   FROM account_registration_summary ars, user_extra_registrations uer
+  WHERE uer.account_id = :query_account
+    AND uer.removed_ind IS NULL
+    AND ars.registration_number = uer.registration_number
+    AND ars.registration_type_cl IN ('CROWNLIEN', 'MISCLIEN', 'PPSALIEN')
+"""
+    + QUERY_ACCOUNT_SUMMARY_ELIGIBLE
+    + """
+    KEYSET_CLAUSE ORDER_LIMIT_CLAUSE)
+"""
+)
+QUERY_ACCOUNT_SUMMARY_COLUMNS = """
+SELECT ars.registration_number, ars.registration_ts, ars.registration_type, ars.registration_type_cl,
+       :query_account AS account_id, ars.registration_desc, ars.base_reg_number,
+       CASE WHEN ars.state_type = 'ACT' AND ars.expire_date IS NOT NULL AND
+                 (ars.expire_date at time zone 'utc') < (now() at time zone 'utc') THEN 'HEX'
+            ELSE ars.state_type END AS state,
+       CASE WHEN ars.life = 99 THEN -99
+            ELSE CAST(EXTRACT(days from (ars.expire_date at time zone 'utc' - (now() at time zone 'utc'))) AS INT)
+            END expire_days,
+       ars.last_update_ts, ars.registering_party, ars.secured_party, ars.client_reference_id, ars.registering_name,
+       ars.account_id AS orig_account_id,
+       (SELECT COUNT(vr.id)
+          FROM verification_reports vr
+         WHERE vr.registration_id = ars.registration_id
+           AND vr.doc_storage_url IS NULL) AS pending_count,
+       ars.vehicle_count,
+       NULL AS staff_account_id,
+       CASE WHEN :query_account != '0' THEN ars.draft_number ELSE NULL END draft_number,
+       (SELECT r.ver_bypassed FROM registrations r WHERE r.id = ars.registration_id) AS locked_status
+  FROM account_registration_summary ars
+"""
+QUERY_ACCOUNT_SUMMARY_REG = (
+    QUERY_ACCOUNT_SUMMARY_COLUMNS
+    + """
+ WHERE ars.registration_id IN (SELECT q.registration_id FROM (QUERY_ACCOUNT_SUMMARY_BASE_IDS) AS q)
+ORDER_CLAUSE
+LIMIT :page_size OFFSET :page_offset
+"""
+)
+QUERY_ACCOUNT_SUMMARY_TOTAL = """
+SELECT COUNT(q.registration_id) AS reg_count
+  FROM (QUERY_ACCOUNT_SUMMARY_BASE_IDS) AS q
+""".replace(
+    "QUERY_ACCOUNT_SUMMARY_BASE_IDS",
+    QUERY_ACCOUNT_SUMMARY_BASE_IDS.replace("KEYSET_CLAUSE ORDER_LIMIT_CLAUSE", ""),
+)
+QUERY_ACCOUNT_SUMMARY_CHANGE_REG = (
+    QUERY_ACCOUNT_SUMMARY_COLUMNS
+    + """
+ WHERE ars.registration_type_cl NOT IN ('CROWNLIEN', 'MISCLIEN', 'PPSALIEN')
+   AND ars.financing_id IN (SELECT ars2.financing_id
+                              FROM account_registration_summary ars2
+                             WHERE ars2.registration_number IN (BASE_REG_LIST))
+   AND (((ars.account_id = :query_account OR ars.base_account_id = :query_account) AND
+         NOT EXISTS (SELECT uer.id
+                       FROM user_extra_registrations uer, account_registration_summary ars2
+                      WHERE ars2.financing_id = ars.financing_id
+                        AND uer.registration_number = ars2.registration_number
+                        AND uer.removed_ind = 'Y')) OR
+        EXISTS (SELECT uer.id
+                  FROM user_extra_registrations uer
+                 WHERE uer.account_id = :query_account
+                   AND uer.removed_ind IS NULL
+                   AND uer.registration_number IN (ars.registration_number, ars.base_reg_number)))
+ORDER BY ars.registration_ts DESC
+"""
+)
+QUERY_ACCOUNT_SUMMARY_REGISTRATIONS = """
+WITH q AS (
+  SELECT (TO_TIMESTAMP(TO_CHAR(current_date, 'YYYY-MM-DD') || ' 23:59:59', 'YYYY-MM-DD HH24:MI:SS') at time zone 'utc')
+      AS current_expire_ts
+)
+SELECT ars.registration_number, ars.registration_ts, ars.registration_type, ars.registration_type_cl, ars.account_id,
+       ars.registration_desc, ars.base_reg_number, ars.state_type AS state,
+       CASE WHEN ars.life = 99 THEN -99
+            ELSE CAST(EXTRACT(day from ((ars.expire_date at time zone 'utc') - current_expire_ts)) AS INT)
+            END expire_days,
+       ars.last_update_ts, ars.registering_party, ars.secured_party, ars.client_reference_id, ars.registering_name,
+      (SELECT COUNT(id)
+         FROM user_extra_registrations uer
+        WHERE uer.registration_number = ars.registration_number
+          AND uer.account_id = ars.account_id
+          AND uer.removed_ind = 'Y') AS removed_count
+  FROM account_registration_summary ars, q
+ WHERE ars.base_account_id = :query_account
+   AND (ars.expire_date IS NULL OR ars.expire_date > ((now() at time zone 'utc') - interval '30 days'))
+   AND (ars.discharge_ts IS NULL OR ars.discharge_ts >= ((now() at time zone 'utc') - interval '30 days'))
+   AND NOT EXISTS (SELECT ars2.financing_id
+                     FROM user_extra_registrations uer, account_registration_summary ars2
+                    WHERE uer.account_id = :query_account
+                      AND uer.registration_number = ars2.registration_number
+                      AND ars2.financing_id = ars.financing_id
+                      AND uer.removed_ind = 'Y')
+UNION (
+SELECT ars.registration_number, ars.registration_ts, ars.registration_type, ars.registration_type_cl, ars.account_id,
+       ars.registration_desc, ars.base_reg_number, ars.state_type AS state,
+       CASE WHEN ars.life = 99 THEN -99
+            ELSE CAST(EXTRACT(day from ((ars.expire_date at time zone 'utc') - current_expire_ts)) AS INT)
+            END expire_days,
+       ars.last_update_ts, ars.registering_party, ars.secured_party, ars.client_reference_id, ars.registering_name,
+       0 AS removed_count
+  FROM account_registration_summary ars, q
+ WHERE ars.financing_id IN (SELECT ars2.financing_id
+                              FROM account_registration_summary ars2, user_extra_registrations uer
+                             WHERE ars2.registration_type_cl IN ('CROWNLIEN', 'MISCLIEN', 'PPSALIEN')
+                               AND ars2.registration_number = uer.registration_number
+                               AND uer.account_id = :query_account
+                               AND uer.removed_ind IS NULL)
+   AND (ars.expire_date IS NULL OR ars.expire_date > ((now() at time zone 'utc') - interval '30 days'))
+   AND (ars.discharge_ts IS NULL OR ars.discharge_ts >= ((now() at time zone 'utc') - interval '30 days'))
+)
+ORDER BY registration_ts DESC
+FETCH FIRST :max_results_size ROWS ONLY
+"""
+# Keyset pagination: only rows after the last base registration of the previous page in the list order.
+QUERY_ACCOUNT_SUMMARY_KEYSET_CLAUSE = """
+    AND (ars.SORT_COLUMN, ars.registration_id) KEYSET_OPERATOR
+        (SELECT arsk.SORT_COLUMN, arsk.registration_id
+           FROM account_registration_summary arsk
+          WHERE arsk.registration_number = :after_reg_num)
+"""
+QUERY_ACCOUNT_SUMMARY_ORDER = " ORDER BY ars.SORT_COLUMN SORT_ORDER, ars.registration_id SORT_ORDER"
+QUERY_ACCOUNT_SUMMARY_LIMIT = " LIMIT :page_limit"
 GC_LEGACY_STATUS_ADDED = "A"
 GC_LEGACY_STATUS_DELETED = "D"
 
@@ -318,6 +469,7 @@ class AccountRegistrationParams:
     status_type: str = None
     client_reference_id: str = None
     registering_name: str = None
+    after_reg_num: str = None
 
     def __init__(self, account_id, collapse: bool = False, account_name: str = None, sbc_staff: bool = False):
         """Set common base initialization."""
@@ -585,6 +737,76 @@ def build_account_query_params(params: AccountRegistrationParams, api_filter: bo
     return query_params
 
 
+def account_summary_filter(params: AccountRegistrationParams) -> bool:
+    """Check if the UI account registrations list request can use the account registration summary table.
+
+    Staff account and filter requests use the account registration views.
+    """
+    if not current_app.config.get("ACCOUNT_REGISTRATIONS_SUMMARY") or is_staff_account(params.account_id):
+        return False
+    return not (
+        params.registration_number
+        or params.registration_type
+        or params.status_type
+        or params.client_reference_id
+        or params.registering_name
+        or (params.start_date_time and params.end_date_time)
+    )
+
+
+def get_account_summary_order(params: AccountRegistrationParams) -> tuple:
+    """Get the account registration summary sort column and sort order from the provided parameters."""
+    sort_column: str = PARAM_TO_ORDER_BY.get(params.sort_criteria, None) if params.sort_criteria else None
+    if not sort_column:
+        return "registration_ts", "DESC"
+    sort_order: str = "ASC" if params.sort_direction in ("asc", "ascending") else "DESC"
+    return sort_column, sort_order
+
+
+def get_account_registrations_query() -> str:
+    """Get the recent account registrations query: from the account registration summary table if configured."""
+    if current_app.config.get("ACCOUNT_REGISTRATIONS_SUMMARY"):
+        return QUERY_ACCOUNT_SUMMARY_REGISTRATIONS
+    return QUERY_ACCOUNT_REGISTRATIONS
+
+
+def build_account_summary_query(params: AccountRegistrationParams) -> str:
+    """Build the account registration summary query from the provided parameters.
+
+    If the request includes the last base registration number of the previous page the query starts after that
+    registration (keyset pagination), otherwise the page number offset is used.
+    """
+    sort_column, sort_order = get_account_summary_order(params)
+    keyset_clause: str = ""
+    if params.after_reg_num:
+        keyset_clause = QUERY_ACCOUNT_SUMMARY_KEYSET_CLAUSE.replace(
+            "KEYSET_OPERATOR", "<" if sort_order == "DESC" else ">"
+        )
+    order_by: str = QUERY_ACCOUNT_SUMMARY_ORDER.replace("SORT_ORDER", sort_order)
+    base_query: str = QUERY_ACCOUNT_SUMMARY_BASE_IDS.replace("KEYSET_CLAUSE", keyset_clause)
+    base_query = base_query.replace("ORDER_LIMIT_CLAUSE", order_by + QUERY_ACCOUNT_SUMMARY_LIMIT)
+    query: str = QUERY_ACCOUNT_SUMMARY_REG.replace("QUERY_ACCOUNT_SUMMARY_BASE_IDS", base_query)
+    query = query.replace("ORDER_CLAUSE", order_by)
+    return query.replace("SORT_COLUMN", sort_column)
+
+
+def build_account_summary_change_query(base_json: dict) -> str:
+    """Build the account registration summary change query for the base registrations on the page."""
+    reg_nums: str = ",".join("'" + reg["registrationNumber"] + "'" for reg in base_json)
+    return QUERY_ACCOUNT_SUMMARY_CHANGE_REG.replace("BASE_REG_LIST", reg_nums)
+
+
+def build_account_summary_query_params(params: AccountRegistrationParams) -> dict:
+    """Build the account registration summary query runtime parameter set from the provided parameters."""
+    query_params = build_account_query_params(params)
+    if params.after_reg_num:
+        query_params["after_reg_num"] = params.after_reg_num
+        query_params["page_offset"] = 0
+    # Each branch of the base registration union must return enough rows to fill the page at the offset.
+    query_params["page_limit"] = query_params["page_size"] + query_params["page_offset"]
+    return query_params
+
+
 def build_account_base_reg_results(params, rows, api_filter: bool = False) -> dict:
     """Build the account query base registration results from the query result set."""
     results_json = []
@@ -886,6 +1108,7 @@ def set_securities_notices_json(registration, json_data, registration_id):
 def update_account_reg_remove(account_id: str, reg_num: str) -> int:
     """Mark registrations created by an account as removed by appending _R to the account id."""
     db.session.execute(text(QUERY_UPDATE_ACCOUNT_ID_REMOVE), {"query_account": account_id, "query_reg_num": reg_num})
+    AccountRegistrationSummary.refresh_by_reg_num(reg_num)
     logger.info(f"update_account_reg_remove account={account_id} reg_num={reg_num}")
     db.session.commit()
 
@@ -893,6 +1116,7 @@ def update_account_reg_remove(account_id: str, reg_num: str) -> int:
 def update_account_reg_restore(account_id: str, reg_num: str):
     """Mark registrations created by an account as restored by removing _R from the end of the account id."""
     db.session.execute(text(QUERY_UPDATE_ACCOUNT_ID_RESTORE), {"query_account": account_id, "query_reg_num": reg_num})
+    AccountRegistrationSummary.refresh_by_reg_num(reg_num)
     logger.info(f"update_account_reg_restore account={account_id} reg_num={reg_num}")
     db.session.commit()
 
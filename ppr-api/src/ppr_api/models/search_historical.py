@@ -19,10 +19,13 @@ Search for exact matches as of a past date and time.
 # Disable Q000: Allow query strings to be in double quotation marks that contain single quotation marks.
 # Disable E122: allow query strings to be more human readable.
 # Disable E131: allow query strings to be more human readable.
+from http import HTTPStatus
+
 from flask import current_app
+from sqlalchemy.orm import Session
 from sqlalchemy.sql import text
 
-from ppr_api.exceptions import DatabaseException
+from ppr_api.exceptions import BusinessException, DatabaseException, ResourceErrorCodes
 from ppr_api.models import (
     FinancingStatement,
     GeneralCollateralLegacy,
@@ -486,41 +489,61 @@ def create_from_search_query(search_query: SearchRequest, search_reg_id: int) ->
     query_results = search_query.search_response
     detail_results = []
     search_result.search_response = detail_results
-    for result in query_results:
-        reg_num = result["baseRegistrationNumber"]
-        match_type = result["matchType"]
-        found = False
-        if detail_results:  # Check for duplicates.
-            for statement in detail_results:
-                if statement["financingStatement"]["baseRegistrationNumber"] == reg_num:
-                    found = True
-        if not found:  # No duplicates.
-            # Set to staff for small performance gain: skip account id/historical checks.
-            logger.debug(f"fetching registration for {reg_num}")
-            financing = FinancingStatement.find_by_registration_number(reg_num, None, True, False)
-            financing.mark_update_json = True  # Added for PDF, indicate if party or collateral was added.
-            # Set to true to include change history.
-            financing.include_changes_json = True
-            financing_json = {
-                "matchType": match_type,
-                "financingStatement": get_historical_json(financing, search_reg_id, search_query.search_ts),
-            }
-            detail_results.append(financing_json)
-            if match_type == model_utils.SEARCH_MATCH_EXACT:
-                search_result.exact_match_count += 1
-            else:
-                search_result.similar_match_count += 1
+    # Load the snapshot as of the search registration id for every matched statement at once. Use a separate session
+    # so the snapshot collections are not loaded into the request session statements.
+    with Session(bind=db.session.connection()) as snapshot_session:
+        statements = get_snapshot_statements(
+            [result["baseRegistrationNumber"] for result in query_results], search_reg_id, snapshot_session
+        )
+        for result in query_results:
+            reg_num = result["baseRegistrationNumber"]
+            match_type = result["matchType"]
+            financing: FinancingStatement = statements.pop(reg_num, None)
+            if financing:  # None if a duplicate.
+                financing_json = {
+                    "matchType": match_type,
+                    "financingStatement": get_historical_json(financing, search_reg_id, search_query.search_ts),
+                }
+                detail_results.append(financing_json)
+                if match_type == model_utils.SEARCH_MATCH_EXACT:
+                    search_result.exact_match_count += 1
+                else:
+                    search_result.similar_match_count += 1
 
     search_result.search_response = detail_results
     return search_result
 
 
+def get_snapshot_statements(reg_nums: list, search_reg_id: int, session=None) -> dict:
+    """Get the financing statements as of the search registration id keyed by base registration number.
+
+    The registrations, parties, collateral, and trust indenture records are restricted in SQL to the records in
+    effect as of the search registration id, so the json is built from the loaded records without filtering.
+    """
+    logger.debug(f"fetching {len(reg_nums)} registrations as of registration id {search_reg_id}")
+    statements = FinancingStatement.find_all_by_registration_numbers(reg_nums, search_reg_id, session)
+    for reg_num in reg_nums:
+        if reg_num not in statements:
+            raise BusinessException(
+                error=model_utils.ERR_FINANCING_NOT_FOUND.format(
+                    code=ResourceErrorCodes.NOT_FOUND_ERR.value, registration_num=reg_num
+                ),
+                status_code=HTTPStatus.NOT_FOUND,
+            )
+    for financing in statements.values():
+        financing.mark_update_json = True  # Added for PDF, indicate if party or collateral was added.
+        # Set to true to include change history.
+        financing.include_changes_json = True
+    return statements
+
+
 def get_historical_json(fin: FinancingStatement, search_reg_id: int, search_ts) -> dict:
-    """Get the reistration JSON with change history at a point in time."""
+    """Get the registration JSON with change history from the snapshot records as of the search registration id."""
     statement = {"statusType": fin.state_type}
     if fin.state_type == model_utils.STATE_DISCHARGED:
+        # The snapshot registrations end with the discharge only if it is as of the search registration id.
         index = len(fin.registration) - 1
-        if fin.registration[index].id > search_reg_id:
+        if fin.registration[index].registration_type_cl != model_utils.REG_CLASS_DISCHARGE:
             statement["statusType"] = model_utils.STATE_ACTIVE
         else:
             statement["dischargedDateTime"] = model_utils.format_ts(fin.registration[index].registration_ts)
@@ -545,20 +568,22 @@ def get_historical_json(fin: FinancingStatement, search_reg_id: int, search_ts)
     vehicle_collateral = vehicle_collateral_json(fin, registration_id, search_reg_id)
     if vehicle_collateral:
         statement["vehicleCollateral"] = vehicle_collateral
-    if fin.trust_indenture:
-        for trust in fin.trust_indenture:
-            if not trust.registration_id_end:
-                if trust.trust_indenture == "Y":
-                    statement["trustIndenture"] = True
-                else:
-                    statement["trustIndenture"] = False
-    else:
-        statement["trustIndenture"] = False
+    statement["trustIndenture"] = False
+    for trust in fin.trust_indenture:
+        if is_snapshot_record(trust, search_reg_id):
+            statement["trustIndenture"] = trust.trust_indenture == "Y"
     set_court_order_json(fin, statement, search_reg_id)
     set_transition_json(fin, statement)
     return set_changes_json(fin, statement, search_reg_id)
 
 
+def is_snapshot_record(record, search_reg_id: int) -> bool:
+    """True if the party, collateral, or trust indenture record is in effect as of the search registration id."""
+    return record.registration_id <= search_reg_id and (
+        not record.registration_id_end or record.registration_id_end > search_reg_id
+    )
+
+
 def set_reg_json(fin: FinancingStatement, statement):
     """Set the JSON base registration information."""
     reg = fin.registration[0]
@@ -622,29 +647,21 @@ def set_transition_json(fin: FinancingStatement, statement):
 
 
 def vehicle_collateral_json(fin: FinancingStatement, registration_id: int, search_reg_id: int) -> dict:
-    """Build vehicle collateral JSON: current_view_json determines if current or original data is included."""
+    """Build vehicle collateral JSON from the collateral in effect as of the search registration id."""
     if not fin.vehicle_collateral:
         return None
     collateral_list = []
     for collateral in fin.vehicle_collateral:
-        collateral_json = None
-        if collateral.registration_id == registration_id and (
-            not collateral.registration_id_end or collateral.registration_id_end <= search_reg_id
-        ):
-            collateral_json = collateral.json
-        elif collateral.registration_id_end and collateral.registation_id_end <= search_reg_id:
+        if is_snapshot_record(collateral, search_reg_id):
             collateral_json = collateral.json
-            collateral_json["added"] = True
-        elif not collateral.registration_id_end and collateral.registration_id <= search_reg_id:
-            collateral_json = collateral.json
-            collateral_json["added"] = True
-        if collateral_json:
+            if collateral.registration_id != registration_id:
+                collateral_json["added"] = True
             collateral_list.append(collateral_json)
     return collateral_list
 
 
 def party_json(fin: FinancingStatement, party_type: str, registration_id: int, search_reg_id: int) -> dict:
-    """Build party JSON: current_view_json determines if current or original data is included."""
+    """Build party JSON from the parties in effect as of the search registration id."""
     if party_type == Party.PartyTypes.REGISTERING_PARTY.value:
         for party in fin.parties:
             if party.party_type == party_type and registration_id == party.registration_id:
@@ -654,20 +671,16 @@ def party_json(fin: FinancingStatement, party_type: str, registration_id: int, s
 
     parties = []
     for party in fin.parties:
-        p_json = None
-        if party.party_type == party_type or (
-            party_type == Party.PartyTypes.DEBTOR_COMPANY.value
-            and party.party_type == Party.PartyTypes.DEBTOR_INDIVIDUAL.value
-        ):
-            if party.registration_id_end and party.registration_id_end <= search_reg_id:
-                p_json = party.json
-                if party.registration_id != registration_id:
-                    p_json["added"] = True
-            elif not party.registration_id_end and party.registration_id <= search_reg_id:
-                p_json = party.json
-                if party.registration_id != registration_id:
-                    p_json["added"] = True
-        if p_json:
+        if (
+            party.party_type == party_type
+            or (
+                party_type == Party.PartyTypes.DEBTOR_COMPANY.value
+                and party.party_type == Party.PartyTypes.DEBTOR_INDIVIDUAL.value
+            )
+        ) and is_snapshot_record(party, search_reg_id):
+            p_json = party.json
+            if party.registration_id != registration_id:
+                p_json["added"] = True
             parties.append(p_json)
     return parties
 
@@ -0,0 +1,286 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Debtor search key generation.
+
+The functions are line by line copies of the database functions in src/database/postgres_functions
+(searchkey_business_name, business_name_strip_designation, searchkey_individual, searchkey_last_name,
+individual_split_1, individual_split_2, and individual_split_3) so the debtor search keys can be set in memory for all
+of the new parties in a flush. Postgres regular expression word boundaries (\\y) are \\b, TRIM only removes spaces,
+SPLIT_PART returns an empty string past the last part, and a null name returns None. Any change to the database
+functions must be made here as well: test_search_key_utils.py compares the results of both.
+"""
+import re
+
+from flask import current_app
+from sqlalchemy import bindparam
+from sqlalchemy.sql import text
+
+from ppr_api.utils.logging import logger
+
+# Search key values are generated by the database functions in one statement for a batch when set to True.
+STRICT_CONFIG_KEY = "DEBTOR_SEARCH_KEY_STRICT"
+
+COMMON_WORD_QUERY = text("SELECT word FROM common_word WHERE word IN :words").bindparams(
+    bindparam("words", expanding=True)
+)
+BATCH_QUERY = """
+SELECT searchkey_business_name(t.business_name) AS search_key,
+       business_name_strip_designation(t.business_name) AS bus_name_base,
+       searchkey_individual(t.last_name, t.first_name) AS first_search_key,
+       searchkey_last_name(t.last_name) AS last_search_key,
+       individual_split_1(t.first_name) AS first_split1,
+       individual_split_2(t.first_name) AS first_split2,
+       individual_split_1(t.last_name) AS last_split1,
+       individual_split_2(t.last_name) AS last_split2,
+       individual_split_3(t.last_name) AS last_split3
+  FROM unnest(CAST(:business_names AS VARCHAR[]), CAST(:last_names AS VARCHAR[]), CAST(:first_names AS VARCHAR[]))
+       WITH ORDINALITY AS t(business_name, last_name, first_name, ord)
+ ORDER BY t.ord
+"""
+
+_NON_WORD = re.compile(r"[^\w]+")
+_NON_WORD_SPACE = re.compile(r"[^\w\s]+")
+_SPACES = re.compile(r"\s+")
+_REPEATING = re.compile(r"(.)\1{1,}", re.DOTALL)
+_IND_PREFIX = re.compile(r"\b(DR|MR|MRS|MS|CH|DE|DO|DA|LE|LA|MA|JR|SR|I|II|III)\b", re.IGNORECASE)
+_BUS_DESIGNATION = re.compile(
+    r"\b(CORPORATION|INCORPORATED|INCORPOREE|LIMITED|LIMITEE|NON PERSONAL LIABILITY|CORP|INC|LTD|LTEE|NPL|ULC)\b",
+    re.IGNORECASE,
+)
+_BUS_UPPER = re.compile(r"[A-Z]+")
+_BUS_LEADING_ZEROS = re.compile(r"^0000|^000|^00|^0")
+_BUS_LETTERS = re.compile(r"[A-Za-z]+")
+_BUS_BRACKETS = re.compile(r"\([^()]*\)")
+_BUS_THE = re.compile(r"^THE", re.IGNORECASE)
+_BUS_AND_DBA = re.compile(r"\b(AND|DBA)\b")
+_BUS_TRAILING_S = re.compile(r"\b( S$)\b", re.IGNORECASE)
+_BUS_SPLIT_WORDS = ("INC", "LTD", "LTEE", "LIMITED", "INCORPORATED", "INCORPORATEE", "INCORPORATION")
+_BUS_REPLACE = (
+    (re.compile(r"\b(BRITISH COLUMBIA|BRITISHCOLUMBIA)\b", re.IGNORECASE), "BC"),
+    (re.compile(r"\b(LIMITED|PARTNERSHIP|GP|LLP|LP)\b", re.IGNORECASE), ""),
+    (re.compile(r"\b(SOCIETY|ASSOCIATION|TRUST|TRUSTEE|SOCIETE)\b", re.IGNORECASE), ""),
+    (re.compile(r"\b(INCORPORATED|INCORPOREE|INCORPORATION|INCORP|INC)\b", re.IGNORECASE), ""),
+    (re.compile(r"\b(COMPANY|CORPORATIONS|CORPORATION|CORPS|CORP|CO)\b", re.IGNORECASE), ""),
+    (re.compile(r"\b(LIMITEE|LTEE|LTD|ULC)\b", re.IGNORECASE), ""),
+    (re.compile(r"\b(AND)\b", re.IGNORECASE), "AN"),
+    (re.compile(r"&"), "AN"),
+    (_BUS_BRACKETS, ""),
+    (_BUS_THE, ""),
+    (re.compile(r"\b(DBA)\b"), ""),
+    (_NON_WORD_SPACE, ""),
+    (_SPACES, ""),
+)
+
+
+def _upper(value: str) -> str:
+    """Postgres UPPER: characters with a multiple character upper case (such as ß) are unchanged."""
+    return "".join(char.upper() if len(char.upper()) == 1 else char for char in value)
+
+
+def _trim(value: str) -> str:
+    """Postgres TRIM: only spaces are removed."""
+    return value.strip(" ")
+
+
+def _split_part(value: str, part: int) -> str:
+    """Postgres SPLIT_PART on a space: an empty string if there are fewer parts."""
+    parts = value.split(" ")
+    return parts[part - 1] if len(parts) >= part else ""
+
+
+def _individual_name(name: str) -> str:
+    """Remove special characters and prefixes/suffixes from an individual name."""
+    return _IND_PREFIX.sub("", _NON_WORD.sub(" ", name))
+
+
+def searchkey_last_name(actual_name: str) -> str:
+    """Python version of the searchkey_last_name database function."""
+    if actual_name is None:
+        return None
+    last_name = _trim(_SPACES.sub(" ", _individual_name(actual_name)))
+    return _upper(_REPEATING.sub(r"\1", last_name))
+
+
+def searchkey_individual(last_name: str, first_name: str) -> str:
+    """Python version of the searchkey_individual database function."""
+    if last_name is None or first_name is None:
+        return None
+    return searchkey_last_name(last_name) + " " + searchkey_last_name(first_name)
+
+
+def individual_split_1(actual_name: str) -> str:
+    """Python version of the individual_split_1 database function: extra spaces are not removed."""
+    if actual_name is None:
+        return None
+    return _upper(_split_part(_trim(_individual_name(actual_name)), 1))
+
+
+def individual_split_2(actual_name: str) -> str:
+    """Python version of the individual_split_2 database function."""
+    if actual_name is None:
+        return None
+    return _upper(_split_part(_trim(_SPACES.sub(" ", _individual_name(actual_name))), 2))
+
+
+def individual_split_3(actual_name: str) -> str:
+    """Python version of the individual_split_3 database function."""
+    if actual_name is None:
+        return None
+    return _upper(_split_part(_trim(_SPACES.sub(" ", _individual_name(actual_name))), 3))
+
+
+def business_name_strip_designation(actual_name: str) -> str:
+    """Python version of the business_name_strip_designation database function."""
+    if actual_name is None:
+        return None
+    base = _SPACES.sub("", _BUS_DESIGNATION.sub("", _NON_WORD_SPACE.sub("", actual_name)))
+    return _trim(base)
+
+
+def _business_number_key(actual_name: str) -> str:
+    """Return the search key of a business name starting with a number of at least 5 digits, or None."""
+    if len(_split_part(_BUS_UPPER.sub("", actual_name), 1)) < 5:
+        return None
+    search_key = _BUS_LEADING_ZEROS.sub("", actual_name)
+    search_key = _BUS_LETTERS.sub("", _split_part(search_key, 1))
+    return _NON_WORD_SPACE.sub("", search_key) or None
+
+
+def _business_name_key(actual_name: str) -> str:
+    """Return the business name search key before the common words are removed."""
+    search_key = _upper(actual_name)
+    for word in _BUS_SPLIT_WORDS:
+        search_key = _upper(search_key).split(word, 1)[0]
+    search_key = _BUS_BRACKETS.sub("", search_key)
+    search_key = _BUS_THE.sub("", search_key)
+    search_key = _BUS_AND_DBA.sub("", search_key)
+    search_key = _NON_WORD_SPACE.sub(" ", search_key)
+    search_key = _trim(_SPACES.sub(" ", search_key))
+    search_key = _BUS_TRAILING_S.sub("", search_key)
+    if search_key[1:2] == " " and search_key[3:4] == " " and search_key[5:6] != " ":
+        search_key = _trim(_SPACES.sub("", search_key[0:3])) + search_key[3:149]
+    elif search_key[1:2] == " " and search_key[3:4] == " " and search_key[5:6] == " ":
+        search_key = _trim(_SPACES.sub("", search_key[0:3])) + search_key[4:149]
+    return search_key
+
+
+def business_name_common_words(actual_name: str) -> list:
+    """Return the business name words the database function looks up in the common_word table."""
+    if actual_name is None or _business_number_key(actual_name):
+        return []
+    search_key = _business_name_key(actual_name)
+    words = [_split_part(search_key, 3), _split_part(search_key, 4), _split_part(search_key, 5)]
+    return [word for word in words if word]
+
+
+def searchkey_business_name(actual_name: str, common_words: set = None) -> str:
+    """Python version of the searchkey_business_name database function.
+
+    The common words are the business_name_common_words values that exist in the common_word table.
+    """
+    if actual_name is None:
+        return None
+    number_key = _business_number_key(actual_name)
+    if number_key:
+        return number_key
+    search_key = _business_name_key(actual_name)
+    if common_words:
+        # The words are looked up before any are removed, then used as case insensitive regular expressions.
+        words = [_split_part(search_key, 3), _split_part(search_key, 4), _split_part(search_key, 5)]
+        for word in words:
+            if word and word in common_words:
+                search_key = re.sub(word, "", search_key, flags=re.IGNORECASE)
+    if len(_trim(search_key)) == 0:
+        search_key = actual_name
+    for pattern, replacement in _BUS_REPLACE:
+        search_key = pattern.sub(replacement, search_key)
+    return _trim(search_key)
+
+
+def get_common_words(session, names) -> set:
+    """Return the common_word table words used by the business names in one query."""
+    words = set()
+    for name in names:
+        words.update(business_name_common_words(name))
+    if not words:
+        return set()
+    result = session.execute(COMMON_WORD_QUERY, {"words": sorted(words)})
+    return {row[0] for row in result}
+
+
+def set_debtor_search_keys(session, parties):
+    """Set the search keys of a batch of new debtor parties.
+
+    The keys are generated in memory with at most one common_word query, or with one database function query for
+    the batch when DEBTOR_SEARCH_KEY_STRICT is configured.
+    """
+    business = [party for party in parties if party.party_type == party.PartyTypes.DEBTOR_COMPANY.value]
+    individual = [party for party in parties if party.party_type == party.PartyTypes.DEBTOR_INDIVIDUAL.value]
+    if not business and not individual:
+        return
+    if current_app.config.get(STRICT_CONFIG_KEY):
+        keys = _get_batch_keys(session, business + individual)
+    else:
+        common_words = get_common_words(session, [party.business_name for party in business])
+        keys = [
+            (
+                searchkey_business_name(party.business_name, common_words),
+                business_name_strip_designation(party.business_name),
+            )
+            for party in business
+        ]
+        keys.extend(
+            [
+                (
+                    None,
+                    None,
+                    searchkey_individual(party.last_name, party.first_name),
+                    searchkey_last_name(party.last_name),
+                    individual_split_1(party.first_name),
+                    individual_split_2(party.first_name),
+                    individual_split_1(party.last_name),
+                    individual_split_2(party.last_name),
+                    individual_split_3(party.last_name),
+                )
+                for party in individual
+            ]
+        )
+    for party, row in zip(business, keys[: len(business)]):
+        party.business_search_key = str(row[0])
+        party.bus_name_base = str(row[1])
+        party.bus_name_key_char1 = party.business_search_key[0:1]
+    for party, row in zip(individual, keys[len(business) :]):
+        party.first_name_key = str(row[2])
+        party.last_name_key = str(row[3])
+        party.first_name_split1 = str(row[4])
+        party.first_name_split2 = str(row[5])
+        party.last_name_split1 = str(row[6])
+        party.last_name_split2 = str(row[7])
+        party.last_name_split3 = str(row[8])
+        party.first_name_key_char1 = party.first_name_key[0:1]
+    logger.debug(f"Set search keys for {len(business)} business and {len(individual)} individual debtors.")
+
+
+def _get_batch_keys(session, parties) -> list:
+    """Generate the search keys of the parties with the database functions in one query."""
+    business_names = []
+    last_names = []
+    first_names = []
+    for party in parties:
+        is_business = party.party_type == party.PartyTypes.DEBTOR_COMPANY.value
+        business_names.append(party.business_name if is_business else None)
+        last_names.append(None if is_business else party.last_name)
+        first_names.append(None if is_business else party.first_name)
+    params = {"business_names": business_names, "last_names": last_names, "first_names": first_names}
+    return session.execute(text(BATCH_QUERY), params).fetchall()
@@ -160,12 +160,13 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
     def search_by_serial_type(self):
         """Execute a search query for either an aircraft DOT, MHR number, or serial number search type."""
         search_value = self.request_json["criteria"]["value"]
-        query = search_utils.SERIAL_NUM_QUERY
+        use_index: bool = current_app.config.get("SEARCH_SERIAL_INDEX", False)
+        query = search_utils.SERIAL_NUM_INDEX_QUERY if use_index else search_utils.SERIAL_NUM_QUERY
         if self.search_type == "MH":
-            query = search_utils.MHR_NUM_QUERY
+            query = search_utils.MHR_NUM_INDEX_QUERY if use_index else search_utils.MHR_NUM_QUERY
             query = query.replace("CASE WHEN serial_number", "CASE WHEN mhr_number")
         elif self.search_type == "AC":
-            query = search_utils.AIRCRAFT_DOT_QUERY
+            query = search_utils.AIRCRAFT_DOT_INDEX_QUERY if use_index else search_utils.AIRCRAFT_DOT_QUERY
         rows = None
         try:
             result = db.session.execute(text(query), {"query_value": search_value.strip().upper()})
@@ -318,6 +319,8 @@ class SearchRequest(db.Model):  # pylint: disable=too-many-instance-attributes
     def get_total_count(self):
         """Execute a search to get the total match count for the search criteria. Only call if limit reached."""
         query_text = search_utils.COUNT_QUERY_FROM_SEARCH_TYPE[self.search_type]
+        if current_app.config.get("SEARCH_SERIAL_INDEX", False):
+            query_text = search_utils.COUNT_INDEX_QUERY_FROM_SEARCH_TYPE.get(self.search_type, query_text)
         if query_text:
             count_query = text(query_text)
             result = None
@@ -46,7 +46,12 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
         "search_id", db.Integer, db.ForeignKey("search_requests.id"), primary_key=True, nullable=False
     )
     search_select = db.mapped_column("api_result", db.JSON, nullable=True)
-    search_response = db.mapped_column("registrations", db.JSON, nullable=False)
+    # Search result details are stored either as json or, if SEARCH_RESULTS_COMPRESS is set, as gzip compressed json.
+    search_response_json = db.mapped_column("registrations", db.JSON(none_as_null=True), nullable=True)
+    # Deferred: only loaded and decompressed when the search result details are accessed.
+    search_response_gz = db.mapped_column("registrations_gz", db.LargeBinary, nullable=True, deferred=True)
+    # Serialized details size recorded when compressed details are written.
+    search_response_size = db.mapped_column("registrations_size", db.Integer, nullable=True)
     score = db.mapped_column("score", db.Integer, nullable=True)
     exact_match_count = db.mapped_column("exact_match_count", db.Integer, nullable=True)
     similar_match_count = db.mapped_column("similar_match_count", db.Integer, nullable=True)
@@ -64,6 +69,40 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
         "SearchRequest", foreign_keys=[search_id], back_populates="search_result", cascade="all, delete", uselist=False
     )
 
+    @property
+    def search_response(self):
+        """Return the search result details, decompressing and caching them on first access if compressed."""
+        if self.search_response_json is not None or not self.search_response_gz:
+            return self.search_response_json
+        if getattr(self, "_search_response", None) is None:
+            self._search_response = model_utils.decompress_json(self.search_response_gz)
+        return self._search_response
+
+    @search_response.setter
+    def search_response(self, value):
+        """Set the search result details, compressing them and recording the size if configured."""
+        self._search_response = None
+        self._results_length = None
+        if value is not None and current_app.config.get("SEARCH_RESULTS_COMPRESS"):
+            self.search_response_gz, self.search_response_size, self._results_length = model_utils.compress_json(
+                value, "details"
+            )
+            self.search_response_json = None
+            self._search_response = value
+        else:
+            self.search_response_json = value
+            self.search_response_gz = None
+            self.search_response_size = None
+
+    def get_results_length(self, results) -> int:
+        """Get the search details data size for the report thresholds: the default json separators size.
+
+        Use the size recorded when the compressed details were written to avoid serializing the details again.
+        """
+        if getattr(self, "_results_length", None) is not None:
+            return self._results_length
+        return len(json.dumps(results))
+
     @property
     def json(self) -> dict:
         """Return the search query results as a json object."""
@@ -129,7 +168,7 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
                     self.score = SCORE_LARGE_REPORT
                     logger.info("Setting score to mark report generation for large search container.")
             else:
-                results_length = len(json.dumps(new_results))
+                results_length = self.get_results_length(new_results)
                 logger.debug(f"Search id={self.search_id} data size={results_length}.")
                 if results_length > current_app.config.get("MAX_SIZE_SEARCH_RT"):
                     # Small results size but large report data: allow callback
@@ -139,7 +178,7 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
                         self.score = SCORE_LARGE_REPORT
                         logger.info("Setting score to mark report generation for large search container.")
         else:
-            results_length = len(json.dumps(new_results))
+            results_length = self.get_results_length(new_results)
             logger.debug(f"Search id= {self.search_id} results size={results_length}.")
             if results_length > current_app.config.get("MAX_SIZE_SEARCH_RT"):
                 logger.info(f"Search id={self.search_id} size exceeds RT max, setting up async report.")
@@ -148,8 +187,12 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
 
     def build_details(self):
         """Generate the search selection details from the search selection order without duplicates."""
-        results = self.search_response
+        # Index the details by base registration number: the first matching detail is used.
+        results_by_reg_num = {}
+        for result in self.search_response:
+            results_by_reg_num.setdefault(result["financingStatement"]["baseRegistrationNumber"], result)
         new_results = []
+        added_reg_nums = set()
         similar_count = 0
         # Use the same order as the search selection match list in the registration list.
         for select in self.search_select:
@@ -159,16 +202,9 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
                 if select["matchType"] != model_utils.SEARCH_MATCH_EXACT:
                     similar_count += 1
                 reg_num = select["baseRegistrationNumber"]
-                found = False
-                if new_results:  # Check for duplicates.
-                    for match in new_results:
-                        if match["financingStatement"]["baseRegistrationNumber"] == reg_num:
-                            found = True
-                if not found:  # No duplicates.
-                    for result in results:
-                        if reg_num == result["financingStatement"]["baseRegistrationNumber"]:
-                            new_results.append(result)
-                            break
+                if reg_num not in added_reg_nums and reg_num in results_by_reg_num:  # No duplicates.
+                    added_reg_nums.add(reg_num)
+                    new_results.append(results_by_reg_num[reg_num])
         self.similar_match_count = similar_count
         return new_results
 
@@ -181,18 +217,16 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
         # Remove duplicates
         reg_list = list(dict.fromkeys(reg_list))
         update_select = []
-        # Always use original exact matches
+        # Always use original exact matches, index similar matches by registration number in the original order.
+        similar_by_reg_num = {}
         for original in original_select:
             if original["matchType"] == model_utils.SEARCH_MATCH_EXACT:
                 update_select.append(original)
+            else:
+                similar_by_reg_num.setdefault(original["baseRegistrationNumber"], []).append(original)
         # Set similar matches with no duplicates.
         for reg_num in reg_list:
-            for original in original_select:
-                if (
-                    original["matchType"] != model_utils.SEARCH_MATCH_EXACT
-                    and original["baseRegistrationNumber"] == reg_num
-                ):
-                    update_select.append(original)
+            update_select.extend(similar_by_reg_num.get(reg_num, []))
 
         # Now sort by search type.
         if self.search.search_type == SearchRequest.SearchTypes.INDIVIDUAL_DEBTOR.value:
@@ -330,21 +364,19 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
 
         search_result = SearchResult(search_id=search_query.id, exact_match_count=0, similar_match_count=0)
         query_results = search_query.search_response
+        # Load all the financing statements in a fixed number of queries instead of one graph at a time.
+        statements = FinancingStatement.find_all_by_registration_numbers(
+            [result["baseRegistrationNumber"] for result in query_results]
+        )
         detail_results = []
+        added_reg_nums = set()
         for result in query_results:
             reg_num = result["baseRegistrationNumber"]
             match_type = result["matchType"]
-            found = False
-            if detail_results:  # Check for duplicates.
-                for statement in detail_results:
-                    if statement["financingStatement"]["baseRegistrationNumber"] == reg_num:
-                        found = True
-            if not found:  # No duplicates.
-                # Set to staff for small performance gain: skip account id/historical checks.
-                financing = FinancingStatement.find_by_registration_number(reg_num, None, True, False)
+            if reg_num not in added_reg_nums:  # No duplicates.
+                added_reg_nums.add(reg_num)
+                financing = SearchResult.get_search_financing(statements, reg_num)
                 financing.mark_update_json = mark_added  # Added for PDF, indicate if party or collateral was added.
-                # Set to true to include change history.
-                financing.include_changes_json = True
                 financing_json = {"matchType": match_type, "financingStatement": financing.json}
                 detail_results.append(financing_json)
                 if match_type == model_utils.SEARCH_MATCH_EXACT:
@@ -355,6 +387,17 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
         search_result.search_response = detail_results
         return search_result
 
+    @staticmethod
+    def get_search_financing(statements: dict, reg_num: str) -> FinancingStatement:
+        """Get a bulk loaded financing statement by registration number set up to include change history."""
+        financing = statements.get(reg_num)
+        if not financing:  # Not bulk loaded: look up individually so a missing statement raises a not found error.
+            # Set to staff for small performance gain: skip account id/historical checks.
+            financing = FinancingStatement.find_by_registration_number(reg_num, None, True, False)
+        # Set to true to include change history.
+        financing.include_changes_json = True
+        return financing
+
     @staticmethod
     def create_from_json(search_json, search_id: int):
         """Create a search detail object from dict/json specifying the search selection."""
@@ -362,12 +405,11 @@ class SearchResult(db.Model):  # pylint: disable=too-many-instance-attributes
         search.search_id = search_id
         search.search_select = search_json
         detail_results = []
+        statements = FinancingStatement.find_all_by_registration_numbers(
+            [result["baseRegistrationNumber"] for result in search_json]
+        )
         for result in search_json:
-            reg_num = result["baseRegistrationNumber"]
-            # Set to staff for small performance gain: skip account id/historical checks.
-            financing = FinancingStatement.find_by_registration_number(reg_num, None, True, False)
-            # Set to true to include change history.
-            financing.include_changes_json = True
+            financing = SearchResult.get_search_financing(statements, result["baseRegistrationNumber"])
             financing_json = {"financingStatement": financing.json}
             detail_results.append(financing_json)
         search.search_response = detail_results
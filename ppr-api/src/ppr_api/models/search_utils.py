@@ -167,6 +167,46 @@ ORDER BY match_type, sc.serial_number ASC, sc.year ASC, r.registration_ts ASC
 """
 )
 
+# Serial number search base where clause using the serial_search index table maintained on registration commits.
+# Same result columns as SERIAL_SEARCH_BASE: expiry and discharge eligibility are precomputed columns.
+SERIAL_INDEX_SEARCH_BASE = """
+SELECT ss.registration_type,ss.registration_ts AS base_registration_ts,
+        ss.serial_type,ss.serial_number,ss.year,ss.make,ss.model,
+        ss.registration_number AS base_registration_num,
+        CASE WHEN serial_number = :query_value THEN 'EXACT' ELSE 'SIMILAR' END match_type,
+        ss.expire_date,ss.state_type,ss.id AS vehicle_id, ss.mhr_number
+  FROM serial_search ss
+ WHERE (ss.expire_date IS NULL OR ss.expire_date > ((now() at time zone 'utc') - interval '30 days'))
+   AND (ss.discharge_ts IS NULL OR ss.discharge_ts >= ((now() at time zone 'utc') - interval '30 days'))
+"""
+
+MHR_NUM_INDEX_QUERY = (
+    SERIAL_INDEX_SEARCH_BASE
+    + """
+   AND ss.serial_type = 'MH' 
+   AND ss.mhr_number = (SELECT searchkey_mhr(:query_value)) 
+ORDER BY match_type, ss.serial_number ASC, ss.year ASC, ss.registration_ts ASC
+"""
+)
+
+SERIAL_NUM_INDEX_QUERY = (
+    SERIAL_INDEX_SEARCH_BASE
+    + """
+   AND ss.serial_type NOT IN ('AC', 'AF', 'AP')
+   AND ss.srch_vin = (SELECT searchkey_vehicle(:query_value)) 
+ORDER BY match_type, ss.serial_number ASC, ss.year ASC, ss.registration_ts ASC
+"""
+)
+
+AIRCRAFT_DOT_INDEX_QUERY = (
+    SERIAL_INDEX_SEARCH_BASE
+    + """
+   AND ss.serial_type IN ('AC', 'AF', 'AP')
+   AND ss.srch_vin = (SELECT searchkey_aircraft(:query_value)) 
+ORDER BY match_type, ss.serial_number ASC, ss.year ASC, ss.registration_ts ASC
+"""
+)
+
 BUSINESS_NAME_QUERY = """
 WITH q AS (
    SELECT(SELECT searchkey_business_name(:query_bus_name)) AS search_key,
@@ -350,6 +390,25 @@ AIRCRAFT_DOT_TOTAL_COUNT = (
     + "AND sc.srch_vin = searchkey_aircraft(:query_value)"
 )
 
+SERIAL_INDEX_SEARCH_COUNT_BASE = """
+SELECT COUNT(ss.id) AS query_count
+  FROM serial_search ss
+ WHERE (ss.expire_date IS NULL OR ss.expire_date > ((now() at time zone 'utc') - interval '30 days'))
+   AND (ss.discharge_ts IS NULL OR ss.discharge_ts >= ((now() at time zone 'utc') - interval '30 days'))
+"""
+
+COUNT_INDEX_QUERY_FROM_SEARCH_TYPE = {
+    "AC": SERIAL_INDEX_SEARCH_COUNT_BASE
+    + " AND ss.serial_type IN ('AC', 'AF') "
+    + "AND ss.srch_vin = searchkey_aircraft(:query_value)",
+    "MH": SERIAL_INDEX_SEARCH_COUNT_BASE
+    + " AND ss.serial_type = 'MH' "
+    + "AND ss.mhr_number = searchkey_mhr(:query_value)",
+    "SS": SERIAL_INDEX_SEARCH_COUNT_BASE
+    + " AND ss.serial_type NOT IN ('AC', 'AF') "
+    + "AND ss.srch_vin = searchkey_vehicle(:query_value)",
+}
+
 COUNT_QUERY_FROM_SEARCH_TYPE = {
     "AC": AIRCRAFT_DOT_TOTAL_COUNT,
     "BS": BUSINESS_NAME_TOTAL_COUNT,
@@ -0,0 +1,72 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This module holds the serial collateral search index.
+
+One row per current serial collateral record of a base registration. The search data, expiry date, state, and
+discharge timestamp are copied from the source tables when a registration is committed so serial number, MHR number,
+and aircraft DOT searches are a single indexed lookup without joins or a discharge sub-query.
+"""
+from sqlalchemy.sql import text
+
+from ppr_api.utils.logging import logger
+
+from .db import db
+
+REFRESH_STATEMENT = "SELECT serial_search_refresh(:financing_id)"  # noqa: Q000
+
+
+class SerialSearch(db.Model):  # pylint: disable=too-many-instance-attributes
+    """This class maintains the serial collateral search index records."""
+
+    __tablename__ = "serial_search"
+
+    # Same as the serial_collateral id.
+    id = db.mapped_column("id", db.Integer, primary_key=True)
+    financing_id = db.mapped_column("financing_id", db.Integer, nullable=False, index=True)
+    # Base registration information.
+    registration_type = db.mapped_column("registration_type", db.String(2), nullable=False)
+    registration_ts = db.mapped_column("registration_ts", db.DateTime, nullable=False)
+    registration_num = db.mapped_column("registration_number", db.String(10), nullable=False)
+    # Serial collateral information.
+    vehicle_type = db.mapped_column("serial_type", db.String(2), nullable=False)
+    serial_number = db.mapped_column("serial_number", db.String(30), nullable=True)
+    year = db.mapped_column("year", db.Integer, nullable=True)
+    make = db.mapped_column("make", db.String(60), nullable=True)
+    model = db.mapped_column("model", db.String(60), nullable=True)
+    mhr_number = db.mapped_column("mhr_number", db.String(6), nullable=True, index=True)
+    search_vin = db.mapped_column("srch_vin", db.String(6), nullable=True, index=True)
+    # Precomputed search eligibility.
+    expire_date = db.mapped_column("expire_date", db.DateTime, nullable=True)
+    state_type = db.mapped_column("state_type", db.String(3), nullable=False)
+    discharge_ts = db.mapped_column("discharge_ts", db.DateTime, nullable=True)
+
+    @classmethod
+    def find_by_financing_id(cls, financing_id: int):
+        """Return the search index records for a financing statement."""
+        if not financing_id:
+            return []
+        return db.session.query(SerialSearch).filter(SerialSearch.financing_id == financing_id).all()
+
+    @staticmethod
+    def refresh(financing_id: int) -> int:
+        """Replace the search index records for a financing statement within the current transaction.
+
+        Call after the registration changes are flushed and before the commit.
+        """
+        if not financing_id:
+            return 0
+        result = db.session.execute(text(REFRESH_STATEMENT), {"financing_id": financing_id})
+        count = result.scalar()
+        logger.debug(f"Serial search index refreshed {count} records for financing id {financing_id}.")
+        return count
@@ -29,6 +29,9 @@ class TestSearch(db.Model):
     id = db.mapped_column("id", db.Integer, db.Sequence("test_searches_id_seq"), primary_key=True)
     search_criteria = db.mapped_column("search_criteria", db.Text, nullable=False)
     run_time = db.mapped_column("run_time", db.Float, nullable=False)
+    # Performance mode: search result row count and the EXPLAIN (ANALYZE, BUFFERS) JSON plans.
+    row_count = db.mapped_column("row_count", db.Integer, nullable=True)
+    query_plan = db.mapped_column("query_plan", db.Text, nullable=True)
 
     # parent keys
     batch_id = db.mapped_column(
@@ -72,6 +75,8 @@ class TestSearch(db.Model):
             },
             "runTime": self.run_time,
         }
+        if self.row_count is not None:
+            search["rowCount"] = self.row_count
 
         search["matchesExact"]["passed"] = (
             len(search["matchesExact"]["missedMatches"]) == 0 and search["matchesExact"]["firstFailIndex"] == -1
@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from enum import Enum
 from typing import List
 
 from ppr_api.models import utils as model_utils
@@ -24,9 +25,24 @@ from ppr_api.models.search_request import SearchRequest
 from .db import db
 
 
+def percentile(values: List[float], pct: int) -> float:
+    """Return the nearest rank percentile of the values: None if there are no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-pct * len(ordered) // 100))
+    return ordered[rank - 1]
+
+
 class TestSearchBatch(db.Model):
     """This class maintains test search batches detail information (for automated testing)."""
 
+    class TestModes(Enum):
+        """Render an enum of the test search batch modes."""
+
+        ACCURACY = "ACCURACY"
+        PERFORMANCE = "PERFORMANCE"
+
     __tablename__ = "test_search_batches"
 
     id = db.mapped_column("id", db.Integer, db.Sequence("test_search_batches_id_seq"), primary_key=True)
@@ -37,8 +53,16 @@ class TestSearchBatch(db.Model):
     sim_val_business = db.mapped_column("sim_val_business", db.Float, nullable=True)
     sim_val_first_name = db.mapped_column("sim_val_first_name", db.Float, nullable=True)
     sim_val_last_name = db.mapped_column("sim_val_last_name", db.Float, nullable=True)
+    # Performance mode run time percentiles in seconds across the batch searches.
+    test_mode = db.mapped_column("test_mode", db.String(20), nullable=True)
+    run_time_p50 = db.mapped_column("run_time_p50", db.Float, nullable=True)
+    run_time_p95 = db.mapped_column("run_time_p95", db.Float, nullable=True)
+    run_time_p99 = db.mapped_column("run_time_p99", db.Float, nullable=True)
+    baseline = db.mapped_column("baseline", db.Boolean, nullable=True)
+    regression = db.mapped_column("regression", db.Boolean, nullable=True)
 
     # parent keys
+    baseline_id = db.mapped_column("baseline_id", db.Integer, db.ForeignKey("test_search_batches.id"), nullable=True)
 
     # relationships - test_search
     searches = db.relationship("TestSearch", back_populates="search_batch")
@@ -52,6 +76,15 @@ class TestSearchBatch(db.Model):
         elif self.search_type == SearchRequest.SearchTypes.INDIVIDUAL_DEBTOR.value:
             batch["similarityValueFirst"] = self.sim_val_first_name
             batch["similarityValueLast"] = self.sim_val_last_name
+        if self.test_mode == TestSearchBatch.TestModes.PERFORMANCE.value:
+            batch["testMode"] = self.test_mode
+            batch["runTimeP50"] = self.run_time_p50
+            batch["runTimeP95"] = self.run_time_p95
+            batch["runTimeP99"] = self.run_time_p99
+            batch["baseline"] = bool(self.baseline)
+            batch["regression"] = bool(self.regression)
+            if self.baseline_id:
+                batch["baselineId"] = self.baseline_id
 
         searches = []
         for search in self.searches:
@@ -61,6 +94,22 @@ class TestSearchBatch(db.Model):
 
         return batch
 
+    def set_run_time_percentiles(self):
+        """Set the batch run time percentiles from the search run times."""
+        run_times = [search.run_time for search in self.searches if search.run_time is not None]
+        self.run_time_p50 = percentile(run_times, 50)
+        self.run_time_p95 = percentile(run_times, 95)
+        self.run_time_p99 = percentile(run_times, 99)
+
+    def check_regression(self, baseline: TestSearchBatch, threshold: float) -> bool:
+        """Flag the batch as a regression if the p95 run time exceeds the baseline p95 by more than the threshold."""
+        self.regression = False
+        if not baseline or baseline.run_time_p95 is None or self.run_time_p95 is None:
+            return self.regression
+        self.baseline_id = baseline.id
+        self.regression = self.run_time_p95 > baseline.run_time_p95 * (1 + threshold)
+        return self.regression
+
     def save(self):
         """Render a search batch to the local cache."""
         db.session.add(self)
@@ -89,3 +138,17 @@ class TestSearchBatch(db.Model):
             batch = batch.filter(TestSearchBatch.test_date <= before_date)
 
         return batch.all()
+
+    @classmethod
+    def find_baseline(cls, search_type: str) -> TestSearchBatch:
+        """Return the most recent performance baseline search batch for the search type."""
+        return (
+            db.session.query(TestSearchBatch)
+            .filter(
+                TestSearchBatch.search_type == search_type,
+                TestSearchBatch.test_mode == TestSearchBatch.TestModes.PERFORMANCE.value,
+                TestSearchBatch.baseline.is_(True),
+            )
+            .order_by(TestSearchBatch.test_date.desc())
+            .first()
+        )
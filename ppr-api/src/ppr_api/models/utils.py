@@ -16,6 +16,8 @@
 Common constants used across models and utilities for mapping type codes
 between the API and the database in both directions.
 """
+import gzip
+import json
 from datetime import date  # noqa: F401 pylint: disable=unused-import
 from datetime import datetime as _datetime
 from datetime import time, timedelta, timezone
@@ -860,3 +862,29 @@ def search_ts(date_iso: str, start: bool = True):
         return _datetime.combine(date_part, day_time)
     day_time = time(23, 59, 59, tzinfo=timezone.utc)
     return _datetime.combine(date_part, day_time)
+
+
+def compress_json(data, list_key: str = None) -> tuple:
+    """Serialize and gzip compress json data, returning the compressed bytes and the serialized data sizes.
+
+    The returned sizes are of all the data and of the list: either the data or the data list_key property. The list
+    is serialized once, with the default json separators, and its text is reused in the serialized data.
+    """
+    if list_key is None or not isinstance(data, dict) or list_key not in data:
+        serialized = json.dumps(data)
+        list_size = len(serialized)
+    else:
+        list_text = json.dumps(data[list_key])
+        other_text = json.dumps({key: value for key, value in data.items() if key != list_key})
+        separator = ", " if len(other_text) > 2 else ""
+        serialized = other_text[:-1] + separator + json.dumps(list_key) + ": " + list_text + "}"
+        list_size = len(list_text)
+    encoded = serialized.encode("utf-8")
+    return gzip.compress(encoded, compresslevel=6), len(encoded), list_size
+
+
+def decompress_json(data: bytes):
+    """Decompress and deserialize gzip compressed json data."""
+    if not data:
+        return None
+    return json.loads(gzip.decompress(data))
@@ -10,25 +10,24 @@
 # specific language governing permissions and limitations under the License.
 """Produces a PDF output based on templates and JSON messages."""
 import copy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from functools import partial
 from http import HTTPStatus
 from pathlib import Path
 
 import markupsafe
 import pycountry
-import requests
 from flask import current_app
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from ppr_api.callback.auth.token_service import GoogleStorageTokenService
 from ppr_api.models import utils as model_utils
 from ppr_api.reports.v2 import report_utils
+from ppr_api.reports.v2.report_client import ReportClient
 from ppr_api.reports.v2.report_utils import ReportMeta, ReportTypes
 from ppr_api.utils.logging import logger
 
 SINGLE_URI = "/forms/chromium/convert/html"
-MERGE_URI = "/forms/pdfengines/merge"
 SUBREPORT_SIZE = 500
 RS_TIMEOUT = 1800.0
 
@@ -53,8 +52,14 @@ class Report:  # pylint: disable=too-few-public-methods
         rs_url: str = current_app.config.get("REPORT_SVC_LARGE_URL") if self.large_container else None
         return GoogleStorageTokenService.get_report_api_token(rs_url)
 
-    def send_request(self, uri: str, meta_data, files, rs_token):
-        """Post report generation request to the report service with a retry strategy on 502, 503 responses."""
+    def send_request(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, uri: str, meta_data, files, rs_token, report_type=None
+    ):
+        """Post report generation request to the report service with the shared pooled client.
+
+        The report type is only logged: set it when the request is not for the current report key.
+        """
+        report_key = report_type or self._report_key
         url = current_app.config.get("REPORT_SVC_URL") + uri
         if self.large_container:
             if current_app.config.get("REPORT_SVC_LARGE_URL"):
@@ -66,20 +71,12 @@ class Report:  # pylint: disable=too-few-public-methods
         if rs_token:
             headers["Authorization"] = "Bearer {}".format(rs_token)
         logger.debug(
-            "Account {0} report type {1} calling report-api {2}.".format(self._account_id, self._report_key, url)
+            "Account {0} report type {1} calling report-api {2}.".format(self._account_id, report_key, url)
         )
-        retry_strategy = Retry(total=4, backoff_factor=1.0, status_forcelist=[502, 503])
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        http = requests.Session()
-        http.mount("https://", adapter)
-        response = http.post(url=url, headers=headers, data=meta_data, files=files, timeout=RS_TIMEOUT)
-        if response.status_code == HTTPStatus.BAD_GATEWAY and self.large_container:
-            response = http.post(url=url, headers=headers, data=meta_data, files=files, timeout=RS_TIMEOUT)
-        if response.status_code == HTTPStatus.BAD_GATEWAY and self.large_container:
-            response = http.post(url=url, headers=headers, data=meta_data, files=files, timeout=RS_TIMEOUT)
+        response = ReportClient.post(url, headers, meta_data, files, RS_TIMEOUT)
         logger.info(
             "Account {0} report type {1} response status: {2}.".format(
-                self._account_id, self._report_key, response.status_code
+                self._account_id, report_key, response.status_code
             )
         )
         return response
@@ -114,82 +111,124 @@ class Report:  # pylint: disable=too-few-public-methods
     def get_search_pdf(self):
         """Render a search report with TOC page numbers set in a second report call."""
         logger.debug("Account {0} report type {1} setting up report data.".format(self._account_id, self._report_key))
-        data_copy = copy.deepcopy(self._report_data)
-        # 1: Generate the search pdf with no TOC page numbers or total page count.
-        data = self._setup_report_data()
-        meta_data = report_utils.get_report_meta_data(self._report_key)
         token = self.get_report_service_token()
-        files = report_utils.get_report_files(data, self._report_key, False, False)
-        response_reg = self.send_request(SINGLE_URI, meta_data, files, token)
+        # 1: Generate the search pdf with no TOC page numbers or total page count.
+        response_reg = self._get_search_first_pass(token)
         if response_reg.status_code != HTTPStatus.OK:
             return report_utils.report_error(response_reg, self._report_key, self._account_id)
         # 2: Set TOC page numbers in report data from initial search pdf page numbering.
-        self._report_data = report_utils.update_toc_page_numbers(data_copy, response_reg.content)
+        self._report_data = report_utils.update_toc_page_numbers(self._report_data, response_reg.content)
         # 3: Generate search report again with TOC page numbers and total page count.
-        data_final = self._setup_report_data()
-        files = report_utils.get_report_files(data_final, self._report_key, False, False)
         logger.info("Search report regenerating with TOC page numbers set.")
-        response = self.send_request(SINGLE_URI, meta_data, files, token)
+        response = self._send_search_request(token)
         logger.info("Search report regeneration with TOC page numbers completed.")
         if response.status_code != HTTPStatus.OK:
             return report_utils.report_error(response, self._report_key, self._account_id)
         return response.content, response.status_code, {"Content-Type": "application/pdf"}
 
-    def get_large_search_pdf(self):  # pylint: disable=too-many-locals
-        """Render a large search report as concatenated sub-reports."""
-        logger.debug(f"Account {self._account_id} large search setting up report data.")
+    def _get_search_first_pass(self, token):
+        """Render a search report with no TOC page numbers, keeping the report data unformatted for the next call."""
         data_copy = copy.deepcopy(self._report_data)
+        response = self._send_search_request(token)
+        self._report_data = data_copy
+        return response
+
+    def _send_search_request(self, token):
+        """Set up the search report data and post the search report generation request to the report service."""
+        data = self._setup_report_data()
+        meta_data = report_utils.get_report_meta_data(self._report_key)
+        files = report_utils.get_report_files(data, self._report_key, False, False)
+        return self.send_request(SINGLE_URI, meta_data, files, token)
+
+    @staticmethod
+    def _send_concurrent(requests_list: list) -> list:
+        """Run report service requests concurrently with the configured pool width, returning responses in order."""
+        app = current_app._get_current_object()  # pylint: disable=protected-access; thread needs the app context
+        pool_size: int = max(1, min(int(current_app.config.get("REPORT_SEARCH_POOL_SIZE", 1)), len(requests_list)))
+
+        def run_request(request_call):
+            with app.app_context():
+                return request_call()
+
+        logger.info(f"Sending {len(requests_list)} report requests with pool size {pool_size}.")
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            return list(executor.map(run_request, requests_list))
+
+    def _get_subreports(self, data_copy: dict) -> list:
+        """Split the search report data into sub-reports of at most SUBREPORT_SIZE registrations."""
         data_length = len(data_copy["details"])
-        search_ts = data_copy.get("searchDateTime")
-        subreport_count = 0
-        start_index = 0
-        end_index = SUBREPORT_SIZE
-        report_files = {}
         details = data_copy["details"]
         selected = data_copy["selected"]
-        select_index = 0
         rep_count = int(data_length / SUBREPORT_SIZE) + ((data_length / SUBREPORT_SIZE) % 1 > 0)
-        rep_summary = []
-        self._report_data["pageNumOffset"] = 0
+        report_info = {key: value for key, value in data_copy.items() if key not in ("details", "selected")}
+        subreports = []
+        start_index = 0
+        select_index = 0
         while start_index < data_length:
-            subreport_count += 1
+            subreport_count = len(subreports) + 1
             logger.info(f"Account {self._account_id} building subreport {subreport_count}")
-            logger.debug(f"Start index={start_index} end index={end_index}")
-            self._report_data["details"] = details[start_index:end_index]
-            logger.debug("Details length=" + str(len(self._report_data["details"])))
-            # logger.debug(f'Select index={select_index} length=' + str(len(selected)))
-            self._report_data["selected"] = report_utils.get_subreport_selected(
-                selected[select_index:], self._report_data["details"]
-            )
-            logger.debug(f"Select index={select_index} length=" + str(len(self._report_data["selected"])))
-            self._report_data["searchDateTime"] = search_ts
-            self._report_data["subreport"] = f"{subreport_count} of {rep_count}"
+            logger.debug(f"Start index={start_index} end index={start_index + SUBREPORT_SIZE}")
+            # Each sub-report is rendered in its own thread: nothing is shared between the sub-report data copies.
+            sub_data = copy.deepcopy(report_info)
+            sub_data["details"] = details[start_index : start_index + SUBREPORT_SIZE]
+            logger.debug("Details length=" + str(len(sub_data["details"])))
+            sub_data["selected"] = report_utils.get_subreport_selected(selected[select_index:], sub_data["details"])
+            logger.debug(f"Select index={select_index} length=" + str(len(sub_data["selected"])))
+            sub_data["subreport"] = f"{subreport_count} of {rep_count}"
+            sub_data["pageNumOffset"] = 0
+            subreport = Report(sub_data, self._account_id, self._report_key, self._account_name)
+            subreport.large_container = True
+            subreports.append(subreport)
+            start_index += SUBREPORT_SIZE
+            select_index += len(sub_data["selected"])
+        return subreports
+
+    def get_large_search_pdf(self):  # pylint: disable=too-many-locals
+        """Render a large search report as concatenated sub-reports.
+
+        Sub-reports are rendered concurrently: first without TOC page numbers to get the page counts, then again with
+        the TOC page numbers offset by the page counts of the preceding sub-reports.
+        """
+        logger.debug(f"Account {self._account_id} large search setting up report data.")
+        data_copy = copy.deepcopy(self._report_data)
+        search_ts = data_copy.get("searchDateTime")
+        subreports = self._get_subreports(data_copy)
+        token = self.get_report_service_token()
+        # 1: Generate all the sub-reports with no TOC page numbers.
+        responses = Report._send_concurrent([partial(sub._get_search_first_pass, token) for sub in subreports])
+        # 2: Set the TOC page numbers from the sub-report page counts in sub-report order.
+        rep_summary = []
+        page_offset: int = 0
+        for subreport_count, (subreport, response) in enumerate(zip(subreports, responses), start=1):
+            if response.status_code != HTTPStatus.OK:
+                return report_utils.report_error(response, self._report_key, self._account_id)
+            sub_data = subreport._report_data  # pylint: disable=protected-access; same class
             rep_summary.append(
                 report_utils.get_report_summary(
-                    self._report_data["selected"],
-                    subreport_count,
-                    len(self._report_data["details"]),
-                    self._report_data["pageNumOffset"],
+                    sub_data["selected"], subreport_count, len(sub_data["details"]), page_offset
                 )
             )
-            content, status_code, headers = self.get_search_pdf()
-            if status_code != HTTPStatus.OK:
-                return content, status_code, headers
-            report_key = f"pdf{subreport_count}.pdf"
-            report_files[report_key] = content
-            start_index += SUBREPORT_SIZE
-            end_index += SUBREPORT_SIZE
-            select_index += len(self._report_data["selected"])
+            sub_data["pageNumOffset"] = page_offset
+            report_utils.update_toc_page_numbers(sub_data, response.content)
+            page_offset = sub_data["pageNumOffset"]
+        # 3: Generate all the sub-reports again with TOC page numbers and total page count.
+        logger.info("Large search sub-reports regenerating with TOC page numbers set.")
+        responses = Report._send_concurrent([partial(sub._send_search_request, token) for sub in subreports])
+        report_files = {}
+        for subreport_count, response in enumerate(responses, start=1):
+            if response.status_code != HTTPStatus.OK:
+                return report_utils.report_error(response, self._report_key, self._account_id)
+            report_files[f"pdf{subreport_count}.pdf"] = response.content
 
         # Build cover summary
         cover_data = {
             "searchDateTime": search_ts,
-            "reportCount": subreport_count,
-            "totalResultsSize": data_length,
-            "exactResultsSize": report_utils.get_exact_count(selected),
+            "reportCount": len(subreports),
+            "totalResultsSize": len(data_copy["details"]),
+            "exactResultsSize": report_utils.get_exact_count(data_copy["selected"]),
             "searchQuery": data_copy["searchQuery"],
             "reports": rep_summary,
-            "reportPageCount": self._report_data["pageNumOffset"],
+            "reportPageCount": page_offset,
         }
         # logger.info(cover_data)
         self._report_key = ReportTypes.SEARCH_COVER_REPORT
@@ -209,31 +248,34 @@ class Report:  # pylint: disable=too-few-public-methods
             )
         )
         create_ts = self._report_data["createDateTime"]
-        # 1: Generate the cover page report.
+        # 1: Set up the cover page report.
         self._report_key = ReportTypes.COVER_PAGE_REPORT
         data = self._setup_report_data()
-        meta_data = report_utils.get_report_meta_data(self._report_key)
-        files = report_utils.get_report_files(data, self._report_key, True)
-        token = GoogleStorageTokenService.get_report_api_token()
-        response_cover = self.send_request(SINGLE_URI, meta_data, files, token)
-        if response_cover.status_code != HTTPStatus.OK:
-            return report_utils.report_error(response_cover, self._report_key, self._account_id)
-        # 2: Generate the registration pdf.
+        cover_meta_data = report_utils.get_report_meta_data(self._report_key)
+        cover_files = report_utils.get_report_files(data, self._report_key, True)
+        # 2: Set up the registration report.
         self._report_key = ReportTypes.FINANCING_STATEMENT_REPORT
         self._report_data["createDateTime"] = create_ts
         data = self._setup_report_data()
         meta_data = report_utils.get_report_meta_data(self._report_key)
         files = report_utils.get_report_files(data, self._report_key, True)
-        response_reg = self.send_request(SINGLE_URI, meta_data, files, token)
+        # 3: Generate the cover letter and registration reports concurrently.
+        token = GoogleStorageTokenService.get_report_api_token()
+        response_cover, response_reg = Report._send_concurrent(
+            [
+                partial(
+                    self.send_request, SINGLE_URI, cover_meta_data, cover_files, token, ReportTypes.COVER_PAGE_REPORT
+                ),
+                partial(self.send_request, SINGLE_URI, meta_data, files, token),
+            ]
+        )
+        if response_cover.status_code != HTTPStatus.OK:
+            return report_utils.report_error(response_cover, ReportTypes.COVER_PAGE_REPORT, self._account_id)
         if response_reg.status_code != HTTPStatus.OK:
             return report_utils.report_error(response_reg, self._report_key, self._account_id)
-        # 3: Merge cover leter and registration reports.
-        files = {"pdf1.pdf": response_cover.content, "pdf2.pdf": response_reg.content}
-        response = self.send_request(MERGE_URI, None, files, token)
-        logger.info("Merge cover and registration reports response status: {0}.".format(response.status_code))
-        if response.status_code != HTTPStatus.OK:
-            return report_utils.report_error(response, self._report_key, self._account_id)
-        return response.content, response.status_code, {"Content-Type": "application/pdf"}
+        # 4: Merge cover letter and registration reports.
+        report_files = {"cover.pdf": response_cover.content, "pdf1.pdf": response_reg.content}
+        return report_utils.merge_pdfs(report_files), response_reg.status_code, {"Content-Type": "application/pdf"}
 
     def _setup_report_data(self):
         """Set up the report service request data."""
@@ -285,17 +327,41 @@ class Report:  # pylint: disable=too-few-public-methods
         return report_id
 
     def _get_template(self):
-        """Load from the local file system the template matching the report type."""
+        """Get the expanded template matching the report type from the template cache, loading it on first use."""
+        file_name = self._get_template_filename()
+        template_code = report_utils.TemplateCache.get_template(file_name)
+        if template_code is None:
+            template_code = Report._load_template(file_name)
+        return template_code
+
+    @staticmethod
+    def _load_template(file_name: str) -> str:
+        """Load from the local file system the template, substitute the template parts, and cache the result."""
         try:
             template_path = current_app.config.get("REPORT_TEMPLATE_PATH")
-            template_code = Path(f"{template_path}/{self._get_template_filename()}").read_text(encoding="UTF-8")
+            template_code = Path(f"{template_path}/{file_name}").read_text(encoding="UTF-8")
             # substitute template parts
-            template_code = self._substitute_template_parts(template_code)
+            template_code = Report._substitute_template_parts(template_code)
         except Exception as err:  # noqa: B902; just logging
             logger.error(err)
             raise err
+        report_utils.TemplateCache.add_template(file_name, template_code)
         return template_code
 
+    @staticmethod
+    def load_templates():
+        """Warm the template cache at app start with every report type template found on the file system."""
+        template_path = current_app.config.get("REPORT_TEMPLATE_PATH")
+        file_names = {"{}.html".format(report["fileName"]) for report in ReportMeta.reports.values()}
+        for file_name in sorted(file_names):
+            if not Path(f"{template_path}/{file_name}").exists():
+                continue
+            try:
+                Report._load_template(file_name)
+            except Exception:  # noqa: B902; loaded on first use instead, already logged
+                continue
+        logger.info(f"Report template cache loaded {len(report_utils.TemplateCache.TEMPLATES)} templates.")
+
     @staticmethod
     def _substitute_template_parts(template_code):
         """Substitute template parts in main template.
@@ -352,17 +418,23 @@ class Report:  # pylint: disable=too-few-public-methods
             "search-result/securitiesActNotice",
         ]
 
+        # Each template part file is read at most once per template.
+        part_code: dict = {}
+
+        def read_part(template_part: str) -> str:
+            if template_part not in part_code:
+                path = Path(f"{template_path}/template-parts/{template_part}.html")
+                part_code[template_part] = path.read_text(encoding="UTF-8")
+            return part_code[template_part]
+
         # substitute template parts - marked up by [[filename]]
         for template_part in template_parts:
             if template_code.find("[[{}.html]]".format(template_part)) >= 0:
-                template_part_code = Path(f"{template_path}/template-parts/{template_part}.html").read_text(
-                    encoding="UTF-8"
-                )
+                template_part_code = read_part(template_part)
                 for template_part_nested in template_parts:
                     template_reference = "[[{}.html]]".format(template_part_nested)
                     if template_part_code.find(template_reference) >= 0:
-                        path = Path(f"{template_path}/template-parts/{template_part_nested}.html")
-                        template_nested_code = path.read_text(encoding="UTF-8")
+                        template_nested_code = read_part(template_part_nested)
                         template_part_code = template_part_code.replace(template_reference, template_nested_code)
                 template_code = template_code.replace("[[{}.html]]".format(template_part), template_part_code)
 
@@ -11,6 +11,7 @@
 """Helper/utility functions for report generation."""
 import copy
 import io
+import threading
 from datetime import timedelta
 from pathlib import Path
 
@@ -295,6 +296,62 @@ class Config:  # pylint: disable=too-few-public-methods
         return cls.FOOTER_SEARCH_LIGHT_TEMPLATE
 
 
+class TemplateCache:
+    """Process wide cache of fully expanded report templates and their compiled Jinja templates.
+
+    Templates are keyed by template file name. The compiled Jinja template is keyed by the expanded template code so
+    report data set up with a cached template is rendered without compiling the template again.
+    """
+
+    TEMPLATES: dict = {}  # Template file name: (expanded template code, template files modified time).
+    COMPILED: dict = {}  # Expanded template code: compiled Jinja template.
+    LOCK = threading.Lock()
+
+    @classmethod
+    def get_template(cls, file_name: str) -> str:
+        """Get the cached expanded template code, or None if not cached or the template files changed since loading."""
+        cached = cls.TEMPLATES.get(file_name)
+        if not cached:
+            return None
+        if current_app.config.get("REPORT_TEMPLATE_RELOAD") and cached[1] != get_template_files_mtime():
+            logger.info(f"Report template files changed: reloading {file_name}.")
+            return None
+        return cached[0]
+
+    @classmethod
+    def add_template(cls, file_name: str, template_code: str):
+        """Cache the expanded template code and the compiled Jinja template."""
+        compiled = Template(template_code, autoescape=True)
+        mtime = get_template_files_mtime() if current_app.config.get("REPORT_TEMPLATE_RELOAD") else None
+        with cls.LOCK:
+            previous = cls.TEMPLATES.get(file_name)
+            if previous and previous[0] != template_code:
+                cls.COMPILED.pop(previous[0], None)
+            cls.TEMPLATES[file_name] = (template_code, mtime)
+            cls.COMPILED[template_code] = compiled
+
+    @classmethod
+    def get_compiled_template(cls, template_code: str) -> Template:
+        """Get the compiled Jinja template, compiling templates that are not cached."""
+        compiled = cls.COMPILED.get(template_code)
+        if compiled is None:
+            compiled = Template(template_code, autoescape=True)
+        return compiled
+
+    @classmethod
+    def clear(cls):
+        """Remove all cached templates."""
+        with cls.LOCK:
+            cls.TEMPLATES.clear()
+            cls.COMPILED.clear()
+
+
+def get_template_files_mtime() -> int:
+    """Get the combined modified time of the report template files: only used when template reloading is on."""
+    template_path = Path(current_app.config.get("REPORT_TEMPLATE_PATH", ""))
+    return sum(path.stat().st_mtime_ns for path in template_path.rglob("*.html"))
+
+
 def get_header_data(title: str, subtitle: str = "") -> str:
     """Get report header with the provided titles."""
     template = Config().get_header_template()
@@ -442,7 +499,7 @@ def get_report_files(request_data: dict, report_type: str, mail: bool = False, l
 
 def get_html_from_data(request_data) -> str:
     """Get html by merging the template with the report data."""
-    template_ = Template(request_data["template"], autoescape=True)
+    template_ = TemplateCache.get_compiled_template(request_data["template"])
     html_output = template_.render(request_data["templateVars"])
     return html_output
 
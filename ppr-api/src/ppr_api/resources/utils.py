@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Resource helper utilities for processing requests."""
+import io
 from http import HTTPStatus
 
-from flask import current_app, g, jsonify, request
+from flask import Response, current_app, g, jsonify, request, stream_with_context
+from werkzeug.datastructures import ContentRange
 
+from ppr_api.callback.document_storage.storage_service import STREAM_CHUNK_SIZE, GoogleStorageService, read_chunks
 from ppr_api.exceptions import BusinessException, DatabaseException, ResourceErrorCodes
 from ppr_api.models import EventTracking, MailReport, Party, Registration, User, VerificationReport, search_utils
 from ppr_api.models import utils as model_utils
@@ -37,6 +40,11 @@ from ppr_api.utils.base import BaseEnum
 from ppr_api.utils.logging import logger
 from ppr_api.utils.validators import financing_validator, party_validator, registration_validator
 
+# Maximum size of a PDF document response before streaming it from document storage.
+STREAMING_THRESHOLD = 31 * 1024 * 1024
+# Minimum number of list items in a json response before streaming it one list item at a time.
+STREAM_JSON_MIN_ITEMS = 50
+
 # Resource error messages
 # Model business error messages in models.utils.py
 ACCOUNT_REQUIRED = "{code}: The request is missing the required Account ID header."
@@ -102,6 +110,8 @@ END_TS_PARAM = "endDateTime"
 STATUS_PARAM = "statusType"
 CLIENT_REF_PARAM = "clientReferenceId"
 REGISTER_NAME_PARAM = "registeringName"
+# The last base registration number of the previous page: requests the next page (keyset pagination).
+AFTER_REG_NUM_PARAM = "afterRegistrationNumber"
 REQUEST_PARAM_CC_PAY: str = "ccPayment"
 
 
@@ -145,6 +155,97 @@ def is_pdf(req):
     return accept and accept.upper() == "APPLICATION/PDF"
 
 
+def pdf_document_response(doc_name: str, doc_type: str = None, response_status: int = HTTPStatus.OK):
+    """Get a PDF document from document storage as a response, supporting single byte range requests.
+
+    A satisfiable Range request header gets a 206 partial content response with only the requested bytes read from
+    document storage. Responses larger than the streaming threshold are streamed a chunk at a time.
+    """
+    doc_file = GoogleStorageService.open_document(doc_name, doc_type)
+    size: int = doc_file.seek(0, io.SEEK_END)
+    start: int = 0
+    stop: int = size
+    headers = {"Content-Type": "application/pdf", "Accept-Ranges": "bytes"}
+    if response_status == HTTPStatus.OK and request.range and len(request.range.ranges) == 1:
+        byte_range = request.range.range_for_length(size)
+        if byte_range is None:
+            doc_file.close()
+            headers["Content-Range"] = ContentRange("bytes", None, None, size).to_header()
+            return b"", HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, headers
+        start, stop = byte_range
+        response_status = HTTPStatus.PARTIAL_CONTENT
+        headers["Content-Range"] = ContentRange("bytes", start, stop, size).to_header()
+        logger.info(f"{doc_name} partial content request bytes {start}-{stop - 1}/{size}.")
+    doc_file.seek(start)
+    chunks = read_chunks(doc_file, STREAM_CHUNK_SIZE, stop - start)
+    if stop - start < STREAMING_THRESHOLD:
+        return b"".join(chunks), response_status, headers
+    logger.info(f"{doc_name} streaming response size={stop - start}")
+    return Response(stream_with_context(chunks), status=response_status, headers=headers)
+
+
+def json_dumps(data) -> str:
+    """Serialize data to compact json text with the application json provider (same output as jsonify)."""
+    return current_app.json.dumps(data, separators=(",", ":"))
+
+
+def json_chunks(data, list_key: str = None):
+    """Generate the utf-8 json text of a list, or of a dict containing a list, one list item at a time.
+
+    Dict keys are written in the same order as jsonify: sorted if the application json provider sorts keys.
+    """
+    if list_key is None:
+        yield b"["
+        yield from json_list_chunks(data)
+        yield b"]"
+        return
+    keys = sorted(data) if current_app.json.sort_keys else list(data)
+    yield b"{"
+    for index, key in enumerate(keys):
+        yield (("," if index else "") + json_dumps(key) + ":").encode("utf-8")
+        if key == list_key:
+            yield b"["
+            yield from json_list_chunks(data[key])
+            yield b"]"
+        else:
+            yield json_dumps(data[key]).encode("utf-8")
+    yield b"}"
+
+
+def json_list_chunks(items: list):
+    """Generate the utf-8 json text of the list items separated by commas, one item at a time.
+
+    The response status has already been sent: an item that cannot be serialized is logged and the error re-raised so
+    the server ends the chunked response without its terminating chunk, which clients report as incomplete.
+    """
+    for index, item in enumerate(items):
+        try:
+            yield (("," if index else "") + json_dumps(item)).encode("utf-8")
+        except Exception as err:  # noqa: B902; log the item and abort the response.
+            logger.error(f"Streaming json response aborted: list item {index} could not be serialized: {err}")
+            raise err
+
+
+def json_response(data, response_status: int = HTTPStatus.OK, list_key: str = None):
+    """Get a json response, streaming it one list item at a time if the list is large.
+
+    The list is either the response data or the value of the response data list_key property. The response data is
+    still built in full by the caller: streaming only avoids holding the complete serialized text in memory. The list
+    items share one shape, so the first item and the properties other than the list are serialized before the
+    response is returned: data that cannot be serialized is then an error response instead of a truncated 200.
+    """
+    items = data if list_key is None else data.get(list_key)
+    if not isinstance(items, list) or len(items) < STREAM_JSON_MIN_ITEMS:
+        return jsonify(data), response_status
+    json_dumps(items[0])
+    if list_key is not None:
+        json_dumps({key: value for key, value in data.items() if key != list_key})
+    logger.info(f"Streaming json response list size={len(items)}")
+    return Response(
+        stream_with_context(json_chunks(data, list_key)), status=response_status, mimetype="application/json"
+    )
+
+
 def get_apikey(req):
     """Get gateway api key from request headers."""
     return req.headers.get("x-apikey")
@@ -717,6 +818,7 @@ def get_account_registration_params(req: request, params: AccountRegistrationPar
     params.status_type = req.args.get(STATUS_PARAM, None)
     params.client_reference_id = req.args.get(CLIENT_REF_PARAM, None)
     params.registering_name = req.args.get(REGISTER_NAME_PARAM, None)
+    params.after_reg_num = req.args.get(AFTER_REG_NUM_PARAM, None)
     start_ts = req.args.get(START_TS_PARAM, None)
     end_ts = req.args.get(END_TS_PARAM, None)
     if start_ts and end_ts:
@@ -734,6 +836,8 @@ def get_account_registration_params(req: request, params: AccountRegistrationPar
         params.client_reference_id = params.client_reference_id.strip().upper()
     if params.registering_name:
         params.registering_name = params.registering_name.strip().upper()
+    if params.after_reg_num:
+        params.after_reg_num = params.after_reg_num.strip().upper()
     return params
 
 
@@ -63,7 +63,7 @@ def get_financing_statements():
         # Try to fetch financing statement list for account ID
         try:
             statement_list = FinancingStatement.find_all_by_account_id(account_id)
-            return jsonify(statement_list), HTTPStatus.OK
+            return resource_utils.json_response(statement_list)
         except Exception as db_exception:  # noqa: B902; return nicer default error
             return resource_utils.db_exception_response(db_exception, account_id, "GET financing statements")
     except BusinessException as exception:
@@ -594,7 +594,7 @@ def get_registrations():
         )
         params = resource_utils.get_account_registration_params(request, params)
         statement_list = Registration.find_all_by_account_id(params)
-        return jsonify(statement_list), HTTPStatus.OK
+        return resource_utils.json_response(statement_list)
     except DatabaseException as db_exception:  # noqa: B902; return nicer error
         return resource_utils.db_exception_response(
             db_exception, account_id, "GET Account Registration Summary id=" + account_id
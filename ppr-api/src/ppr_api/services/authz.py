@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """This manages all of the authentication and authorization service."""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from http import HTTPStatus
 from typing import List
 
@@ -48,6 +52,97 @@ GENERAL_USER_GROUP = "mhr_general_user"
 SEARCH_USER_GROUP = "mhr_search_user"
 
 
+class AuthCache:
+    """In-process TTL and LRU cache of auth api responses with hit and miss counters.
+
+    Entries expire after the configured AUTH_CACHE_TTL seconds. When full, the least recently used entry is removed.
+    """
+
+    def __init__(self, max_size: int = 1000):
+        """Create an empty cache holding at most max_size entries."""
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Get the cached value for the key, or None if the key is not cached or has expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value, ttl: int):
+        """Cache the value for ttl seconds, removing the least recently used entries when the cache is full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Get the cache size and hit and miss counts."""
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+auth_cache = AuthCache()
+_sessions: dict = {}  # Retry total: pooled HTTP session.
+_session_lock = threading.Lock()
+
+
+def get_session(retries: int = 3) -> Session:
+    """Get the pooled HTTP session with the retry total shared by auth api calls, creating it on first use."""
+    session = _sessions.get(retries)
+    if session is None:
+        with _session_lock:
+            session = _sessions.get(retries)
+            if session is None:
+                session = Session()
+                retry = Retry(total=retries, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
+                session.mount("http://", HTTPAdapter(max_retries=retry))
+                _sessions[retries] = session
+    return session
+
+
+def get_auth_json(api_url: str, token: str, retries: int = 3):
+    """Auth API GET request response json, served from the auth cache when available.
+
+    The cache key is the digest of the token with the request url: a cached response is only returned for the same
+    token and account. A response with a status other than OK returns None and is not cached. AUTH_CACHE_TTL=0
+    turns off caching.
+    """
+    ttl: int = current_app.config.get("AUTH_CACHE_TTL", 0)
+    key = (hashlib.sha256(token.encode()).hexdigest(), api_url)
+    if ttl > 0:
+        response = auth_cache.get(key)
+        if response is not None:
+            return response
+    headers = {"Authorization": "Bearer " + token, "Content-Type": "application/json"}
+    ret_val = get_session(retries).get(url=api_url, headers=headers)
+    logger.debug(f"Auth get {api_url} response status: " + str(ret_val.status_code))
+    if ret_val.status_code != HTTPStatus.OK:
+        return None
+    response = ret_val.json()
+    if ttl > 0:
+        auth_cache.put(key, response, ttl)
+    return response
+
+
 #  def authorized(identifier: str, jwt: JwtManager, action: List[str]) -> bool:
 def authorized(identifier: str, jwt: JwtManager) -> bool:  # pylint: disable=too-many-return-statements
     """Verify the user is authorized to submit the request by inspecting the web token.
@@ -120,18 +215,13 @@ def authorized_token(  # pylint: disable=too-many-return-statements
         auth_url = template_url.format(**vars())
 
         token = jwt.get_token_auth_header()
-        headers = {"Authorization": "Bearer " + token}
         try:
-            with Session() as http:
-                retries = Retry(total=5, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
-                http.mount("http://", HTTPAdapter(max_retries=retries))
-                rv = http.get(url=auth_url, headers=headers)
-
-                if rv.status_code != HTTPStatus.OK or not rv.json().get("roles"):
-                    return False
+            response = get_auth_json(auth_url, token, 5)
+            if not response or not response.get("roles"):
+                return False
 
-                if all(elem.lower() in rv.json().get("roles") for elem in action):
-                    return True
+            if all(elem.lower() in response.get("roles") for elem in action):
+                return True
 
         except (
             exceptions.ConnectionError,  # pylint: disable=broad-except
@@ -157,16 +247,7 @@ def user_orgs(token: str) -> dict:
     api_url += USER_ORGS_PATH
 
     try:
-        headers = {"Authorization": "Bearer " + token, "Content-Type": "application/json"}
-        # logger.debug('Auth get user orgs url=' + url)
-        with Session() as http:
-            retries = Retry(total=3, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
-            http.mount("http://", HTTPAdapter(max_retries=retries))
-            ret_val = http.get(url=api_url, headers=headers)
-            logger.debug("Auth get user orgs response status: " + str(ret_val.status_code))
-            # logger.debug('Auth get user orgs response data:')
-            response = ret_val.json()
-            # logger.debug(response)
+        response = get_auth_json(api_url, token)
     except (
         exceptions.ConnectionError,  # pylint: disable=broad-except
         exceptions.Timeout,
@@ -189,16 +270,7 @@ def account_org(token: str, account_id: str) -> dict:
     api_url += f"orgs/{account_id}"
 
     try:
-        headers = {"Authorization": "Bearer " + token, "Content-Type": "application/json"}
-        # logger.debug('Auth get user orgs url=' + url)
-        with Session() as http:
-            retries = Retry(total=3, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
-            http.mount("http://", HTTPAdapter(max_retries=retries))
-            ret_val = http.get(url=api_url, headers=headers)
-            logger.debug("Auth get user orgs response status: " + str(ret_val.status_code))
-            # logger.debug('Auth get account org response data:')
-            response = ret_val.json()
-            # logger.debug(response)
+        response = get_auth_json(api_url, token)
     except (
         exceptions.ConnectionError,  # pylint: disable=broad-except
         exceptions.Timeout,
@@ -17,6 +17,7 @@
 """The simple pay-api client is defined here."""
 import copy
 import json
+import time
 from enum import Enum
 from functools import wraps
 from http import HTTPStatus
@@ -24,6 +25,7 @@ from http import HTTPStatus
 import requests
 from flask import current_app
 
+from ppr_api.callback.auth.token_cache import TokenCache
 from ppr_api.services.payment import PaymentMethods, StatusCodes, TransactionTypes
 from ppr_api.services.payment.exceptions import SBCPaymentException
 from ppr_api.utils.logging import logger
@@ -104,6 +106,7 @@ PATH_PAYMENT = "payment-requests"
 PATH_REFUND = "payment-requests/{invoice_id}/refunds"
 PATH_INVOICE = "payment-requests/{invoice_id}"
 PATH_RECEIPT = "payment-requests/{invoice_id}/receipts"
+SA_TOKEN_KEY = "payment:{client_id}"
 
 VALID_PAYMENT_METHOD_CC = [PaymentMethods.CC.value, PaymentMethods.DIRECT_PAY.value]
 VALID_RESPONSE_STATUS = [StatusCodes.PAID.value, StatusCodes.APPROVED.value, StatusCodes.COMPLETED.value]
@@ -457,7 +460,13 @@ class SBCPaymentClient(BaseClient):
 
     @staticmethod
     def get_sa_token():
-        """Refunds must be submitted with a PPR service account token. Request one from the OIDC service."""
+        """Refunds must be submitted with a PPR service account token. Get the cached token or request one."""
+        client_id = current_app.config.get("ACCOUNT_SVC_CLIENT_ID")
+        return TokenCache.get(SA_TOKEN_KEY.format(client_id=client_id), SBCPaymentClient.fetch_sa_token)
+
+    @staticmethod
+    def fetch_sa_token() -> tuple:
+        """Request a PPR service account token from the OIDC service, returning the token and its expiry time."""
         oidc_token_url = current_app.config.get("JWT_OIDC_TOKEN_URL")
         client_id = current_app.config.get("ACCOUNT_SVC_CLIENT_ID")
         client_secret = current_app.config.get("ACCOUNT_SVC_CLIENT_SECRET")
@@ -475,7 +484,8 @@ class SBCPaymentClient(BaseClient):
             response_json = json.loads(response.text)
             token = response_json["access_token"]
             logger.info("Have new sa token from OIDC.")
-            return token
+            expires_in = response_json.get("expires_in")
+            return token, (time.time() + int(expires_in) if expires_in else None)
 
         except ApiRequestError as err:
             logger.error(err.message)
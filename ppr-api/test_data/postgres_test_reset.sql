@@ -7,6 +7,10 @@ DELETE FROM search_results
   WHERE search_id >= 200000000;
 DELETE FROM search_requests
   WHERE id >= 200000000;
+DELETE FROM serial_search
+  WHERE financing_id >= 200000000;
+DELETE FROM account_registration_summary
+  WHERE financing_id >= 200000000;
 DELETE FROM serial_collateral
   WHERE financing_id >= 200000000;
 DELETE FROM general_collateral
@@ -22,8 +22,9 @@ from http import HTTPStatus
 from unittest.mock import MagicMock, patch
 
 import pytest
-from flask import current_app, g
+from flask import current_app, g, jsonify
 
+from ppr_api.callback.document_storage.storage_service import LocalStorageService
 from ppr_api.exceptions import BusinessException, DatabaseException, ResourceErrorCodes
 from ppr_api.models import Registration, VerificationReport
 from ppr_api.reports import ReportTypes
@@ -42,6 +43,28 @@ TEST_USER_ORGS_DATA_JSON = [
 #    ('Valid account', '2617', True),
     ('No token', '2617', False),
 ]
+# testdata pattern is ({description}, {list size}, {list key}, {streamed})
+TEST_JSON_RESPONSE_DATA = [
+    ('Small list', 2, None, False),
+    ('Large list', resource_utils.STREAM_JSON_MIN_ITEMS, None, True),
+    ('Empty details', 0, 'details', False),
+    ('Small details', 2, 'details', False),
+    ('Large details', resource_utils.STREAM_JSON_MIN_ITEMS + 1, 'details', True)
+]
+# testdata pattern is ({description}, {error_index}, {raised_before_response})
+TEST_JSON_RESPONSE_ERROR_DATA = [
+    ('First item', 0, True),
+    ('Last item', -1, False)
+]
+# testdata pattern is ({description}, {range header}, {status}, {start}, {stop}, {content range})
+TEST_PDF_RANGE_DATA = [
+    ('No range', None, HTTPStatus.OK, 0, 1000, None),
+    ('First bytes', 'bytes=0-99', HTTPStatus.PARTIAL_CONTENT, 0, 100, 'bytes 0-99/1000'),
+    ('Open ended', 'bytes=900-', HTTPStatus.PARTIAL_CONTENT, 900, 1000, 'bytes 900-999/1000'),
+    ('Suffix', 'bytes=-10', HTTPStatus.PARTIAL_CONTENT, 990, 1000, 'bytes 990-999/1000'),
+    ('Multiple ranges ignored', 'bytes=0-1,5-6', HTTPStatus.OK, 0, 1000, None),
+    ('Not satisfiable', 'bytes=2000-', HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, 0, 0, 'bytes */1000')
+]
 # testdata pattern is ({description}, {valid data})
 TEST_VALIDATE_REGISTRATION_DATA = [
     ('Valid amendment', True),
@@ -447,3 +470,56 @@ def test_patch_api_gw_user_if_missing(session, client, jwt, desc, from_api_gw):
             assert res
             mock_account_org.assert_called_once()
             mock_get_or_create.assert_called_once()
+
+
+@pytest.mark.parametrize('desc,range_header,status,start,stop,content_range', TEST_PDF_RANGE_DATA)
+def test_pdf_document_response(session, client, jwt, tmp_path, monkeypatch, desc, range_header, status, start, stop,
+                               content_range):
+    """Assert that getting a stored pdf document response with an optional byte range works as expected."""
+    LocalStorageService.ROOT_PATH = str(tmp_path)
+    raw_data = bytes(range(250)) * 4
+    LocalStorageService.save_document('test-range.pdf', raw_data)
+    monkeypatch.setattr(resource_utils, 'GoogleStorageService', LocalStorageService)
+    headers = {'Range': range_header} if range_header else {}
+    with current_app.test_request_context(headers=headers):
+        data, response_status, response_headers = resource_utils.pdf_document_response('test-range.pdf')
+    assert response_status == status
+    assert data == raw_data[start:stop]
+    assert response_headers.get('Accept-Ranges') == 'bytes'
+    assert response_headers.get('Content-Range') == content_range
+
+
+@pytest.mark.parametrize('desc,list_size,list_key,streamed', TEST_JSON_RESPONSE_DATA)
+def test_json_response(session, client, jwt, desc, list_size, list_key, streamed):
+    """Assert that large json list responses are streamed with the same content as a jsonify response."""
+    items = [{'matchType': 'EXACT', 'baseRegistrationNumber': f'TEST{index:04d}'} for index in range(list_size)]
+    data = items
+    if list_key:
+        data = {'totalResultsSize': list_size, list_key: items, 'searchDateTime': '2024-01-01T00:00:00+00:00'}
+    with current_app.test_request_context():
+        response = resource_utils.json_response(data, HTTPStatus.OK, list_key)
+        if streamed:
+            assert response.is_streamed
+            assert response.status_code == HTTPStatus.OK
+            assert response.mimetype == 'application/json'
+            assert response.content_length is None
+            assert response.get_data() == jsonify(data).get_data().strip()
+        else:
+            assert response[1] == HTTPStatus.OK
+            assert response[0].json == data
+
+
+@pytest.mark.parametrize('desc,error_index,raised_before_response', TEST_JSON_RESPONSE_ERROR_DATA)
+def test_json_response_error(session, client, jwt, desc, error_index, raised_before_response):
+    """Assert that a json list response serialization error is raised and not streamed as a complete response."""
+    items = [{'baseRegistrationNumber': f'TEST{index:04d}'} for index in range(resource_utils.STREAM_JSON_MIN_ITEMS)]
+    items[error_index]['registration'] = object()
+    with current_app.test_request_context():
+        if raised_before_response:
+            with pytest.raises(TypeError):
+                resource_utils.json_response({'details': items}, HTTPStatus.OK, 'details')
+        else:
+            response = resource_utils.json_response({'details': items}, HTTPStatus.OK, 'details')
+            assert response.is_streamed
+            with pytest.raises(TypeError):
+                response.get_data()
@@ -15,7 +15,12 @@
 
 from flask import current_app
 
-from ppr_api.callback.document_storage.storage_service import DocumentTypes, GoogleStorageService
+from ppr_api.callback.document_storage.storage_service import (
+    DocumentTypes,
+    GoogleStorageService,
+    LocalStorageService,
+    read_chunks,
+)
 from ppr_api.utils.logging import logger
 
 
@@ -146,6 +151,24 @@ def test_cs_get_search_document_link(session):
     assert download_link
 
 
+def test_local_document(session, tmp_path):
+    """Assert that saving and reading a document with the local file system storage stand-in works as expected."""
+    LocalStorageService.ROOT_PATH = str(tmp_path)
+    raw_data = None
+    with open(TEST_DATAFILE, 'rb') as data_file:
+        raw_data = data_file.read()
+        data_file.close()
+    response = LocalStorageService.save_document(TEST_SAVE_DOC_NAME, raw_data, DocumentTypes.REGISTRATION)
+    assert response
+    assert LocalStorageService.get_document(TEST_SAVE_DOC_NAME, DocumentTypes.REGISTRATION) == raw_data
+    doc_file = LocalStorageService.open_document(TEST_SAVE_DOC_NAME, DocumentTypes.REGISTRATION)
+    doc_file.seek(100)
+    assert b''.join(read_chunks(doc_file, 1024, 2000)) == raw_data[100:2100]
+    assert doc_file.closed
+    LocalStorageService.delete_document(TEST_SAVE_DOC_NAME, DocumentTypes.REGISTRATION)
+    assert not (tmp_path / DocumentTypes.REGISTRATION.value / TEST_SAVE_DOC_NAME).exists()
+
+
 def is_ci_testing() -> bool:
     """Check unit test environment: exclude pub/sub for CI testing."""
     if not current_app.config.get("GOOGLE_DEFAULT_SA"):
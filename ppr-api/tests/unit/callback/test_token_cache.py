@@ -0,0 +1,103 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Service account token cache tests."""
+import time
+
+import pytest
+
+from ppr_api.callback.auth.token_cache import TokenCache
+
+
+TEST_KEY = 'token-cache-test'
+# testdata pattern is ({description}, {expires_in}, {token_count})
+TEST_EXPIRY_DATA = [
+    ('Valid', 3600, 1),
+    ('Short lived', 240, 1),
+    ('Expired', 30, 2),
+    ('No expiry', None, 2)
+]
+# testdata pattern is ({description}, {lifetime}, {expires_in}, {refreshed})
+TEST_REFRESH_DATA = [
+    ('Long lived not in refresh window', 3600, 1000, False),
+    ('Long lived in refresh window', 3600, 200, True),
+    ('Short lived not in refresh window', 240, 200, False),
+    ('Short lived in refresh window', 240, 90, True)
+]
+
+
+class TokenFetch:
+    """Count token fetches, returning a new token each time."""
+
+    def __init__(self, expires_in: int):
+        """Create the fetch function with a token lifetime in seconds."""
+        self.expires_in = expires_in
+        self.count: int = 0
+
+    def __call__(self):
+        """Return a new token and its expiry time."""
+        self.count += 1
+        return f'token{self.count}', (time.time() + self.expires_in if self.expires_in else None)
+
+
+def wait_for_refresh():
+    """Wait for a background refresh of the test token to finish."""
+    for _ in range(50):
+        if TEST_KEY not in TokenCache.REFRESHING:
+            break
+        time.sleep(0.1)
+
+
+@pytest.mark.parametrize('desc,expires_in,token_count', TEST_EXPIRY_DATA)
+def test_get(client, jwt, desc, expires_in, token_count):
+    """Assert that a cached token is used until the expiry margin without a refresh on every call."""
+    TokenCache.clear(TEST_KEY)
+    fetch = TokenFetch(expires_in)
+    try:
+        assert TokenCache.get(TEST_KEY, fetch) == 'token1'
+        assert TokenCache.get(TEST_KEY, fetch) == f'token{token_count}'
+        wait_for_refresh()
+        assert fetch.count == token_count
+    finally:
+        TokenCache.clear(TEST_KEY)
+
+
+@pytest.mark.parametrize('desc,lifetime,expires_in,refreshed', TEST_REFRESH_DATA)
+def test_refresh_ahead(client, jwt, desc, lifetime, expires_in, refreshed):
+    """Assert that a token is refreshed in the background in the last quarter of its usable lifetime."""
+    TokenCache.clear(TEST_KEY)
+    TokenCache.TOKENS[TEST_KEY] = ('token0', time.time() + expires_in, lifetime)
+    fetch = TokenFetch(lifetime)
+    try:
+        assert TokenCache.get(TEST_KEY, fetch) == 'token0'
+        wait_for_refresh()
+        assert fetch.count == (1 if refreshed else 0)
+        assert TokenCache.TOKENS[TEST_KEY][0] == ('token1' if refreshed else 'token0')
+    finally:
+        TokenCache.clear(TEST_KEY)
+
+
+def test_refresh_failure(client, jwt):
+    """Assert that a failed background refresh keeps the cached token."""
+    TokenCache.clear(TEST_KEY)
+    TokenCache.TOKENS[TEST_KEY] = ('token0', time.time() + 200, 3600)
+
+    def failed_fetch():
+        raise ValueError('Token request failed.')
+
+    try:
+        assert TokenCache.get(TEST_KEY, failed_fetch) == 'token0'
+        wait_for_refresh()
+        assert TokenCache.TOKENS[TEST_KEY][0] == 'token0'
+    finally:
+        TokenCache.clear(TEST_KEY)
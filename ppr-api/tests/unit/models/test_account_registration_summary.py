@@ -0,0 +1,178 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the Account Registration Summary Model.
+
+Test-Suite to ensure that the Account Registration Summary Model and account list keyset pagination are working as
+expected.
+"""
+import pytest
+from flask import current_app
+from sqlalchemy.sql import text
+
+from ppr_api.models import AccountRegistrationSummary, FinancingStatement, Registration, db
+from ppr_api.models import registration_utils
+from ppr_api.models.registration_utils import AccountRegistrationParams
+
+
+# testdata pattern is ({sort_criteria}, {sort_direction}, {column}, {order})
+TEST_ORDER_DATA = [
+    (None, None, 'registration_ts', 'DESC'),
+    ('invalid', 'asc', 'registration_ts', 'DESC'),
+    ('registrationNumber', None, 'registration_number', 'DESC'),
+    ('registrationNumber', 'asc', 'registration_number', 'ASC'),
+    ('registrationType', 'ascending', 'registration_type', 'ASC'),
+    ('registeringName', 'descending', 'registering_name', 'DESC'),
+    ('clientReferenceId', 'asc', 'client_reference_id', 'ASC'),
+    ('startDateTime', 'desc', 'registration_ts', 'DESC')
+]
+# testdata pattern is ({description}, {enabled}, {account_id}, {reg_num}, {start_ts}, {valid})
+TEST_FILTER_DATA = [
+    ('Valid no filter', True, 'PS12345', None, None, True),
+    ('Disabled', False, 'PS12345', None, None, False),
+    ('Staff account', True, 'ppr_staff', None, None, False),
+    ('Registration number filter', True, 'PS12345', 'TEST0001', None, False),
+    ('Timestamp range filter', True, 'PS12345', None, '2021-09-03T18:00:00-07:00', False)
+]
+# testdata pattern is ({sort_criteria}, {sort_direction})
+TEST_PARITY_DATA = [
+    (None, None),
+    ('registrationNumber', 'asc'),
+    ('registrationNumber', 'desc')
+]
+TEST_ACCOUNT_FINANCING_IDS = "SELECT DISTINCT financing_id FROM account_registration_vw WHERE account_id = :account_id"
+
+
+def test_refresh(session):
+    """Assert that refreshing the summary for a financing statement creates the expected records."""
+    count = AccountRegistrationSummary.refresh(200000000)
+    statement = FinancingStatement.find_by_id(200000000)
+    assert count == len(statement.registration)
+    records = AccountRegistrationSummary.find_by_financing_id(200000000)
+    assert len(records) == count
+    for record in records:
+        registration = Registration.find_by_id(record.id)
+        assert registration
+        assert record.financing_id == 200000000
+        assert record.registration_num == registration.registration_num
+        assert record.registration_type == registration.registration_type
+        assert record.registration_type_cl == registration.registration_type_cl
+        assert record.registration_desc
+        assert record.account_id == registration.account_id
+        assert record.base_account_id == statement.registration[0].account_id
+        assert record.client_reference_id == (registration.client_reference_id or '')
+        assert record.registering_name is not None
+        assert record.last_update_ts
+        assert record.state_type == statement.state_type
+        assert record.expire_date == statement.expire_date
+    # Refresh replaces existing records.
+    assert AccountRegistrationSummary.refresh(200000000) == count
+    assert len(AccountRegistrationSummary.find_by_financing_id(200000000)) == count
+    assert AccountRegistrationSummary.refresh_by_reg_num('TEST0001') == count
+
+
+def test_refresh_none(session):
+    """Assert that refreshing the summary with no financing statement does nothing."""
+    assert AccountRegistrationSummary.refresh(None) == 0
+    assert AccountRegistrationSummary.refresh_by_reg_num(None) == 0
+    assert AccountRegistrationSummary.refresh_by_reg_num('XXXXXXXX') == 0
+    assert not AccountRegistrationSummary.find_by_financing_id(None)
+
+
+@pytest.mark.parametrize('sort_criteria,sort_direction,column,order', TEST_ORDER_DATA)
+def test_summary_order(session, sort_criteria, sort_direction, column, order):
+    """Assert that the summary query sort column and order are derived from the parameters as expected."""
+    params: AccountRegistrationParams = AccountRegistrationParams(account_id='PS12345')
+    params.sort_criteria = sort_criteria
+    params.sort_direction = sort_direction
+    assert registration_utils.get_account_summary_order(params) == (column, order)
+
+
+@pytest.mark.parametrize('desc,enabled,account_id,reg_num,start_ts,valid', TEST_FILTER_DATA)
+def test_summary_filter(session, desc, enabled, account_id, reg_num, start_ts, valid):
+    """Assert that only UI list requests without filters use the summary table."""
+    params: AccountRegistrationParams = AccountRegistrationParams(account_id=account_id)
+    params.registration_number = reg_num
+    if start_ts:
+        params.start_date_time = start_ts
+        params.end_date_time = start_ts
+    current_app.config.update(ACCOUNT_REGISTRATIONS_SUMMARY=enabled)
+    try:
+        assert registration_utils.account_summary_filter(params) == valid
+    finally:
+        current_app.config.update(ACCOUNT_REGISTRATIONS_SUMMARY=False)
+
+
+@pytest.mark.parametrize('sort_criteria,sort_direction', TEST_PARITY_DATA)
+def test_summary_parity(session, sort_criteria, sort_direction):
+    """Assert that the summary table account list is the same as the account registration view list."""
+    refresh_account('PS12345')
+    params: AccountRegistrationParams = AccountRegistrationParams(account_id='PS12345',
+                                                                  collapse=True,
+                                                                  account_name='Unit Testing')
+    params.from_ui = True
+    params.page_number = 1
+    params.sort_criteria = sort_criteria
+    params.sort_direction = sort_direction
+    expected = Registration.find_all_by_account_id_filter(params)
+    assert expected
+    assert Registration.find_all_by_account_summary(params) == expected
+
+
+def test_summary_parity_api(session):
+    """Assert that the summary table API account list is the same as the account registration query list."""
+    refresh_account('PS12345')
+    params: AccountRegistrationParams = AccountRegistrationParams(account_id='PS12345', account_name='Unit Testing')
+    expected = Registration.find_all_by_account_id(params)
+    assert expected
+    current_app.config.update(ACCOUNT_REGISTRATIONS_SUMMARY=True)
+    try:
+        results = Registration.find_all_by_account_id(params)
+    finally:
+        current_app.config.update(ACCOUNT_REGISTRATIONS_SUMMARY=False)
+    assert sorted(results, key=lambda reg: reg['registrationNumber']) == \
+        sorted(expected, key=lambda reg: reg['registrationNumber'])
+
+
+def test_summary_keyset(session):
+    """Assert that keyset pages are the same as the page number pages."""
+    refresh_account('PS12345')
+    page_size = current_app.config.get('ACCOUNT_REGISTRATIONS_MAX_RESULTS')
+    current_app.config.update(ACCOUNT_REGISTRATIONS_MAX_RESULTS='2')
+    try:
+        params: AccountRegistrationParams = AccountRegistrationParams(account_id='PS12345',
+                                                                      account_name='Unit Testing')
+        params.from_ui = True
+        params.page_number = 1
+        first_page = Registration.find_all_by_account_summary(params)
+        assert len(first_page) == 2
+        params.page_number = 2
+        offset_page = Registration.find_all_by_account_summary(params)
+        params.page_number = 1
+        params.after_reg_num = first_page[-1]['registrationNumber']
+        keyset_page = Registration.find_all_by_account_summary(params)
+        assert keyset_page
+        assert [reg['registrationNumber'] for reg in keyset_page] == \
+            [reg['registrationNumber'] for reg in offset_page]
+        assert not {reg['registrationNumber'] for reg in keyset_page} & \
+            {reg['registrationNumber'] for reg in first_page}
+    finally:
+        current_app.config.update(ACCOUNT_REGISTRATIONS_MAX_RESULTS=page_size)
+
+
+def refresh_account(account_id: str):
+    """Refresh the summary records for the financing statements listed for the account."""
+    rows = db.session.execute(text(TEST_ACCOUNT_FINANCING_IDS), {'account_id': account_id}).fetchall()
+    for row in rows:
+        AccountRegistrationSummary.refresh(int(row[0]))
@@ -21,7 +21,7 @@ import copy
 
 import pytest
 from registry_schemas.example_data.ppr import FINANCING_STATEMENT, DISCHARGE_STATEMENT, DRAFT_FINANCING_STATEMENT
-from ppr_api.models import FinancingStatement, Draft, utils as model_utils
+from ppr_api.models import FinancingStatement, Draft, db, utils as model_utils
 
 from ppr_api.exceptions import BusinessException
 
@@ -228,6 +228,29 @@ def test_find_by_financing_id(session):
         assert json_data['trustIndenture']
 
 
+def test_find_all_by_registration_numbers(session):
+    """Assert that bulk loading financing statements by registration number matches the single statement json."""
+    reg_nums = ['TEST0001', 'TEST0002', 'TEST0001', 'TESTXXXX']
+    statements = FinancingStatement.find_all_by_registration_numbers(reg_nums)
+    assert len(statements) == 2
+    assert 'TESTXXXX' not in statements
+    bulk_json = {}
+    for reg_num in ('TEST0001', 'TEST0002'):
+        statement = statements.get(reg_num)
+        assert statement
+        statement.include_changes_json = True
+        bulk_json[reg_num] = statement.json
+        assert bulk_json[reg_num]['baseRegistrationNumber'] == reg_num
+    # Compare with statements loaded in a clear session, not the same identity mapped statements.
+    db.session.expunge_all()
+    for reg_num, statement_json in bulk_json.items():
+        financing = FinancingStatement.find_by_registration_number(reg_num, None, True, False)
+        assert financing is not statements.get(reg_num)
+        financing.include_changes_json = True
+        assert statement_json == financing.json
+    assert FinancingStatement.find_all_by_registration_numbers([]) == {}
+
+
 @pytest.mark.parametrize('desc,reg_number,reg_type,account_id,status,staff,create', TEST_REGISTRATION_NUMBER_DATA)
 def test_find_by_registration_number(session, desc, reg_number, reg_type, account_id, status, staff, create):
     """Assert that a fetch financing statement by registration number works as expected."""
@@ -14,12 +14,15 @@
 """Test Suite to ensure the datetime utility functions are working as expected."""
 import copy
 import json
+from http import HTTPStatus
 
 from flask import current_app
+from sqlalchemy.orm import Session
 
 import pytest
 
-from ppr_api.models import utils as model_utils, Registration, SearchRequest, search_historical, SearchResult
+from ppr_api.exceptions import BusinessException
+from ppr_api.models import utils as model_utils, db, Party, Registration, SearchRequest, search_historical, SearchResult
 
 
 SERIAL_NUMBER_JSON = {
@@ -105,6 +108,65 @@ TEST_DATA_SEARCH_BUS_DEBTOR_QUERY = [
 TEST_DATA_SEARCH_IND_DEBTOR_QUERY = [
     ('Test search historical individual debtor query', 1821760, INDIVIDUAL_DEBTOR_JSON)
 ]
+# testdata pattern is ({desc}, {registration_id}, {registration_id_end}, {search_reg_id}, {expected})
+TEST_DATA_SNAPSHOT_RECORD = [
+    ('Added before no end', 100, None, 200, True),
+    ('Added at search id', 200, None, 200, True),
+    ('Added after', 201, None, 200, False),
+    ('Ended after', 100, 201, 200, True),
+    ('Ended at search id', 100, 200, 200, False),
+    ('Ended before', 100, 150, 200, False)
+]
+# testdata pattern is ({desc}, {reg_num}, {search_reg_id})
+TEST_DATA_SNAPSHOT = [
+    ('Base registration snapshot', 'TEST0001', 200000000),
+    ('Current snapshot', 'TEST0001', 299999999)
+]
+
+
+@pytest.mark.parametrize('desc,reg_id,reg_id_end,search_reg_id,expected', TEST_DATA_SNAPSHOT_RECORD)
+def test_is_snapshot_record(desc, reg_id, reg_id_end, search_reg_id, expected):
+    """Assert that the record in effect as of the search registration id check works as expected."""
+    party = Party(registration_id=reg_id, registration_id_end=reg_id_end)
+    assert search_historical.is_snapshot_record(party, search_reg_id) == expected
+
+
+@pytest.mark.parametrize('desc,reg_num,search_reg_id', TEST_DATA_SNAPSHOT)
+def test_get_snapshot_statements(session, desc, reg_num, search_reg_id):
+    """Assert that loading the financing statements as of a registration id works as expected."""
+    with Session(bind=db.session.connection()) as snapshot_session:
+        statements = search_historical.get_snapshot_statements([reg_num, reg_num], search_reg_id, snapshot_session)
+        assert len(statements) == 1
+        financing = statements.get(reg_num)
+        assert financing
+        assert financing not in db.session
+        assert financing.registration
+        for registration in financing.registration:
+            assert registration.id <= search_reg_id
+        for party in financing.parties:
+            assert search_historical.is_snapshot_record(party, search_reg_id)
+        for collateral in financing.vehicle_collateral:
+            assert search_historical.is_snapshot_record(collateral, search_reg_id)
+        for collateral in financing.general_collateral:
+            assert collateral.registration_id <= search_reg_id
+        statement_json = search_historical.get_historical_json(financing, search_reg_id,
+                                                               financing.registration[0].registration_ts)
+        assert statement_json['baseRegistrationNumber'] == reg_num
+        assert statement_json['statusType'] == model_utils.STATE_ACTIVE
+        assert statement_json.get('registeringParty')
+        assert statement_json.get('debtors')
+        if search_reg_id == financing.registration[0].id:
+            assert not statement_json.get('changes')
+            for debtor in statement_json.get('debtors'):
+                assert not debtor.get('added')
+
+
+def test_get_snapshot_statements_not_found(session):
+    """Assert that loading the financing statements as of a registration id with a non-existent number fails."""
+    with pytest.raises(BusinessException) as not_found_err:
+        search_historical.get_snapshot_statements(['TEST0001', 'XXXXXXX'], 299999999)
+    assert not_found_err
+    assert not_found_err.value.status_code == HTTPStatus.NOT_FOUND
 
 
 @pytest.mark.parametrize('desc,search_ts', TEST_DATA_HISTORICAL_ID)
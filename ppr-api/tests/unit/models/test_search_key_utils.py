@@ -0,0 +1,189 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the debtor search key functions.
+
+Test-Suite to ensure that the python debtor search key functions return the same values as the database functions.
+"""
+import pytest
+from flask import current_app
+from sqlalchemy.sql import text
+
+from ppr_api.models import Party, db
+from ppr_api.models import search_key_utils
+
+
+BUSINESS_QUERY = """
+SELECT searchkey_business_name(:actual_name), business_name_strip_designation(:actual_name)
+"""
+INDIVIDUAL_QUERY = """
+SELECT searchkey_individual(:last_name, :first_name), searchkey_last_name(:last_name),
+       individual_split_1(:first_name), individual_split_2(:first_name),
+       individual_split_1(:last_name), individual_split_2(:last_name), individual_split_3(:last_name)
+"""
+COMMON_WORD_INSERT = "INSERT INTO common_word(id, word) VALUES (nextval('word_id_seq'), :word)"
+# testdata pattern is ({business_name})
+TEST_BUSINESS_PARITY_DATA = [
+    None,
+    '',
+    'INC',
+    'business\'s, holdings inc',
+    'TEST BUS 2 DEBTOR',
+    'THE ABC COMPANY LTD.',
+    'The Prince George Co (1990) Ltd.',
+    '0001234567 B.C. LTD.',
+    '123456 BC LTD',
+    '1234 BC LTD',
+    'A B C D COMPANY',
+    'B C L TRUCKING',
+    'A B CONSULTING SERVICES',
+    'Johnson & Johnson S',
+    'SMITH AND SONS DBA SMITH TRUCKING',
+    'BRITISH COLUMBIA HYDRO AND POWER AUTHORITY',
+    'WEST COAST LIMITED PARTNERSHIP',
+    'ACME SOCIETY (VANCOUVER BRANCH)',
+    'Société Générale Canada Ltée',
+    'Straße GmbH',
+    'NON PERSONAL LIABILITY MINES NPL',
+    'PRO-TECH  MECHANICAL   CONTRACTORS ULC',
+    'ACME WEST COAST SERVICES AND SUPPLY CORP.',
+]
+# testdata pattern is ({last_name}, {first_name})
+TEST_INDIVIDUAL_PARITY_DATA = [
+    (None, None),
+    ('SMITH', None),
+    (None, 'JOHN'),
+    ('', ''),
+    ('PONCE DE LEON JUNIOR', 'JEAN PAUL'),
+    ('Mississippi', 'Anna'),
+    ('o\'brien-smith', 'mary  ann'),
+    ('DE LA ROSA', 'DR JOSE MARIA'),
+    ('MR', 'III'),
+    ('  VAN   DER  BERG ', ' JAN '),
+    ('Müller', 'Jürgen'),
+    ('LEE_WONG', 'LI'),
+    ('ABBOTT-COSTELLO III', 'BUDD JR.'),
+]
+# testdata pattern is ({last_name}, {first_name}, {first_key}, {last_key}, {first_split1}, {first_split2},
+#                      {last_split1}, {last_split2}, {last_split3})
+TEST_INDIVIDUAL_DATA = [
+    ('PONCE DE LEON JUNIOR', 'JEAN PAUL', 'PONCE LEON JUNIOR JEAN PAUL', 'PONCE LEON JUNIOR', 'JEAN', 'PAUL',
+     'PONCE', 'LEON', 'JUNIOR'),
+    ('Mississippi', 'Anna', 'MISISIPI ANA', 'MISISIPI', 'ANNA', '', 'MISSISSIPPI', '', ''),
+    ('o\'brien-smith', 'DR JOHN', 'O BRIEN SMITH JOHN', 'O BRIEN SMITH', 'JOHN', '', 'O', 'BRIEN', 'SMITH'),
+    ('SMITH', None, None, 'SMITH', None, None, 'SMITH', '', '')
+]
+# testdata pattern is ({business_name}, {search_key}, {bus_name_base}, {common_words})
+TEST_BUSINESS_DATA = [
+    ('business\'s, holdings inc', 'BUSINESSSHOLDINGS', 'businesssholdings', None),
+    ('0001234567 B.C. LTD.', '1234567', '0001234567BC', None),
+    ('A B C D COMPANY', 'ABCD', 'ABCDCOMPANY', None),
+    ('Johnson & Johnson S', 'JOHNSONJOHNSON', 'JohnsonJohnsonS', None),
+    ('INC', '', '', None),
+    ('ACME WEST COAST SERVICES', 'ACMEWESTCOAST', 'ACMEWESTCOASTSERVICES', {'SERVICES'}),
+    ('ACME WEST COAST SERVICES', 'ACMEWESTCOASTSERVICES', 'ACMEWESTCOASTSERVICES', {'WEST'})
+]
+
+
+@pytest.mark.parametrize('last_name,first_name,first_key,last_key,first1,first2,last1,last2,last3',
+                         TEST_INDIVIDUAL_DATA)
+def test_individual_keys(last_name, first_name, first_key, last_key, first1, first2, last1, last2, last3):
+    """Assert that the python individual search key values are as expected."""
+    assert search_key_utils.searchkey_individual(last_name, first_name) == first_key
+    assert search_key_utils.searchkey_last_name(last_name) == last_key
+    assert search_key_utils.individual_split_1(first_name) == first1
+    assert search_key_utils.individual_split_2(first_name) == first2
+    assert search_key_utils.individual_split_1(last_name) == last1
+    assert search_key_utils.individual_split_2(last_name) == last2
+    assert search_key_utils.individual_split_3(last_name) == last3
+
+
+@pytest.mark.parametrize('business_name,search_key,bus_name_base,common_words', TEST_BUSINESS_DATA)
+def test_business_keys(business_name, search_key, bus_name_base, common_words):
+    """Assert that the python business search key values are as expected."""
+    assert search_key_utils.searchkey_business_name(business_name, common_words) == search_key
+    assert search_key_utils.business_name_strip_designation(business_name) == bus_name_base
+
+
+@pytest.mark.parametrize('business_name', TEST_BUSINESS_PARITY_DATA)
+def test_business_parity(session, business_name):
+    """Assert that the python business search key values are the same as the database function values."""
+    common_words = search_key_utils.get_common_words(db.session, [business_name])
+    row = db.session.execute(text(BUSINESS_QUERY), {'actual_name': business_name}).first()
+    assert search_key_utils.searchkey_business_name(business_name, common_words) == row[0]
+    assert search_key_utils.business_name_strip_designation(business_name) == row[1]
+
+
+def test_business_parity_common_word(session):
+    """Assert that the python business search key common word removal is the same as the database function."""
+    business_name = 'ACME WEST COAST SERVICES AND SUPPLY CORP.'
+    for word in ('SERVICES', 'SUPPLY'):
+        db.session.execute(text(COMMON_WORD_INSERT), {'word': word})
+    common_words = search_key_utils.get_common_words(db.session, [business_name])
+    assert common_words == {'SERVICES', 'SUPPLY'}
+    row = db.session.execute(text(BUSINESS_QUERY), {'actual_name': business_name}).first()
+    assert search_key_utils.searchkey_business_name(business_name, common_words) == row[0]
+
+
+@pytest.mark.parametrize('last_name,first_name', TEST_INDIVIDUAL_PARITY_DATA)
+def test_individual_parity(session, last_name, first_name):
+    """Assert that the python individual search key values are the same as the database function values."""
+    row = db.session.execute(text(INDIVIDUAL_QUERY), {'last_name': last_name, 'first_name': first_name}).first()
+    assert search_key_utils.searchkey_individual(last_name, first_name) == row[0]
+    assert search_key_utils.searchkey_last_name(last_name) == row[1]
+    assert search_key_utils.individual_split_1(first_name) == row[2]
+    assert search_key_utils.individual_split_2(first_name) == row[3]
+    assert search_key_utils.individual_split_1(last_name) == row[4]
+    assert search_key_utils.individual_split_2(last_name) == row[5]
+    assert search_key_utils.individual_split_3(last_name) == row[6]
+
+
+def test_batch_strict_parity(session):
+    """Assert that the in memory batch search keys are the same as the strict database function batch keys."""
+    memory_parties = batch_parties()
+    strict_parties = batch_parties()
+    search_key_utils.set_debtor_search_keys(db.session, memory_parties)
+    current_app.config.update(DEBTOR_SEARCH_KEY_STRICT=True)
+    try:
+        search_key_utils.set_debtor_search_keys(db.session, strict_parties)
+    finally:
+        current_app.config.update(DEBTOR_SEARCH_KEY_STRICT=False)
+    for memory, strict in zip(memory_parties, strict_parties):
+        assert memory.business_search_key == strict.business_search_key
+        assert memory.bus_name_base == strict.bus_name_base
+        assert memory.bus_name_key_char1 == strict.bus_name_key_char1
+        assert memory.first_name_key == strict.first_name_key
+        assert memory.last_name_key == strict.last_name_key
+        assert memory.first_name_split1 == strict.first_name_split1
+        assert memory.first_name_split2 == strict.first_name_split2
+        assert memory.last_name_split1 == strict.last_name_split1
+        assert memory.last_name_split2 == strict.last_name_split2
+        assert memory.last_name_split3 == strict.last_name_split3
+        assert memory.first_name_key_char1 == strict.first_name_key_char1
+    assert strict_parties[0].business_search_key
+    assert strict_parties[-1].first_name_key
+    assert strict_parties[2].business_search_key is None
+
+
+def batch_parties() -> list:
+    """Create a batch of new parties with every party type."""
+    parties = []
+    for business_name in TEST_BUSINESS_PARITY_DATA[2:]:
+        parties.append(Party(party_type=Party.PartyTypes.DEBTOR_COMPANY.value, business_name=business_name))
+    parties.insert(2, Party(party_type=Party.PartyTypes.SECURED_PARTY.value, business_name='SECURED PARTY'))
+    for last_name, first_name in TEST_INDIVIDUAL_PARITY_DATA[4:]:
+        parties.append(Party(party_type=Party.PartyTypes.DEBTOR_INDIVIDUAL.value,
+                             last_name=last_name,
+                             first_name=first_name))
+    return parties
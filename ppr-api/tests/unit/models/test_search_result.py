@@ -18,14 +18,24 @@ Test-Suite to ensure that the Search Detail Model (search step 2 select search
 results) is working as expected.
 """
 from http import HTTPStatus
+import json
 
 from flask import current_app
 import pytest
 
 from ppr_api.models import SearchResult, SearchRequest
+from ppr_api.models import search_result as search_result_module
 from ppr_api.exceptions import BusinessException
 
 
+# testdata pattern is ({description}, {compress})
+TEST_DATA_COMPRESS = [
+    ('Uncompressed', False),
+    ('Compressed', True)
+]
+# Number of matches for the large search selection test.
+TEST_LARGE_SIZE = 20000
+
 # Valid test data
 SINGLE_JSON = [{
     'baseRegistrationNumber': 'TEST0001',
@@ -530,3 +540,69 @@ def test_search_sort(session, client, jwt, desc, select_data, select_count, orig
         assert selection[1]['vehicleCollateral']['model'] == 'Sort 2'
         assert selection[2]['vehicleCollateral']['model'] == 'Sort 3'
         assert selection[3]['vehicleCollateral']['model'] == 'Sort 4'
+
+
+def test_search_selection_large(app):
+    """Assert that the search selection and details are in the expected order without duplicates for many matches."""
+    original = []
+    details = []
+    for index in range(TEST_LARGE_SIZE):
+        reg_num = str(100000 + index) + 'B'
+        original.append({
+            'baseRegistrationNumber': reg_num,
+            'matchType': 'EXACT' if index % 2 == 0 else 'SIMILAR',
+            'createDateTime': '2021-10-08T00:02:33+00:00',
+            'registrationType': 'SA'
+        })
+        details.append({'matchType': original[index]['matchType'],
+                        'financingStatement': {'baseRegistrationNumber': reg_num}})
+    exact = [match for match in original if match['matchType'] == 'EXACT']
+    # Select every second similar match in reverse order, with some selected twice.
+    selected = [match for match in original if match['matchType'] != 'EXACT'][::-2]
+    select_data = [{'baseRegistrationNumber': match['baseRegistrationNumber'], 'matchType': match['matchType']}
+                   for match in selected + selected[:100]]
+    search_result: SearchResult = SearchResult(search_response=details + details[:100])
+    search_result.search = SearchRequest(search_response=original,
+                                         search_type=SearchRequest.SearchTypes.REGISTRATION_NUM.value)
+    # test
+    search_result.search_select = search_result.set_search_selection(select_data)
+    results = search_result.build_details()
+    # verify
+    assert search_result.search_select == exact + selected
+    details_by_reg_num = {detail['financingStatement']['baseRegistrationNumber']: detail for detail in details}
+    assert len(results) == len(exact) + len(selected)
+    for result, select in zip(results, exact + selected):
+        assert result is details_by_reg_num[select['baseRegistrationNumber']]
+    assert search_result.similar_match_count == len(selected)
+
+
+@pytest.mark.parametrize('desc,compress', TEST_DATA_COMPRESS)
+def test_search_response_compress(app, monkeypatch, desc, compress):
+    """Assert that search result details are stored as configured and read back unchanged."""
+    details = [{'matchType': 'EXACT', 'financingStatement': {'baseRegistrationNumber': f'TEST{i:04d}'}}
+               for i in range(100)]
+    response = {'searchDateTime': '2024-01-01T00:00:00+00:00', 'totalResultsSize': 100, 'details': details}
+    results_length = len(json.dumps(details))
+    compress_config = current_app.config.get('SEARCH_RESULTS_COMPRESS')
+    current_app.config['SEARCH_RESULTS_COMPRESS'] = compress
+    try:
+        search_result: SearchResult = SearchResult(search_response=response)
+    finally:
+        current_app.config['SEARCH_RESULTS_COMPRESS'] = compress_config
+    assert search_result.search_response == response
+    if compress:
+        assert search_result.search_response_json is None
+        assert search_result.search_response_gz
+        assert len(search_result.search_response_gz) < search_result.search_response_size
+        # The details size is recorded when written: the details are not serialized again to measure them.
+        monkeypatch.setattr(search_result_module, 'json', None)
+        assert search_result.get_results_length(details) == results_length
+        monkeypatch.undo()
+        # Lazy decode from the stored bytes as when loaded from the database.
+        search_result._search_response = None
+        assert search_result.search_response == response
+    else:
+        assert search_result.search_response_json == response
+        assert search_result.search_response_gz is None
+        assert search_result.search_response_size is None
+        assert search_result.get_results_length(details) == results_length
@@ -0,0 +1,98 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the Serial Search index Model.
+
+Test-Suite to ensure that the Serial Search index Model is working as expected.
+"""
+import copy
+
+import pytest
+from flask import current_app
+from sqlalchemy.sql import text
+
+from ppr_api.models import SearchRequest, SerialSearch, VehicleCollateral, db
+
+
+# testdata pattern is ({search type}, {serial type}, {search value})
+TEST_PARITY_DATA = [
+    ('SERIAL_NUMBER', 'SS', 'ju622994'),
+    ('MHR_NUMBER', 'MH', '220000'),
+    ('AIRCRAFT_DOT', 'AC', 'CFYXW'),
+    ('SERIAL_NUMBER', 'SS', 'ZZZZZ999999'),
+    ('SERIAL_NUMBER', 'SS', 'XXXXX999999')
+]
+SEARCH_JSON = {
+    'type': 'SERIAL_NUMBER',
+    'criteria': {
+        'value': 'ju622994'
+    },
+    'clientReferenceId': 'T-SQ-SI-1'
+}
+TEST_FINANCING_IDS = "SELECT DISTINCT financing_id FROM serial_collateral WHERE financing_id >= 200000000"
+
+
+def test_refresh(session):
+    """Assert that refreshing the index for a financing statement creates the expected records."""
+    count = SerialSearch.refresh(200000000)
+    collateral = VehicleCollateral.find_by_financing_id(200000000)
+    current = [vehicle for vehicle in collateral if not vehicle.registration_id_end]
+    assert count == len(current)
+    records = SerialSearch.find_by_financing_id(200000000)
+    assert len(records) == count
+    for record in records:
+        vehicle = VehicleCollateral.find_by_id(record.id)
+        assert vehicle
+        assert record.financing_id == 200000000
+        assert record.registration_num == 'TEST0001'
+        assert record.registration_type == 'SA'
+        assert record.registration_ts
+        assert record.state_type == 'ACT'
+        assert record.expire_date
+        assert not record.discharge_ts
+        assert record.vehicle_type == vehicle.vehicle_type
+        assert record.serial_number == vehicle.serial_number
+        assert record.search_vin == vehicle.search_vin
+        assert record.mhr_number == vehicle.mhr_number
+    # Refresh replaces existing records.
+    assert SerialSearch.refresh(200000000) == count
+    assert len(SerialSearch.find_by_financing_id(200000000)) == count
+
+
+def test_refresh_none(session):
+    """Assert that refreshing the index with no financing statement does nothing."""
+    assert SerialSearch.refresh(None) == 0
+    assert not SerialSearch.find_by_financing_id(None)
+
+
+@pytest.mark.parametrize('search_type,serial_type,search_value', TEST_PARITY_DATA)
+def test_search_parity(session, search_type, serial_type, search_value):
+    """Assert that index table searches return the same results as the source table searches."""
+    rows = db.session.execute(text(TEST_FINANCING_IDS)).fetchall()
+    for row in rows:
+        SerialSearch.refresh(int(row[0]))
+    json_data = copy.deepcopy(SEARCH_JSON)
+    json_data['type'] = search_type
+    json_data['criteria']['value'] = search_value
+    query = SearchRequest.create_from_json(json_data, 'PS12345', 'UNIT_TEST')
+    assert query.search_type == serial_type
+    query.search_by_serial_type()
+    expected = query.search_response
+    current_app.config.update(SEARCH_SERIAL_INDEX=True)
+    try:
+        query.search_response = None
+        query.search_by_serial_type()
+        assert query.search_response == expected
+    finally:
+        current_app.config.update(SEARCH_SERIAL_INDEX=False)
@@ -0,0 +1,64 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the Test Search Batch Model.
+
+Test-Suite to ensure that the Test Search Batch performance mode calculations are working as expected.
+"""
+import pytest
+
+from ppr_api.models.test_search import TestSearch
+from ppr_api.models.test_search_batch import TestSearchBatch, percentile
+
+
+# testdata pattern is ({values}, {percentile}, {expected})
+TEST_PERCENTILE_DATA = [
+    ([], 50, None),
+    ([0.5], 99, 0.5),
+    ([0.4, 0.1, 0.3, 0.2], 50, 0.2),
+    ([0.4, 0.1, 0.3, 0.2], 95, 0.4),
+    ([float(x) for x in range(1, 101)], 95, 95.0),
+    ([float(x) for x in range(1, 101)], 99, 99.0)
+]
+# testdata pattern is ({description}, {baseline p95}, {threshold}, {expected regression})
+TEST_REGRESSION_DATA = [
+    ('No baseline', None, 0.2, False),
+    ('Faster', 0.5, 0.2, False),
+    ('Within threshold', 0.35, 0.2, False),
+    ('Regression', 0.3, 0.2, True)
+]
+
+
+@pytest.mark.parametrize('values,pct,expected', TEST_PERCENTILE_DATA)
+def test_percentile(values, pct, expected):
+    """Assert that the nearest rank percentile is calculated as expected."""
+    assert percentile(values, pct) == expected
+
+
+@pytest.mark.parametrize('desc,baseline_p95,threshold,expected', TEST_REGRESSION_DATA)
+def test_check_regression(desc, baseline_p95, threshold, expected):
+    """Assert that the batch percentiles and regression flag are set as expected."""
+    batch = TestSearchBatch(test_mode=TestSearchBatch.TestModes.PERFORMANCE.value)
+    batch.searches = [TestSearch(run_time=run_time) for run_time in (0.1, 0.2, 0.3, 0.4)]
+    batch.set_run_time_percentiles()
+    assert batch.run_time_p50 == 0.2
+    assert batch.run_time_p95 == 0.4
+    assert batch.run_time_p99 == 0.4
+    baseline = None
+    if baseline_p95 is not None:
+        baseline = TestSearchBatch(id=1, run_time_p95=baseline_p95)
+    assert batch.check_regression(baseline, threshold) == expected
+    assert batch.regression == expected
+    if baseline:
+        assert batch.baseline_id == 1
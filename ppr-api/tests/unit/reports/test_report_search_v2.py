@@ -21,6 +21,8 @@ import json
 
 from flask import current_app
 
+from ppr_api.reports.v2 import report as report_module
+from ppr_api.reports.v2 import report_utils
 from ppr_api.reports.v2.report import Report
 from ppr_api.reports.v2.report_utils import ReportTypes, merge_pdfs
 
@@ -275,6 +277,54 @@ def test_search_cover(session, client, jwt):
         check_response(content, status, SEARCH_COVER_PDFFILE)
 
 
+def test_search_subreports(session, client, jwt, monkeypatch):
+    """Assert that splitting a large search report into sub-reports is as expected."""
+    # setup
+    monkeypatch.setattr(report_module, 'SUBREPORT_SIZE', 20)
+    json_data = get_json_from_file(SEARCH_RESULT_75_DATAFILE)
+    report = Report(json_data, 'PS12345', ReportTypes.SEARCH_DETAIL_REPORT, 'Account Name')
+    # test
+    subreports = report._get_subreports(json_data)
+    # verify
+    assert len(subreports) == 4
+    detail_count = 0
+    for index, subreport in enumerate(subreports, start=1):
+        sub_data = subreport._report_data
+        assert subreport.large_container
+        assert sub_data['subreport'] == f'{index} of 4'
+        assert sub_data['pageNumOffset'] == 0
+        assert sub_data['searchDateTime'] == json_data['searchDateTime']
+        assert len(sub_data['details']) == (20 if index < 4 else len(json_data['details']) - 60)
+        detail_count += len(sub_data['details'])
+        reg_nums = [detail['financingStatement']['baseRegistrationNumber'] for detail in sub_data['details']]
+        for select in sub_data['selected']:
+            assert select['baseRegistrationNumber'] in reg_nums
+    assert detail_count == len(json_data['details'])
+
+
+def test_send_concurrent(session, client, jwt):
+    """Assert that concurrent report requests return the responses in the request order."""
+    # test
+    responses = Report._send_concurrent([lambda index=index: index for index in range(10)])
+    # verify
+    assert responses == list(range(10))
+
+
+def test_template_cache(session, client, jwt):
+    """Assert that search report templates are expanded and compiled once and then served from the template cache."""
+    # setup
+    report_utils.TemplateCache.clear()
+    json_data = get_json_from_file(SEARCH_RESULT_RG_DATAFILE)
+    report = Report(json_data, 'PS12345', ReportTypes.SEARCH_DETAIL_REPORT, 'Account Name')
+    # test
+    template = report._get_template()
+    # verify
+    assert template
+    assert template.find('[[') == -1
+    assert report._get_template() is template
+    assert report_utils.TemplateCache.get_compiled_template(template) is report_utils.TemplateCache.COMPILED[template]
+
+
 def get_json_from_file(data_file: str):
     """Get json data from report data file."""
     text_data = None
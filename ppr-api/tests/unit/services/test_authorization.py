@@ -16,6 +16,8 @@
 
 Test-Suite to ensure that the client for the auth-api service is working as expected.
 """
+from http import HTTPStatus
+
 import pytest
 from flask import current_app
 
@@ -99,3 +101,60 @@ def test_staff_account(session, desc, account_id, valid):
     result = authz.is_staff_account(account_id)
     # check
     assert result == valid
+
+
+def test_auth_cache(session):
+    """Assert that the auth cache expires, evicts the least recently used entry, and counts hits and misses."""
+    cache = authz.AuthCache(max_size=2)
+    cache.put('a', {'orgs': []}, 60)
+    cache.put('b', {'orgs': []}, 60)
+    assert cache.get('a') == {'orgs': []}
+    cache.put('c', {'orgs': []}, 60)
+    assert cache.get('b') is None
+    assert cache.get('c')
+    cache.put('d', {'orgs': []}, -1)
+    assert cache.get('d') is None
+    assert cache.stats() == {'size': 1, 'hits': 2, 'misses': 2}
+    cache.clear()
+    assert cache.stats() == {'size': 0, 'hits': 0, 'misses': 0}
+
+
+def test_get_auth_json_cache(session, monkeypatch):
+    """Assert that auth api responses are cached by token and url, and only successful responses are cached."""
+    calls = []
+
+    class MockResponse:
+        def __init__(self, status_code):
+            self.status_code = status_code
+
+        def json(self):
+            return {'orgs': [], 'status': self.status_code}
+
+    class MockSession:
+        def __init__(self, retries=3):
+            self.retries = retries
+
+        def get(self, url, headers):
+            calls.append(url)
+            return MockResponse(HTTPStatus.UNAUTHORIZED if url.endswith('bad') else HTTPStatus.OK)
+
+    monkeypatch.setattr(authz, 'get_session', MockSession)
+    cache_ttl = current_app.config.get('AUTH_CACHE_TTL')
+    current_app.config.update(AUTH_CACHE_TTL=60)
+    authz.auth_cache.clear()
+    try:
+        assert authz.get_auth_json(MOCK_URL + '/users/orgs', 'token1')['status'] == HTTPStatus.OK
+        assert authz.get_auth_json(MOCK_URL + '/users/orgs', 'token1')['status'] == HTTPStatus.OK
+        assert len(calls) == 1
+        authz.get_auth_json(MOCK_URL + '/users/orgs', 'token2')
+        assert len(calls) == 2
+        assert authz.get_auth_json(MOCK_URL + '/bad', 'token1') is None
+        assert authz.get_auth_json(MOCK_URL + '/bad', 'token1') is None
+        assert len(calls) == 4
+        assert authz.auth_cache.stats()['hits'] == 1
+        current_app.config.update(AUTH_CACHE_TTL=0)
+        authz.get_auth_json(MOCK_URL + '/users/orgs', 'token1')
+        assert len(calls) == 5
+    finally:
+        current_app.config.update(AUTH_CACHE_TTL=cache_ttl)
+        authz.auth_cache.clear()